@@ -0,0 +1,56 @@
+"""
+Время построения клавиатуры календаря на один рендер: сборка разметки заново
+против готовой разметки из кеша (типичный сценарий - пользователи листают одни и те же месяцы).
+
+    python -m benchmarks.calendar_render
+"""
+import time
+import statistics
+from datetime import datetime
+
+from src.drift_bot.bot.calendar_kb import CalendarKeyboard, CalendarCallback, build_calendar_markup
+
+RENDERS = 10_000
+ROUNDS = 5
+MONTHS = [(2025, month) for month in range(1, 13)]
+MARKED_DATES = [datetime(2025, month, day) for month in range(1, 13) for day in (6, 20)]
+
+
+class BenchmarkCalendarCallback(CalendarCallback, prefix="benchmark_calendar"):
+    championship_id: int
+
+
+def make_keyboard(i: int) -> CalendarKeyboard:
+    year, month = MONTHS[i % len(MONTHS)]
+    return CalendarKeyboard(
+        year=year,
+        month=month,
+        marked_dates=MARKED_DATES,
+        mark_label="🏁",
+        callback=BenchmarkCalendarCallback,
+        championship_id=1
+    )
+
+
+def timed(render) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for i in range(RENDERS):
+            render(make_keyboard(i))
+        samples.append((time.perf_counter() - start) / RENDERS)
+    return statistics.median(samples) * 1_000_000
+
+
+def main() -> None:
+    build_calendar_markup.cache_clear()
+    uncached_us = timed(CalendarKeyboard.build)
+    cached_us = timed(CalendarKeyboard.__call__)
+    print(f"{'mode':>10} {'us / render':>12}")
+    print(f"{'build':>10} {uncached_us:>12.1f}")
+    print(f"{'cached':>10} {cached_us:>12.1f}")
+    print(build_calendar_markup.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Замер задержек CRUDService.create / read / delete для 1/2/5/10 файлов.
+
+Использует локальный MinIO из docker-compose.yml (`docker compose up -d minio`):
+
+    python -m benchmarks.file_fanout
+
+Сравнивает последовательное выполнение (max_concurrency=1, поведение до
+распараллеливания) с конкурентным (MAX_CONCURRENT_FILE_OPERATIONS).
+"""
+from typing import Optional
+
+import os
+import time
+import asyncio
+import statistics
+
+from pydantic import BaseModel, Field
+
+from src.drift_bot.core.base import CRUDRepository
+from src.drift_bot.core.domain import File, FileMetadata
+from src.drift_bot.core.services import CRUDService
+from src.drift_bot.constants import MAX_CONCURRENT_FILE_OPERATIONS
+from src.drift_bot.infrastructure.s3 import S3Client
+
+BUCKET = "benchmark"
+FILE_COUNTS = (1, 2, 5, 10)
+FILE_SIZE = 512 * 1024  # 512 КБ, типичное фото
+ROUNDS = 5
+
+
+class Item(BaseModel):
+    id: Optional[int] = None
+    files: list[FileMetadata] = Field(default_factory=list)
+
+
+class InMemoryRepository(CRUDRepository[Item]):
+    """Репозиторий без БД, чтобы замерять только работу с хранилищем."""
+    def __init__(self) -> None:
+        self._items: dict[int, Item] = {}
+
+    async def create(self, model: Item) -> Item:
+        model.id = len(self._items) + 1
+        self._items[model.id] = model
+        return model
+
+    async def read(self, id: int) -> Optional[Item]:
+        return self._items.get(id)
+
+    async def delete(self, id: int) -> bool:
+        return self._items.pop(id, None) is not None
+
+
+async def measure(service: CRUDService[Item], files_count: int) -> tuple[float, float, float]:
+    files = [File(data=os.urandom(FILE_SIZE), file_name=f"{i}.jpg") for i in range(files_count)]
+    start = time.perf_counter()
+    item = await service.create(Item(), files, bucket=BUCKET)
+    created = time.perf_counter()
+    await service.read(item.id)
+    read = time.perf_counter()
+    await service.delete(item.id)
+    deleted = time.perf_counter()
+    return created - start, read - created, deleted - read
+
+
+async def main() -> None:
+    s3_client = S3Client(
+        endpoint_url=os.getenv("S3_URL", "http://localhost:9990"),
+        access_key=os.getenv("S3_USER", "miniouser"),
+        secret_key=os.getenv("S3_PASSWORD", "miniopassword")
+    )
+    await s3_client.start()
+    try:
+        try:
+            await s3_client.create_bucket(BUCKET)
+        except RuntimeError:
+            pass  # Бакет уже существует
+        print(f"{'files':>5} {'mode':>10} {'create, ms':>11} {'read, ms':>9} {'delete, ms':>11}")
+        for files_count in FILE_COUNTS:
+            for mode, concurrency in (("serial", 1), ("concurrent", MAX_CONCURRENT_FILE_OPERATIONS)):
+                service = CRUDService[Item](InMemoryRepository(), s3_client, max_concurrency=concurrency)
+                samples = [await measure(service, files_count) for _ in range(ROUNDS)]
+                create, read, delete = (
+                    statistics.median(sample[i] for sample in samples) * 1000 for i in range(3)
+                )
+                print(f"{files_count:>5} {mode:>10} {create:>11.1f} {read:>9.1f} {delete:>11.1f}")
+    finally:
+        await s3_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+"""
+Нагрузочный стенд для webhook режима: отправляет синтетические апдейты и
+замеряет пропускную способность, задержку ответа и количество отказов (503).
+
+По умолчанию поднимает приложение в процессе с обработчиком-заглушкой,
+который имитирует работу хендлера задержкой HANDLER_DELAY:
+
+    python -m benchmarks.webhook_load --updates 5000 --concurrency 200 --workers 16
+
+Либо бьёт по запущенному боту (BOT_MODE=webhook):
+
+    python -m benchmarks.webhook_load --url http://localhost:8080/webhook --secret <WEBHOOK_SECRET>
+"""
+from typing import Any, Optional
+
+import time
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+from aiogram import Bot, Dispatcher, Router
+from aiogram.types import Message
+
+from src.drift_bot.bot.webhook import UpdateQueue, create_webhook_app, SECRET_TOKEN_HEADER
+from src.drift_bot.metrics import metrics
+
+HANDLER_DELAY = 0.05  # Секунд, имитация обращения к БД / Telegram
+PATH = "/webhook"
+
+
+def make_update(update_id: int) -> dict[str, Any]:
+    chat_id = 10_000 + update_id % 500
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "Load"},
+            "text": "/championships"
+        }
+    }
+
+
+def create_stub_dispatcher() -> Dispatcher:
+    router = Router()
+
+    @router.message()
+    async def handle(_: Message) -> None:
+        await asyncio.sleep(HANDLER_DELAY)
+
+    dispatcher = Dispatcher()
+    dispatcher.include_router(router)
+    return dispatcher
+
+
+async def replay(client: httpx.AsyncClient, url: str, updates: int, concurrency: int, secret: Optional[str]) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    headers = {SECRET_TOKEN_HEADER: secret} if secret else {}
+
+    async def send(update_id: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(url, json=make_update(update_id), headers=headers)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(update_id) for update_id in range(1, updates + 1)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"updates:     {updates}")
+    print(f"elapsed:     {elapsed:.2f} s ({updates / elapsed:.0f} updates/s accepted)")
+    print(f"latency p50: {statistics.median(latencies) * 1000:.1f} ms")
+    print(f"latency p95: {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms")
+    print(f"statuses:    {statuses}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--queue-size", type=int, default=1000)
+    parser.add_argument("--url", type=str, default=None)
+    parser.add_argument("--secret", type=str, default=None)
+    args = parser.parse_args()
+
+    if args.url:
+        async with httpx.AsyncClient(timeout=30) as client:
+            await replay(client, args.url, args.updates, args.concurrency, args.secret)
+        return
+
+    bot = Bot(token="123456:LOAD-TEST")
+    dispatcher = create_stub_dispatcher()
+    update_queue = UpdateQueue(bot, dispatcher, workers=args.workers, max_size=args.queue_size)
+    app = create_webhook_app(bot, dispatcher, update_queue, path=PATH)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bot", timeout=30) as client:
+            await replay(client, PATH, args.updates, args.concurrency, args.secret)
+        drain_start = time.perf_counter()
+    print(f"drain:       {time.perf_counter() - drain_start:.2f} s")
+    print(f"processing:  {metrics.latency('webhook.update.processing')}")
+    await bot.session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""
+Массовый импорт / экспорт данных сезона.
+
+    python bulk.py import stage stages.csv
+    python bulk.py import pilot pilots.jsonl
+    python bulk.py export 1 season.jsonl
+
+CSV: первая строка - заголовок с именами полей модели, вложенные поля (files, cars) - JSON.
+JSONL: один JSON объект на строку.
+"""
+from typing import Any
+from collections.abc import AsyncIterator
+
+import csv
+import sys
+import json
+import logging
+import asyncio
+import argparse
+from pathlib import Path
+
+from dishka import Scope
+
+from src.drift_bot.ioc import container
+from src.drift_bot.core.dto import BulkReport
+from src.drift_bot.core.enums import EntityKind
+from src.drift_bot.core.services import BulkService
+
+logger = logging.getLogger(__name__)
+
+
+def parse_csv_value(value: str) -> Any:
+    if value.startswith(("[", "{")):
+        return json.loads(value)
+    return value
+
+
+async def read_rows(path: Path) -> AsyncIterator[dict[str, Any]]:
+    """Построчно читает CSV или JSONL, не загружая файл в память целиком."""
+    with path.open(encoding="utf-8", newline="") as file:
+        if path.suffix == ".csv":
+            for row in csv.DictReader(file):
+                yield {key: parse_csv_value(value) for key, value in row.items() if value != ""}
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+async def log_progress(report: BulkReport) -> None:
+    logger.info(f"{report.kind}: processed {report.processed}, created {report.created}, errors {len(report.errors)}")
+
+
+async def import_file(kind: EntityKind, path: Path) -> BulkReport:
+    async with container(scope=Scope.REQUEST) as request_container:
+        bulk_service = await request_container.get(BulkService)
+        report = await bulk_service.import_rows(kind, read_rows(path), on_progress=log_progress)
+    for error in report.errors:
+        logger.warning(f"Line {error.line}: {error.message}")
+    return report
+
+
+async def export_season(championship_id: int, path: Path) -> int:
+    count = 0
+    async with container(scope=Scope.REQUEST) as request_container:
+        bulk_service = await request_container.get(BulkService)
+        with path.open("w", encoding="utf-8") as file:
+            async for record in bulk_service.export_season(championship_id):
+                file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                count += 1
+    logger.info(f"Exported {count} records to {path}")
+    return count
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk import / export")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import")
+    import_parser.add_argument("kind", type=str.upper, choices=list(EntityKind))
+    import_parser.add_argument("path", type=Path)
+    export_parser = commands.add_parser("export")
+    export_parser.add_argument("championship_id", type=int)
+    export_parser.add_argument("path", type=Path)
+    args = parser.parse_args()
+    try:
+        if args.command == "import":
+            report = await import_file(EntityKind(args.kind), args.path)
+            if report.errors:
+                sys.exit(1)
+        else:
+            await export_season(args.championship_id, args.path)
+    finally:
+        await container.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
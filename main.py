@@ -1,19 +1,72 @@
 import logging
 import asyncio
 
-from aiogram import Bot
+import uvicorn
 
-from src.drift_bot.ioc import container
+from aiogram import Bot, Dispatcher
+from aiogram.fsm.storage.base import BaseStorage, BaseEventIsolation
+
+from src.drift_bot.ioc import container, settings
 from src.drift_bot.bot import create_dispatcher
+from src.drift_bot.bot.webhook import UpdateQueue, create_webhook_app
+from src.drift_bot.core.base import FileStorage, LeaderboardNotifier
+from src.drift_bot.infrastructure.scheduler import JobWorker
+from src.drift_bot.metrics import metrics
 
 
-async def main() -> None:
-    bot = await container.get(Bot)
-    dp = create_dispatcher()
+async def run_polling(bot: Bot, dp: Dispatcher) -> None:
     await bot.delete_webhook(drop_pending_updates=True)
     await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
 
 
+async def run_webhook(bot: Bot, dp: Dispatcher) -> None:
+    webhook_settings = settings.webhook
+    await bot.set_webhook(
+        url=webhook_settings.webhook_url,
+        secret_token=webhook_settings.WEBHOOK_SECRET,
+        allowed_updates=dp.resolve_used_update_types(),
+        max_connections=webhook_settings.WEBHOOK_WORKERS
+    )
+    update_queue = UpdateQueue(
+        bot=bot,
+        dispatcher=dp,
+        workers=webhook_settings.WEBHOOK_WORKERS,
+        max_size=webhook_settings.WEBHOOK_QUEUE_SIZE
+    )
+    app = create_webhook_app(
+        bot=bot,
+        dispatcher=dp,
+        update_queue=update_queue,
+        path=webhook_settings.WEBHOOK_PATH,
+        secret_token=webhook_settings.WEBHOOK_SECRET,
+        enqueue_timeout=webhook_settings.WEBHOOK_ENQUEUE_TIMEOUT
+    )
+    config = uvicorn.Config(app, host=webhook_settings.WEBHOOK_HOST, port=webhook_settings.WEBHOOK_PORT)
+    await uvicorn.Server(config).serve()
+
+
+async def main() -> None:
+    bot = await container.get(Bot)
+    # Открываем пул соединений S3 на старте, а не при первом запросе
+    await container.get(FileStorage)
+    # Рассылка таблиц квалификации и отложенные рассылки работают в фоне всё время жизни бота
+    await container.get(LeaderboardNotifier)
+    await container.get(JobWorker)
+    dp = create_dispatcher(
+        storage=await container.get(BaseStorage),
+        events_isolation=await container.get(BaseEventIsolation)
+    )
+    try:
+        if settings.bot.BOT_MODE == "webhook":
+            await run_webhook(bot, dp)
+        else:
+            await run_polling(bot, dp)
+    finally:
+        logging.info(f"Metrics: {metrics.snapshot()}")
+        await bot.session.close()
+        await container.close()
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
@@ -0,0 +1,28 @@
+"""Add telegram file id
+
+Revision ID: 5b1e7c2d9a41
+Revises: d9a5afe0275c
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c2d9a41'
+down_revision: Union[str, None] = 'd9a5afe0275c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('file_metadata', sa.Column('telegram_file_id', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('file_metadata', 'telegram_file_id')
@@ -0,0 +1,28 @@
+"""Add championships keyset index
+
+Revision ID: 8c3f4a6e2b17
+Revises: 5b1e7c2d9a41
+Create Date: 2026-10-18 11:30:07.542816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3f4a6e2b17'
+down_revision: Union[str, None] = '5b1e7c2d9a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('championships_is_active_id_index', 'championships', ['is_active', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('championships_is_active_id_index', table_name='championships')
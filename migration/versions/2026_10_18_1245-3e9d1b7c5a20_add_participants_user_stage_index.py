@@ -0,0 +1,30 @@
+"""Add participants user stage index
+
+Revision ID: 3e9d1b7c5a20
+Revises: 8c3f4a6e2b17
+Create Date: 2026-10-18 12:45:19.803245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e9d1b7c5a20'
+down_revision: Union[str, None] = '8c3f4a6e2b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('judges_user_stage_index', 'judges', ['user_id', 'stage_id'], unique=True)
+    op.create_index('pilots_user_stage_index', 'pilots', ['user_id', 'stage_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('pilots_user_stage_index', table_name='pilots')
+    op.drop_index('judges_user_stage_index', table_name='judges')
@@ -0,0 +1,28 @@
+"""Add qualifications pilot attempt index
+
+Revision ID: a7e2c94f0d63
+Revises: 3e9d1b7c5a20
+Create Date: 2026-10-18 14:10:52.417309
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e2c94f0d63'
+down_revision: Union[str, None] = '3e9d1b7c5a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('qualifications_pilot_attempt_index', 'qualifications', ['pilot_id', 'attempt'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('qualifications_pilot_attempt_index', table_name='qualifications')
@@ -0,0 +1,28 @@
+"""Add pilots stage number index
+
+Revision ID: 6d2f8b4e1c93
+Revises: a7e2c94f0d63
+Create Date: 2026-10-18 15:30:07.182554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d2f8b4e1c93'
+down_revision: Union[str, None] = 'a7e2c94f0d63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('pilots_stage_number_index', 'pilots', ['stage_id', 'number'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('pilots_stage_number_index', table_name='pilots')
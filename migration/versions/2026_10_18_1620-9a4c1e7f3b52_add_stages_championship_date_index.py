@@ -0,0 +1,28 @@
+"""Add stages championship date index
+
+Revision ID: 9a4c1e7f3b52
+Revises: 6d2f8b4e1c93
+Create Date: 2026-10-18 16:20:41.603918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c1e7f3b52'
+down_revision: Union[str, None] = '6d2f8b4e1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('stages_championship_date_index', 'stages', ['championship_id', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('stages_championship_date_index', table_name='stages')
@@ -0,0 +1,32 @@
+"""Add hot path indexes
+
+Revision ID: c58d2a9f7e14
+Revises: 9a4c1e7f3b52
+Create Date: 2026-10-18 17:10:27.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c58d2a9f7e14'
+down_revision: Union[str, None] = '9a4c1e7f3b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('file_metadata_parent_index', 'file_metadata', ['parent_type', 'parent_id'], unique=False)
+    op.create_index('championships_user_id_index', 'championships', ['user_id', 'id'], unique=False)
+    op.create_index('judges_stage_index', 'judges', ['stage_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('judges_stage_index', table_name='judges')
+    op.drop_index('championships_user_id_index', table_name='championships')
+    op.drop_index('file_metadata_parent_index', table_name='file_metadata')
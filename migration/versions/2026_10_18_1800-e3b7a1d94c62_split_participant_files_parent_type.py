@@ -0,0 +1,55 @@
+"""Split participant files parent type
+
+Revision ID: e3b7a1d94c62
+Revises: c58d2a9f7e14
+Create Date: 2026-10-18 18:00:12.907155
+
+"""
+from typing import Sequence, Union
+
+import logging
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b7a1d94c62'
+down_revision: Union[str, None] = 'c58d2a9f7e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# Файлы судей и пилотов раньше хранились с общим parent_type 'participant'.
+# parent_id ищется в judges и pilots, если он есть в обеих таблицах - файл относится к записи,
+# созданной в той же транзакции (created_at обеих строк - now() одной транзакции).
+# Неоднозначные файлы остаются с 'participant', их количество выводится в лог.
+UPDATE_UNIQUE = """
+    UPDATE file_metadata AS f SET parent_type = :parent_type
+    WHERE f.parent_type = 'participant'
+    AND EXISTS (SELECT 1 FROM {table} AS t WHERE t.id = f.parent_id)
+    AND NOT EXISTS (SELECT 1 FROM {other} AS o WHERE o.id = f.parent_id)
+"""
+UPDATE_BY_CREATED_AT = """
+    UPDATE file_metadata AS f SET parent_type = :parent_type
+    WHERE f.parent_type = 'participant'
+    AND EXISTS (SELECT 1 FROM {table} AS t WHERE t.id = f.parent_id AND t.created_at = f.created_at)
+    AND NOT EXISTS (SELECT 1 FROM {other} AS o WHERE o.id = f.parent_id AND o.created_at = f.created_at)
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for update in (UPDATE_UNIQUE, UPDATE_BY_CREATED_AT):
+        for parent_type, table, other in (("judge", "judges", "pilots"), ("pilot", "pilots", "judges")):
+            op.execute(sa.text(update.format(table=table, other=other)).bindparams(parent_type=parent_type))
+    if not context.is_offline_mode():
+        left = op.get_bind().scalar(sa.text("SELECT count(*) FROM file_metadata WHERE parent_type = 'participant'"))
+        if left:
+            logger.warning(f"{left} participant files were not matched to a judge or a pilot and keep parent_type 'participant'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE file_metadata SET parent_type = 'participant' WHERE parent_type IN ('judge', 'pilot')")
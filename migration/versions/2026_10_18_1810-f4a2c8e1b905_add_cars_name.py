@@ -0,0 +1,28 @@
+"""Add cars name
+
+Revision ID: f4a2c8e1b905
+Revises: e3b7a1d94c62
+Create Date: 2026-10-18 18:10:48.215730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a2c8e1b905'
+down_revision: Union[str, None] = 'e3b7a1d94c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('cars', sa.Column('name', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('cars', 'name')
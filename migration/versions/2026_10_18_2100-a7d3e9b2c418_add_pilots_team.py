@@ -0,0 +1,28 @@
+"""Add pilots team
+
+Revision ID: a7d3e9b2c418
+Revises: f4a2c8e1b905
+Create Date: 2026-10-18 21:00:12.604318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9b2c418'
+down_revision: Union[str, None] = 'f4a2c8e1b905'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('pilots', sa.Column('team', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('pilots', 'team')
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 import calendar
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 
 from enum import StrEnum
 
@@ -11,6 +12,7 @@ from aiogram.filters.callback_data import CallbackData
 
 WEEK_LENGTH = 7
 YEAR_LENGTH = 12
+CACHE_SIZE = 256  # Готовых разметок календаря в памяти
 WEEKDAYS = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"]
 MONTHS = [
     "Январь",
@@ -43,12 +45,22 @@ class CalendarCallback(CallbackData, prefix="calendar"):
     action: CalendarAction
 
 
+IGNORE_CALLBACK_DATA = CalendarCallback(action=CalendarAction.IGNORE).pack()
+WEEKDAYS_ROW = tuple(InlineKeyboardButton(text=day, callback_data=IGNORE_CALLBACK_DATA) for day in WEEKDAYS)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_month_days(year: int, month: int) -> tuple[tuple[int, ...], ...]:
+    """Сетка месяца по неделям, 0 - день соседнего месяца."""
+    return tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+
+
 class CalendarKeyboard:
     def __init__(
             self,
             year: int,
             month: int,
-            marked_dates: list[datetime],
+            marked_dates: Sequence[date],
             mark_label: str = "",
             callback: type[CalendarCallback] = CalendarCallback,
             **callback_kwargs
@@ -67,17 +79,35 @@ class CalendarKeyboard:
         self._month = month
         self._marked_dates = marked_dates
         self._mark_label = mark_label
-        self._month_days = calendar.monthcalendar(year, month)
+        self._month_days = get_month_days(year, month)
         self._marked_days = self._mark_days()
         self._callback = callback
         self._callback_kwargs = callback_kwargs
 
-    def _mark_days(self) -> set[int]:
+    def _mark_days(self) -> frozenset[int]:
         """Возвращает множество отмеченных дней для текущего месяца."""
-        return {
+        return frozenset(
             date.day for date in self._marked_dates
             if date.year == self._year and date.month == self._month
-        }
+        )
+
+    @property
+    def _key(self) -> tuple:
+        """Всё, от чего зависит разметка: календари с одинаковым ключом выглядят одинаково."""
+        return (
+            self._callback,
+            self._year,
+            self._month,
+            self._marked_days,
+            self._mark_label,
+            tuple(sorted(self._callback_kwargs.items()))
+        )
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CalendarKeyboard) and self._key == other._key
 
     def _get_navigation_months(self) -> tuple[tuple[int, int], tuple[int, int]]:
         """Вычисляет предыдущий и следующий месяцы для навигации."""
@@ -89,13 +119,15 @@ class CalendarKeyboard:
 
         return (prev_year, prev_month), (next_year, next_month)
 
+    def _build_empty_button(self) -> InlineKeyboardButton:
+        """Создает кнопку для дня соседнего месяца (одна на весь календарь)."""
+        return InlineKeyboardButton(
+            text=" ",
+            callback_data=self._callback(action=CalendarAction.IGNORE, **self._callback_kwargs).pack()
+        )
+
     def _build_day_button(self, day: int) -> InlineKeyboardButton:
         """Создает кнопку для дня календаря."""
-        if day == 0:
-            return InlineKeyboardButton(
-                text=" ",
-                callback_data=self._callback(action=CalendarAction.IGNORE, **self._callback_kwargs).pack()
-            )
         is_marked = day in self._marked_days
         text = f"{self._mark_label}{day}" if is_marked else str(day)
         return InlineKeyboardButton(
@@ -113,18 +145,13 @@ class CalendarKeyboard:
     @staticmethod
     def _build_weekdays_row(builder: InlineKeyboardBuilder) -> None:
         """Добавляет строку с днями недели."""
-        builder.row(*[
-            InlineKeyboardButton(
-                text=day,
-                callback_data=CalendarCallback(action=CalendarAction.IGNORE).pack()
-            )
-            for day in WEEKDAYS
-        ])
+        builder.row(*WEEKDAYS_ROW)
 
     def _build_days_grid(self, builder: InlineKeyboardBuilder) -> None:
         """Добавляет сетку дней месяца."""
+        empty_button = self._build_empty_button()
         for week in self._month_days:
-            builder.row(*[self._build_day_button(day) for day in week])
+            builder.row(*[self._build_day_button(day) if day else empty_button for day in week])
 
     def _build_navigation_row(self, builder: InlineKeyboardBuilder) -> None:
         """Добавляет строку навигации."""
@@ -142,7 +169,7 @@ class CalendarKeyboard:
             ),
             InlineKeyboardButton(
                 text=f"{MONTHS[self._month - 1]} {self._year}",
-                callback_data=CalendarCallback(action=CalendarAction.IGNORE).pack()
+                callback_data=IGNORE_CALLBACK_DATA
             ),
             InlineKeyboardButton(
                 text="➡️",
@@ -155,8 +182,8 @@ class CalendarKeyboard:
             )
         )
 
-    def __call__(self) -> InlineKeyboardMarkup:
-        """Строит и возвращает клавиатуру календаря."""
+    def build(self) -> InlineKeyboardMarkup:
+        """Строит клавиатуру календаря."""
         builder = InlineKeyboardBuilder()
 
         self._build_weekdays_row(builder)
@@ -164,3 +191,15 @@ class CalendarKeyboard:
         self._build_navigation_row(builder)
 
         return builder.as_markup()
+
+    def __call__(self) -> InlineKeyboardMarkup:
+        """
+            Возвращает клавиатуру календаря.
+            Разметка общая для одинаковых календарей, поэтому изменять её нельзя.
+        """
+        return build_calendar_markup(self)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def build_calendar_markup(keyboard: CalendarKeyboard) -> InlineKeyboardMarkup:
+    return keyboard.build()
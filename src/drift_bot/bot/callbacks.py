@@ -7,7 +7,8 @@ from .enums import (
     AdminStageAction,
     ChampionshipAction,
     JudgeStageAction,
-    PilotStageAction
+    PilotStageAction,
+    LeaderboardAction
 )
 
 from ..core.enums import Role, Criterion
@@ -61,6 +62,8 @@ class ChampionshipCallback(CallbackData, prefix="championship"):
 
 class ChampionshipPageCallback(CallbackData, prefix="championship_page"):
     page: int
+    cursor: int     # ID крайнего чемпионата текущей страницы
+    forward: bool   # Листать вперёд (после cursor) или назад (перед cursor)
 
 
 class ChampionshipActionCallback(CallbackData, prefix="championship_action"):
@@ -68,7 +71,7 @@ class ChampionshipActionCallback(CallbackData, prefix="championship_action"):
     action: ChampionshipAction
 
 
-class StageCalendarCallback(CalendarCallback):
+class StageCalendarCallback(CalendarCallback, prefix="stage_calendar"):
     """Расписание этапов чемпионата."""
     championship_id: int
 
@@ -83,3 +86,9 @@ class PilotStageActionCallback(CallbackData, prefix="pilot_stage_action"):
     """Действия пилота для взаимодействия с этапом."""
     id: int
     action: PilotStageAction
+
+
+class LeaderboardCallback(CallbackData, prefix="leaderboard"):
+    """Подписка на обновления таблицы квалификации этапа."""
+    stage_id: int
+    action: LeaderboardAction
@@ -1,5 +1,7 @@
-from typing import Any, Callable, Coroutine, TypeVar, Protocol
+from typing import Any, Callable, Coroutine, TypeVar, Protocol, Optional
 from typing_extensions import ParamSpec
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from functools import wraps
 
 import logging
@@ -8,11 +10,12 @@ from aiogram.fsm.state import StatesGroup
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
-from dishka import Scope
+from dishka import Scope, AsyncContainer
 
 from pydantic import BaseModel
 
 from .keyboards import judge_registration_kb
+from .middlewares import current_user, current_container
 from .utils import get_form_fields, draw_progress_bar
 
 from ..ioc import container
@@ -38,6 +41,26 @@ ROLE2TYPE: dict[Role, type[BaseModel]] = {
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def request_scope() -> AsyncIterator[AsyncContainer]:
+    """Контейнер текущего апдейта (одна сессия БД на апдейт), либо новый, если middleware не отработал."""
+    request_container = current_container.get()
+    if request_container is not None:
+        yield request_container
+        return
+    async with container(scope=Scope.REQUEST) as request_container:
+        yield request_container
+
+
+async def get_current_user(user_id: int) -> Optional[User]:
+    """Пользователь, загруженный UserMiddleware, без повторного запроса в БД."""
+    if current_container.get() is not None:
+        return current_user.get()
+    async with request_scope() as request_container:
+        user_repository = await request_container.get(CRUDRepository[User])
+        return await user_repository.read(user_id)
+
+
 def role_required(
         *roles: Role,
         error_message: str
@@ -46,13 +69,12 @@ def role_required(
     def decorator(func: MessageHandler[P, R]) -> MessageHandler[P, R | None]:
         @wraps(func)
         async def wrapper(message: Message, *args, **kwargs) -> R | None:
-            async with container(scope=Scope.REQUEST) as request_container:
-                user_repository = await request_container.get(CRUDRepository[User])
-                user_id = message.from_user.id
-                user = await user_repository.read(user_id)
-                if user.role not in roles:
-                    logger.warning(f"Access denied for user: {user_id}")
-                    await message.answer(error_message)
+            user_id = message.from_user.id
+            user = await get_current_user(user_id)
+            if not user or user.role not in roles:
+                logger.warning(f"Access denied for user: {user_id}")
+                await message.answer(error_message)
+                return None
             return await func(message, *args, **kwargs)
         return wrapper
     return decorator
@@ -63,12 +85,13 @@ def save_user(role: Role) -> Callable[[MessageHandler[P, R]], MessageHandler[P,
     def decorator(func: MessageHandler[P, R]) -> MessageHandler[P, R | None]:
         @wraps(func)
         async def wrapper(message: Message, *args, **kwargs) -> R | None:
-            async with container(scope=Scope.REQUEST) as request_container:
+            existed_user = await get_current_user(message.from_user.id)
+            async with request_scope() as request_container:
                 user_repository = await request_container.get(CRUDRepository[User])
-                existed_user = await user_repository.read(message.from_user.id)
                 if existed_user:
                     try:
-                        await user_repository.update(message.from_user.id, role=role)
+                        updated_user = await user_repository.update(message.from_user.id, role=role)
+                        current_user.set(updated_user)
                     except UpdateError as e:
                         logger.error(f"Error while user updating: {e}")
                         await message.answer("⚠️ Произошла ошибка, попробуйте позже. Приносим свои извинения.")
@@ -79,7 +102,8 @@ def save_user(role: Role) -> Callable[[MessageHandler[P, R]], MessageHandler[P,
                     role=role
                 )
                 try:
-                    _ = await user_repository.create(user)
+                    created_user = await user_repository.create(user)
+                    current_user.set(created_user)
                 except CreationError as e:
                     logger.error(f"Error while user saving: {e}")
                     await message.answer("⚠️ Произошла ошибка, попробуйте позже. Приносим свои извинения.")
@@ -122,7 +146,7 @@ def handle_invited_user() -> Callable[[MessageHandler[P, R]], MessageHandler[P,
     def decorator(handler: MessageHandler[P, R]) -> MessageHandler[P, R | None]:
         @wraps(handler)
         async def wrapper(message: Message, *args, **kwargs) -> R | None:
-            async with container(scope=Scope.REQUEST) as request_container:
+            async with request_scope() as request_container:
                 referral_service = await request_container.get(ReferralService)
                 url = message.get_url()
                 if not url:
@@ -170,7 +194,7 @@ def check_participant_registration(
                 *args, **kwargs
         ) -> R | None:
             participant_type = ROLE2TYPE[role]
-            async with container(scope=Scope.REQUEST) as request_container:
+            async with request_scope() as request_container:
                 participant_repository = await request_container.get(ParticipantRepository[participant_type])
                 participant = await participant_repository.get_by_user_and_stage(
                     user_id=call.from_user.id,
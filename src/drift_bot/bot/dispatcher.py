@@ -1,14 +1,30 @@
+from typing import Optional
+
 from aiogram import Dispatcher
-from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.fsm.storage.base import BaseStorage, BaseEventIsolation
 
 from dishka.integrations.aiogram import setup_dishka
 
 from .routers import router
+from .middlewares import QueryCounterMiddleware, UserMiddleware
 from ..ioc import container
 
 
-def create_dispatcher() -> Dispatcher:
-    dispatcher = Dispatcher(storage=MemoryStorage())
+def create_dispatcher(
+        storage: BaseStorage,
+        events_isolation: Optional[BaseEventIsolation] = None
+) -> Dispatcher:
+    """
+        Создаёт диспетчер бота.
+
+        :param storage: Хранилище FSM (Redis, чтобы состояние форм было общим для всех воркеров)
+        :param events_isolation: Изоляция событий одного чата между воркерами
+    """
+    dispatcher = Dispatcher(storage=storage, events_isolation=events_isolation)
     dispatcher.include_router(router)
     setup_dishka(container=container, router=dispatcher, auto_inject=True)
+    # Регистрируются после dishka, чтобы контейнер запроса уже был в данных апдейта
+    dispatcher.update.outer_middleware(QueryCounterMiddleware())
+    dispatcher.message.outer_middleware(UserMiddleware())
+    dispatcher.callback_query.outer_middleware(UserMiddleware())
     return dispatcher
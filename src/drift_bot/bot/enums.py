@@ -33,3 +33,8 @@ class JudgeStageAction(StrEnum):
 class PilotStageAction(StrEnum):
     REGISTRATION = "registration"  # Регистрация на этап
     QUIT = "quit"                  # Покинуть этап
+
+
+class LeaderboardAction(StrEnum):
+    SUBSCRIBE = "subscribe"      # Следить за таблицей квалификации
+    UNSUBSCRIBE = "unsubscribe"  # Перестать следить
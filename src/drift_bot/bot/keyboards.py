@@ -1,5 +1,7 @@
 from typing import Union
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardMarkup, ReplyKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder, ReplyKeyboardBuilder
 
@@ -11,7 +13,8 @@ from .enums import (
     AdminStageAction,
     ChampionshipAction,
     JudgeStageAction,
-    PilotStageAction
+    PilotStageAction,
+    LeaderboardAction
 )
 from .callbacks import (
     StartCallback,
@@ -26,11 +29,12 @@ from .callbacks import (
     ConfirmStageDeletionCallback,
     ConfirmStageCreationCallback,
     JudgeStageActionCallback,
-    PilotStageActionCallback
+    PilotStageActionCallback,
+    LeaderboardCallback
 )
 
 from ..core.enums import Role
-from ..core.domain import Championship
+from ..core.dto import ActiveChampionship
 from ..constants import CRITERION2TEXT
 
 ConfirmCallback = Union[
@@ -41,8 +45,12 @@ ConfirmCallback = Union[
 ]
 
 
+@lru_cache(maxsize=None)
 def start_keyboard() -> InlineKeyboardMarkup:
-    """Стартовая клавиатура для выбора роли."""
+    """
+        Стартовая клавиатура для выбора роли.
+        Клавиатуры без изменяемых данных строятся один раз и переиспользуются (изменять их нельзя).
+    """
     builder = InlineKeyboardBuilder()
     builder.button(text="🏎️ Участник", callback_data=StartCallback(role=Role.PILOT).pack())
     builder.button(text="⚖️ Судья", callback_data=StartCallback(role=Role.JUDGE).pack())
@@ -51,6 +59,7 @@ def start_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@lru_cache(maxsize=None)
 def confirm_kb(callback: type[ConfirmCallback]) -> InlineKeyboardMarkup:
     """
         Клавиатура для подтверждения создания ресурса.
@@ -125,6 +134,7 @@ def admin_stage_actions_kb(stage_id: int, is_active: bool) -> InlineKeyboardMark
     return builder.as_markup()
 
 
+@lru_cache(maxsize=None)
 def choose_criterion_kb() -> InlineKeyboardMarkup:
     """Клавиатура для выбора судейского критерия."""
     builder = InlineKeyboardBuilder()
@@ -136,6 +146,7 @@ def choose_criterion_kb() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@lru_cache(maxsize=None)
 def numeric_kb(numbers: int) -> ReplyKeyboardMarkup:
     """Клавиатура для ввода цифр."""
     builder = ReplyKeyboardBuilder()
@@ -159,8 +170,8 @@ def judge_registration_kb(stage_id: int) -> InlineKeyboardMarkup:
 
 def paginate_championships_kb(
         page: PositiveInt,
-        total: PositiveInt,
-        championships: list[Championship]
+        pages: int,
+        championships: list[ActiveChampionship]
 ) -> InlineKeyboardMarkup:
     """Клавиатура для пагинации активных чемпионатов."""
     builder = InlineKeyboardBuilder()
@@ -170,17 +181,25 @@ def paginate_championships_kb(
             callback_data=ChampionshipCallback(id=championship.id).pack()
         )
     buttons: list[InlineKeyboardButton] = []
-    if page > 1:
+    if page > 1 and championships:
         previous_page = page - 1
         buttons.append(InlineKeyboardButton(
             text="⬅️",
-            callback_data=ChampionshipPageCallback(page=previous_page).pack()
+            callback_data=ChampionshipPageCallback(
+                page=previous_page,
+                cursor=championships[0].id,
+                forward=False
+            ).pack()
         ))
-    if page < total:
+    if page < pages and championships:
         next_page = page + 1
         buttons.append(InlineKeyboardButton(
             text="➡️",
-            callback_data=ChampionshipPageCallback(page=next_page).pack()
+            callback_data=ChampionshipPageCallback(
+                page=next_page,
+                cursor=championships[-1].id,
+                forward=True
+            ).pack()
         ))
     builder.row(*buttons)
     builder.adjust(1)
@@ -222,6 +241,13 @@ def judge_stage_actions_kb(stage_id: int) -> InlineKeyboardMarkup:
             action=JudgeStageAction.REGISTRATION
         ).pack()
     )
+    builder.button(
+        text="📊 Таблица квалификации",
+        callback_data=LeaderboardCallback(
+            stage_id=stage_id,
+            action=LeaderboardAction.SUBSCRIBE
+        ).pack()
+    )
     builder.adjust(1)
     return builder.as_markup()
 
@@ -236,5 +262,25 @@ def pilot_stage_actions_kb(stage_id: int) -> InlineKeyboardMarkup:
             action=PilotStageAction.REGISTRATION
         )
     )
+    builder.button(
+        text="📊 Таблица квалификации",
+        callback_data=LeaderboardCallback(
+            stage_id=stage_id,
+            action=LeaderboardAction.SUBSCRIBE
+        ).pack()
+    )
     builder.adjust(1)
     return builder.as_markup()
+
+
+def leaderboard_kb(stage_id: int) -> InlineKeyboardMarkup:
+    """Клавиатура под закреплённой таблицей квалификации."""
+    builder = InlineKeyboardBuilder()
+    builder.button(
+        text="🔕 Отписаться",
+        callback_data=LeaderboardCallback(
+            stage_id=stage_id,
+            action=LeaderboardAction.UNSUBSCRIBE
+        ).pack()
+    )
+    return builder.as_markup()
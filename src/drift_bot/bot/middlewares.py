@@ -0,0 +1,73 @@
+from typing import Any, Optional
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+
+import logging
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, User as TelegramUser
+
+from dishka import AsyncContainer
+from dishka.integrations.aiogram import CONTAINER_NAME
+
+from ..metrics import metrics
+from ..core.domain import User
+from ..core.base import CRUDRepository
+from ..infrastructure.database.session import ReplicaRouter, DbActor, query_counter, db_actor
+
+USER_KEY = "user"  # Ключ, под которым пользователь передаётся в хендлеры
+
+# Контекст текущего апдейта, доступный декораторам хендлеров
+current_user: ContextVar[Optional[User]] = ContextVar("current_user", default=None)
+current_container: ContextVar[Optional[AsyncContainer]] = ContextVar("current_container", default=None)
+
+Handler = Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]]
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCounterMiddleware(BaseMiddleware):
+    """Считает количество SQL запросов, выполненных при обработке одного апдейта."""
+    async def __call__(self, handler: Handler, event: TelegramObject, data: dict[str, Any]) -> Any:
+        counter = [0]
+        token = query_counter.set(counter)
+        try:
+            return await handler(event, data)
+        finally:
+            query_counter.reset(token)
+            metrics.observe("db.queries_per_update", counter[0])
+            logger.debug(f"Update handled with {counter[0]} queries")
+
+
+class UserMiddleware(BaseMiddleware):
+    """
+        Загружает пользователя один раз за апдейт.
+        Пользователь передаётся в хендлеры (параметр `user`), а контейнер запроса -
+        в декораторы, чтобы весь апдейт обслуживался одной сессией БД.
+        Отправитель апдейта также становится db_actor: после своей записи он читает из основной БД.
+    """
+    async def __call__(self, handler: Handler, event: TelegramObject, data: dict[str, Any]) -> Any:
+        request_container: Optional[AsyncContainer] = data.get(CONTAINER_NAME)
+        from_user: Optional[TelegramUser] = data.get("event_from_user")
+        router: Optional[ReplicaRouter] = None
+        actor: Optional[DbActor] = None
+        user: Optional[User] = None
+        actor_token = db_actor.set(None)
+        if request_container is not None and from_user is not None:
+            # Отметка о записи читается до первого запроса апдейта
+            router = await request_container.get(ReplicaRouter)
+            actor = await router.load_actor(from_user.id)
+            db_actor.set(actor)
+            user_repository = await request_container.get(CRUDRepository[User])
+            user = await user_repository.read(from_user.id)
+        data[USER_KEY] = user
+        user_token = current_user.set(user)
+        container_token = current_container.set(request_container)
+        try:
+            return await handler(event, data)
+        finally:
+            current_user.reset(user_token)
+            current_container.reset(container_token)
+            db_actor.reset(actor_token)
+            if router is not None and actor is not None:
+                await router.save_actor(actor)
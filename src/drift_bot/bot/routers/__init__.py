@@ -6,6 +6,7 @@ from .start import start_router
 from .admin import admin_router
 from .judjes import judges_router
 from .championships import championships_router
+from .leaderboard import leaderboard_router
 
 router = Router()
 
@@ -13,5 +14,6 @@ router.include_routers(
     start_router,
     championships_router,
     admin_router,
-    judges_router
+    judges_router,
+    leaderboard_router
 )
@@ -2,10 +2,12 @@ import logging
 
 from aiogram import F, Router
 from aiogram.filters import Command
-from aiogram.types import CallbackQuery, Message, BufferedInputFile
+from aiogram.types import CallbackQuery, Message
 
 from dishka.integrations.aiogram import FromDishka as Depends
 
+from ...types import Card
+from ...utils import send_cards
 from ...decorators import role_required
 from ...enums import AdminChampionshipAction
 from ...callbacks import AdminChampionshipActionCallback
@@ -13,11 +15,13 @@ from ...keyboards import admin_championship_actions_kb
 
 from src.drift_bot.core.enums import Role, FileType
 from src.drift_bot.core.domain import Championship
-from src.drift_bot.core.services import CRUDService
+from src.drift_bot.core.services import CRUDService, FileService
 from src.drift_bot.core.base import ChampionshipRepository
 from src.drift_bot.core.exceptions import DeletionError, RemovingFileError, UpdateError
+from src.drift_bot.infrastructure.telegram import RateLimiter
 
 from src.drift_bot.templates import CHAMPIONSHIP_TEMPLATE
+from src.drift_bot.utils import find_target_file
 
 
 logger = logging.getLogger(name=__name__)
@@ -32,34 +36,32 @@ ADMIN_REQUIRED_MESSAGE = "⛔ Редактировать чемпионат и 
 async def send_my_championships(
         message: Message,
         championship_repository: Depends[ChampionshipRepository],
-        championship_crud_service: Depends[CRUDService[Championship]]
+        file_service: Depends[FileService],
+        rate_limiter: Depends[RateLimiter]
 ) -> None:
+    # Чемпионаты загружаются одним запросом вместе с файлами
     my_championships = await championship_repository.get_by_user_id(message.from_user.id)
     if not my_championships:
         await message.answer("""Вы пока не создали ни один чемпионат, 
             вы можете это сделать с помощью команды /create_championship
         """)
-    else:
-        for my_championship in my_championships:
-            championship, files = await championship_crud_service.read(my_championship.id)
-            photo = next((file for file in files if file.type == FileType.PHOTO), None)
-            keyboard = admin_championship_actions_kb(
-                championship_id=championship.id,
-                is_active=championship.is_active
-            )
-            text = CHAMPIONSHIP_TEMPLATE.format(
+        return
+    cards = [
+        Card(
+            text=CHAMPIONSHIP_TEMPLATE.format(
                 title=championship.title,
                 description=championship.description,
                 stages_count=championship.stages_count
-            )
-            if photo:
-                await message.answer_photo(
-                    photo=BufferedInputFile(file=photo.data, filename=photo.file_name),
-                    caption=text,
-                    reply_markup=keyboard
-                )
-            else:
-                await message.answer(text=text, reply_markup=keyboard)
+            ),
+            reply_markup=admin_championship_actions_kb(
+                championship_id=championship.id,
+                is_active=championship.is_active
+            ),
+            photo=find_target_file(championship.files, target_type=FileType.PHOTO)
+        )
+        for championship in my_championships
+    ]
+    await send_cards(message, cards, file_service=file_service, rate_limiter=rate_limiter)
 
 
 @championship_actions_router.callback_query(
@@ -12,7 +12,7 @@ from ...callbacks import AdminStageActionCallback
 from src.drift_bot.core.enums import Role
 from src.drift_bot.core.domain import Stage
 from src.drift_bot.core.base import StageRepository
-from src.drift_bot.core.services import ReferralService, CRUDService
+from src.drift_bot.core.services import ReferralService, CRUDService, NotificationService, NumberGenerator
 from src.drift_bot.core.exceptions import CreationError, DeletionError, RemovingFileError
 
 logger = logging.getLogger(name=__name__)
@@ -50,11 +50,15 @@ async def invite_judge_to_stage(
 async def remove_stage(
         call: CallbackQuery,
         callback_data: AdminStageActionCallback,
-        stage_crud_service: Depends[CRUDService[Stage]]
+        stage_crud_service: Depends[CRUDService[Stage]],
+        notification_service: Depends[NotificationService],
+        number_generator: Depends[NumberGenerator]
 ) -> None:
     try:
         is_deleted = await stage_crud_service.delete(callback_data.id)
         if is_deleted:
+            await notification_service.cancel(callback_data.id)
+            await number_generator.drop(callback_data.id)
             await call.message.answer("✅ Этап успешно удалён...")
         else:
             await call.message.answer("❌ Этап не был удалён...")
@@ -70,10 +74,12 @@ async def remove_stage(
 async def toggle_stage_registration(
         call: CallbackQuery,
         callback_data: AdminStageActionCallback,
-        stage_repository: Depends[StageRepository]
+        stage_repository: Depends[StageRepository],
+        notification_service: Depends[NotificationService]
 ) -> None:
     created_stage = await stage_repository.read(callback_data.id)
     is_active = True if not created_stage.is_active else False
-    await stage_repository.update(callback_data.id, is_active=is_active)
+    updated_stage = await stage_repository.update(callback_data.id, is_active=is_active)
+    await notification_service.announce_registration(updated_stage)
     text = "🔓 Регистрация открыта" if is_active else "🔐 Регистрация закрыта"
     await call.message.answer(text)
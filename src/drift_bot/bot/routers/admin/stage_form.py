@@ -19,7 +19,7 @@ from ...callbacks import AdminChampionshipActionCallback, ConfirmStageCreationCa
 
 from src.drift_bot.core.domain import Stage
 from src.drift_bot.core.enums import Role, FileType
-from src.drift_bot.core.services import CRUDService
+from src.drift_bot.core.services import CRUDService, NotificationService
 from src.drift_bot.core.base import ChampionshipRepository
 from src.drift_bot.core.exceptions import CreationError, UploadingFileError
 
@@ -123,14 +123,15 @@ async def enter_stage_map_link(message: Message, state: FSMContext) -> None:
 @show_progress_bar(StageForm)
 async def enter_stage_date(message: Message, state: FSMContext) -> None:
     date = datetime.now()
-    await state.update_data(date=date)
+    # Данные формы хранятся в Redis в JSON, Stage разбирает дату обратно из ISO строки
+    await state.update_data(date=date.isoformat())
     data = await state.get_data()
     text = STAGE_TEMPLATE.format(
         title=data["title"],
         description=data["description"],
         location=data["location"],
         map_link=data["map_link"],
-        date=data["date"]
+        date=date
     )
     photo = data.get("photo_id")
     if photo:
@@ -157,7 +158,8 @@ async def cancel_stage_creation(call: CallbackQuery, state: FSMContext) -> None:
 async def confirm_stage_creation(
         call: CallbackQuery,
         state: FSMContext,
-        stage_crud_service: Depends[CRUDService[Stage]]
+        stage_crud_service: Depends[CRUDService[Stage]],
+        notification_service: Depends[NotificationService]
 ) -> None:
     data = await state.get_data()
     await state.clear()
@@ -174,6 +176,7 @@ async def confirm_stage_creation(
     )
     try:
         created_stage = await stage_crud_service.create(stage, files=files, bucket=STAGES_BUCKET)
+        await notification_service.schedule_reminder(created_stage)
         await call.message.answer(
             text="✅ Этап успешно создан...",
             reply_markup=admin_stage_actions_kb(
@@ -1,3 +1,5 @@
+from typing import Optional
+from math import ceil
 from datetime import datetime
 
 from aiogram import Router, F
@@ -7,7 +9,8 @@ from aiogram.types import Message, CallbackQuery, BufferedInputFile
 from dishka.integrations.aiogram import FromDishka as Depends
 
 from ..enums import ChampionshipAction
-from ..utils import get_stage_actions_kb_by_role
+from ..types import Card
+from ..utils import get_stage_actions_kb_by_role, send_card, send_cards
 from ..calendar_kb import CalendarKeyboard, CalendarCallback, CalendarAction
 from ..keyboards import paginate_championships_kb, championship_actions_kb
 from ..callbacks import (
@@ -18,12 +21,13 @@ from ..callbacks import (
 )
 
 from src.drift_bot.core.enums import FileType
-from src.drift_bot.core.domain import Championship, Stage, User
-from src.drift_bot.core.services import CRUDService
-from src.drift_bot.core.base import ChampionshipRepository, StageRepository, CRUDRepository
+from src.drift_bot.core.domain import Championship, User
+from src.drift_bot.core.services import CRUDService, FileService
+from src.drift_bot.core.base import ChampionshipRepository, StageRepository
+from src.drift_bot.infrastructure.telegram import RateLimiter
 
 from src.drift_bot.templates import CHAMPIONSHIP_TEMPLATE, STAGE_TEMPLATE
-from src.drift_bot.utils import find_target_file
+from src.drift_bot.utils import find_target_file, get_month_range
 
 PAGE, LIMIT = 1, 3
 DEFAULT_DAY = 1
@@ -36,14 +40,13 @@ async def send_start_championships_menu(
         message: Message,
         championship_repository: Depends[ChampionshipRepository]
 ) -> None:
-    championships = await championship_repository.paginate(page=PAGE, limit=LIMIT)
-    total = await championship_repository.count()
+    championships_page = await championship_repository.paginate(limit=LIMIT)
     await message.answer(
         text="Доступные чемпионаты 🏆",
         reply_markup=paginate_championships_kb(
             page=PAGE,
-            total=total,
-            championships=championships
+            pages=ceil(championships_page.total / LIMIT),
+            championships=championships_page.championships
         )
     )
 
@@ -54,14 +57,16 @@ async def send_next_championship_menu(
         callback_data: ChampionshipPageCallback,
         championship_repository: Depends[ChampionshipRepository]
 ) -> None:
-    page = callback_data.page
-    championships = await championship_repository.paginate(page=page, limit=LIMIT)
-    total = await championship_repository.count()
+    championships_page = await championship_repository.paginate(
+        limit=LIMIT,
+        cursor=callback_data.cursor,
+        forward=callback_data.forward
+    )
     await call.message.edit_reply_markup(
         reply_markup=paginate_championships_kb(
-            page=page,
-            total=total,
-            championships=championships
+            page=callback_data.page,
+            pages=ceil(championships_page.total / LIMIT),
+            championships=championships_page.championships
         )
     )
 
@@ -70,24 +75,22 @@ async def send_next_championship_menu(
 async def choose_championship(
         call: CallbackQuery,
         callback_data: ChampionshipCallback,
-        championship_crud_service: Depends[CRUDService[Championship]]
+        championship_repository: Depends[ChampionshipRepository],
+        file_service: Depends[FileService]
 ) -> None:
-    championship, files = await championship_crud_service.read(callback_data.id)
+    championship = await championship_repository.read(callback_data.id)
     text = CHAMPIONSHIP_TEMPLATE.format(
         title=championship.title,
         description=championship.description,
         stages_count=championship.stages_count
     )
-    keyboard = championship_actions_kb(callback_data.id)
-    photo = find_target_file(files, target_type=FileType.PHOTO)
-    if photo:
-        await call.message.answer_photo(
-            photo=BufferedInputFile(file=photo.data, filename=photo.file_name),
-            caption=text,
-            reply_markup=keyboard
-        )
-    else:
-        await call.message.answer(text=text, reply_markup=keyboard)
+    await send_card(
+        call.message,
+        text=text,
+        reply_markup=championship_actions_kb(callback_data.id),
+        photo=find_target_file(championship.files, target_type=FileType.PHOTO),
+        file_service=file_service
+    )
 
 
 @championships_router.callback_query(
@@ -98,8 +101,8 @@ async def send_championship_regulations(
         callback_data: ChampionshipActionCallback,
         championship_crud_service: Depends[CRUDService[Championship]]
 ) -> None:
-    _, files = await championship_crud_service.read(callback_data.id)
-    document = find_target_file(files, target_type=FileType.DOCUMENT)
+    result = await championship_crud_service.read(callback_data.id, file_types={FileType.DOCUMENT})
+    document = find_target_file(result[1], target_type=FileType.DOCUMENT) if result else None
     if not document:
         await call.message.answer("У этого чемпионата пока нет регламента...")
     else:
@@ -108,26 +111,35 @@ async def send_championship_regulations(
         )
 
 
+async def get_stages_calendar_kb(
+        stage_repository: StageRepository,
+        championship_id: int,
+        year: int,
+        month: int
+) -> CalendarKeyboard:
+    """Календарь этапов чемпионата: из БД читаются только дни этапов видимого месяца."""
+    start, end = get_month_range(year, month)
+    days = await stage_repository.get_stage_days(championship_id, start, end)
+    return CalendarKeyboard(
+        year=year,
+        month=month,
+        marked_dates=days,
+        mark_label="🏁",
+        callback=StageCalendarCallback,
+        championship_id=championship_id
+    )
+
+
 @championships_router.callback_query(
     ChampionshipActionCallback.filter(F.action == ChampionshipAction.STAGES_SCHEDULE)
 )
 async def send_stages_schedule_of_championship(
         call: CallbackQuery,
         callback_data: ChampionshipActionCallback,
-        championship_repository: Depends[ChampionshipRepository]
+        stage_repository: Depends[StageRepository]
 ) -> None:
-    championship_id = callback_data.id
-    stages = await championship_repository.get_stages(championship_id)
-    dates = [stage.date for stage in stages]
     today = datetime.now()
-    calendar_kb = CalendarKeyboard(
-        year=today.year,
-        month=today.month,
-        marked_dates=dates,
-        mark_label="🏁",
-        callback=StageCalendarCallback,
-        championship_id=championship_id
-    )
+    calendar_kb = await get_stages_calendar_kb(stage_repository, callback_data.id, today.year, today.month)
     await call.message.answer(text="📅 Расписание этапов", reply_markup=calendar_kb())
 
 
@@ -137,18 +149,13 @@ async def send_stages_schedule_of_championship(
 async def navigate_stage_schedule_of_championship(
         call: CallbackQuery,
         callback_data: StageCalendarCallback,
-        championship_repository: Depends[ChampionshipRepository]
+        stage_repository: Depends[StageRepository]
 ) -> None:
-    championship_id = callback_data.championship_id
-    stages = await championship_repository.get_stages(championship_id)
-    dates = [stage.date for stage in stages]
-    calendar_kb = CalendarKeyboard(
-        year=callback_data.year,
-        month=callback_data.month,
-        marked_dates=dates,
-        mark_label="🏁",
-        callback=StageCalendarCallback,
-        championship_id=championship_id
+    calendar_kb = await get_stages_calendar_kb(
+        stage_repository,
+        callback_data.championship_id,
+        callback_data.year,
+        callback_data.month
     )
     await call.message.edit_reply_markup(reply_markup=calendar_kb())
 
@@ -165,35 +172,31 @@ async def send_selected_stage_of_championship(
         call: CallbackQuery,
         callback_data: StageCalendarCallback,
         stage_repository: Depends[StageRepository],
-        stage_crud_service: Depends[CRUDService[Stage]],
-        user_repository: Depends[CRUDRepository[User]]
+        file_service: Depends[FileService],
+        rate_limiter: Depends[RateLimiter],
+        user: Optional[User] = None
 ) -> None:
-    stage = await stage_repository.get_by_date(
+    stages = await stage_repository.get_by_date(
         championship_id=callback_data.championship_id,
         date=datetime(year=callback_data.year, month=callback_data.month, day=callback_data.day)
     )
-    if not stage:
-        await call.answer()
-        return
-    _, files = await stage_crud_service.read(stage.id)
-    photo = find_target_file(files, target_type=FileType.PHOTO)
-    text = STAGE_TEMPLATE.format(
-        title=stage.title,
-        description=stage.description,
-        location=stage.location,
-        map_link=stage.map_link,
-        date=stage.date
-    )
-    user = await user_repository.read(call.from_user.id)
-    keyboard = get_stage_actions_kb_by_role(user.role, stage)
-    if photo:
-        await call.message.answer_photo(
-            photo=BufferedInputFile(file=photo.data, filename=photo.file_name),
-            caption=text,
-            reply_markup=keyboard
+    await call.answer()
+    # В один день может проходить несколько этапов - отправляем карточку каждого
+    cards = [
+        Card(
+            text=STAGE_TEMPLATE.format(
+                title=stage.title,
+                description=stage.description,
+                location=stage.location,
+                map_link=stage.map_link,
+                date=stage.date
+            ),
+            reply_markup=get_stage_actions_kb_by_role(user.role, stage) if user else None,
+            photo=find_target_file(stage.files, target_type=FileType.PHOTO)
         )
-    else:
-        await call.message.answer(text=text, reply_markup=keyboard)
+        for stage in stages
+    ]
+    await send_cards(call.message, cards, file_service=file_service, rate_limiter=rate_limiter)
 
 
 @championships_router.callback_query(
@@ -203,8 +206,8 @@ async def send_nearest_stage_of_championship(
         call: CallbackQuery,
         callback_data: ChampionshipActionCallback,
         stage_repository: Depends[StageRepository],
-        stage_crud_service: Depends[CRUDService[Stage]],
-        user_repository: Depends[CRUDRepository[User]]
+        file_service: Depends[FileService],
+        user: Optional[User] = None
 ) -> None:
     stage = await stage_repository.get_nearest(callback_data.id, date=datetime.now())
     if not stage:
@@ -217,15 +220,10 @@ async def send_nearest_stage_of_championship(
         map_link=stage.map_link,
         date=stage.date
     )
-    _, files = await stage_crud_service.read(stage.id)
-    photo = find_target_file(files, target_type=FileType.PHOTO)
-    user = await user_repository.read(call.from_user.id)
-    keyboard = get_stage_actions_kb_by_role(user.role, stage)
-    if photo:
-        await call.message.answer_photo(
-            photo=BufferedInputFile(file=photo.data, filename=photo.file_name),
-            caption=text,
-            reply_markup=keyboard
-        )
-    else:
-        await call.message.answer(text=text, reply_markup=keyboard)
+    await send_card(
+        call.message,
+        text=text,
+        reply_markup=get_stage_actions_kb_by_role(user.role, stage) if user else None,
+        photo=find_target_file(stage.files, target_type=FileType.PHOTO),
+        file_service=file_service
+    )
@@ -0,0 +1,57 @@
+import logging
+
+from aiogram import Router, F
+from aiogram.types import CallbackQuery
+from aiogram.exceptions import TelegramAPIError
+
+from dishka.integrations.aiogram import FromDishka as Depends
+
+from ..enums import LeaderboardAction
+from ..keyboards import leaderboard_kb
+from ..callbacks import LeaderboardCallback
+
+from src.drift_bot.core.base import SubscriptionRepository
+from src.drift_bot.core.services import QualificationService
+
+from src.drift_bot.utils import render_leaderboard
+from src.drift_bot.constants import LEADERBOARD_SIZE
+
+logger = logging.getLogger(__name__)
+
+leaderboard_router = Router(name=__name__)
+
+
+@leaderboard_router.callback_query(LeaderboardCallback.filter(F.action == LeaderboardAction.SUBSCRIBE))
+async def subscribe_leaderboard(
+        call: CallbackQuery,
+        callback_data: LeaderboardCallback,
+        qualification_service: Depends[QualificationService],
+        subscription_repository: Depends[SubscriptionRepository]
+) -> None:
+    leaderboard = await qualification_service.get_leaderboard(callback_data.stage_id, LEADERBOARD_SIZE)
+    message = await call.message.answer(
+        text=render_leaderboard(leaderboard),
+        reply_markup=leaderboard_kb(callback_data.stage_id)
+    )
+    try:
+        await message.pin(disable_notification=True)
+    except TelegramAPIError as e:
+        logger.warning(f"Can't pin leaderboard in chat {message.chat.id}: {e}")
+    # Дальше это сообщение редактируется при каждом изменении таблицы
+    await subscription_repository.subscribe(callback_data.stage_id, message.chat.id, message.message_id)
+    await call.answer("Таблица закреплена и будет обновляться 📊")
+
+
+@leaderboard_router.callback_query(LeaderboardCallback.filter(F.action == LeaderboardAction.UNSUBSCRIBE))
+async def unsubscribe_leaderboard(
+        call: CallbackQuery,
+        callback_data: LeaderboardCallback,
+        subscription_repository: Depends[SubscriptionRepository]
+) -> None:
+    await subscription_repository.unsubscribe(callback_data.stage_id, call.message.chat.id)
+    try:
+        await call.message.unpin()
+    except TelegramAPIError as e:
+        logger.warning(f"Can't unpin leaderboard in chat {call.message.chat.id}: {e}")
+    await call.message.edit_reply_markup(reply_markup=None)
+    await call.answer("Вы отписались от обновлений таблицы 🔕")
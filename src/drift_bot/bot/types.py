@@ -4,7 +4,10 @@ from typing_extensions import TypedDict
 from uuid import UUID
 from datetime import datetime
 
+from aiogram.types import InlineKeyboardMarkup
+
 from ..core.enums import Criterion
+from ..core.domain import FileMetadata
 
 TelegramFileId = Union[str, UUID, None]
 
@@ -38,3 +41,9 @@ class JudgeFormData(TypedDict):
 class FilteredFile(TypedDict):
     skip: bool
     file_id: Optional[TelegramFileId]
+
+
+class Card(TypedDict):
+    text: str
+    reply_markup: Optional[InlineKeyboardMarkup]
+    photo: Optional[FileMetadata]
@@ -1,4 +1,9 @@
-from aiogram.types import CallbackQuery, InlineKeyboardMarkup
+from typing import Optional, Sequence
+
+import logging
+
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message, BufferedInputFile
 from aiogram.fsm.state import StatesGroup, State
 
 from .keyboards import (
@@ -7,20 +12,99 @@ from .keyboards import (
     pilot_stage_actions_kb,
 )
 
-from ..core.domain import File, Stage
+from .types import Card
+
+from ..core.domain import File, FileMetadata, Stage
 from ..core.enums import Role
+from ..core.services import FileService
+from ..infrastructure.telegram import RateLimiter
+from ..constants import CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
 
 
 async def get_file(file_id: str, call: CallbackQuery) -> File:
     """
         Получает объект файла из telegram диалога.
+        Содержимое не загружается в память, а передаётся потоком фрагментами по CHUNK_SIZE.
         :param file_id - ID файла из диалога.
         :param call - Callback бота.
     """
     file = await call.bot.get_file(file_id=file_id)
-    data = await call.bot.download(file)
     file_name = file.file_path
-    return File(data=data.read(), file_name=file_name)
+    if call.bot.session.api.is_local:
+        data = await call.bot.download(file)
+        return File(data=data.read(), file_name=file_name)
+    url = call.bot.session.api.file_url(call.bot.token, file.file_path)
+    chunks = call.bot.session.stream_content(url=url, chunk_size=CHUNK_SIZE)
+    return File(file_name=file_name, file_size=file.file_size, chunks=chunks)
+
+
+async def send_card(
+        message: Message,
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup],
+        photo: Optional[FileMetadata],
+        file_service: FileService,
+        file: Optional[File] = None
+) -> Message:
+    """
+        Отправляет карточку (чемпионата, этапа ...) с фото.
+        Фото отправляется по сохранённому Telegram file_id, а из S3 скачивается только при первой отправке.
+        :param message - Сообщение, в чат которого отправляется карточка.
+        :param text - Текст карточки.
+        :param reply_markup - Клавиатура карточки.
+        :param photo - Метаданные прикреплённого фото.
+        :param file_service - Сервис для работы с файлами.
+        :param file - Заранее скачанное фото.
+    """
+    if not photo:
+        return await message.answer(text=text, reply_markup=reply_markup)
+    if photo.telegram_file_id:
+        try:
+            return await message.answer_photo(
+                photo=photo.telegram_file_id,
+                caption=text,
+                reply_markup=reply_markup
+            )
+        except TelegramBadRequest as e:
+            logger.warning(f"Cached telegram file id is not valid anymore: {e}")
+    file = file or await file_service.download(photo)
+    sent_message = await message.answer_photo(
+        photo=BufferedInputFile(file=file.data, filename=file.file_name),
+        caption=text,
+        reply_markup=reply_markup
+    )
+    await file_service.cache_telegram_file_id(photo, sent_message.photo[-1].file_id)
+    return sent_message
+
+
+async def send_cards(
+        message: Message,
+        cards: Sequence[Card],
+        file_service: FileService,
+        rate_limiter: RateLimiter
+) -> None:
+    """
+        Отправляет несколько карточек в чат сообщения.
+        Фото, которых ещё нет в Telegram, скачиваются из S3 конкурентно до начала отправки,
+        а сами карточки отправляются по порядку с учётом общего лимита бота.
+        :param message - Сообщение, в чат которого отправляются карточки.
+        :param cards - Карточки в порядке отправки.
+        :param file_service - Сервис для работы с файлами.
+        :param rate_limiter - Общий лимит отправки сообщений бота.
+    """
+    files = await file_service.prefetch(card["photo"] for card in cards)
+    for card in cards:
+        photo = card["photo"]
+        file = files.get(photo.key) if photo else None
+        await rate_limiter.acquire()
+        try:
+            await send_card(message, **card, file_service=file_service, file=file)
+        except TelegramRetryAfter as e:
+            rate_limiter.pause(e.retry_after)
+            await rate_limiter.acquire()
+            await send_card(message, **card, file_service=file_service, file=file)
 
 
 def draw_progress_bar(filled: int, total: int, width: int) -> str:
@@ -0,0 +1,131 @@
+from typing import Any, Optional
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import logging
+import asyncio
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+
+from fastapi import FastAPI, Request, Response, status
+
+from ..metrics import metrics
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+logger = logging.getLogger(__name__)
+
+
+class UpdateQueue:
+    """Ограниченная очередь апдейтов, которую разбирает пул воркеров."""
+    def __init__(
+            self,
+            bot: Bot,
+            dispatcher: Dispatcher,
+            workers: int,
+            max_size: int
+    ) -> None:
+        """
+            :param bot: Экземпляр бота
+            :param dispatcher: Диспетчер, в который передаются апдейты
+            :param workers: Количество одновременно обрабатываемых апдейтов
+            :param max_size: Максимальное количество апдейтов в очереди (backpressure)
+        """
+        self._bot = bot
+        self._dispatcher = dispatcher
+        self._workers_count = workers
+        self._queue: asyncio.Queue[Update] = asyncio.Queue(maxsize=max_size)
+        self._workers: list[asyncio.Task[None]] = []
+        self._accepting = False
+
+    @property
+    def size(self) -> int:
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        self._accepting = True
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"update-worker-{number}")
+            for number in range(self._workers_count)
+        ]
+        logger.info(f"Update queue started with {self._workers_count} workers")
+
+    async def put(self, update: Update, timeout: float) -> bool:
+        """Ставит апдейт в очередь, возвращает False если очередь переполнена дольше timeout."""
+        if not self._accepting:
+            return False
+        try:
+            await asyncio.wait_for(self._queue.put(update), timeout=timeout)
+        except asyncio.TimeoutError:
+            metrics.increment("webhook.updates.rejected")
+            return False
+        metrics.increment("webhook.updates.accepted")
+        metrics.set_gauge("webhook.queue.depth", self._queue.qsize())
+        return True
+
+    async def stop(self) -> None:
+        """Перестаёт принимать апдейты, дожидается обработки уже принятых и останавливает воркеры."""
+        self._accepting = False
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        logger.info("Update queue stopped")
+
+    async def _work(self) -> None:
+        while True:
+            update = await self._queue.get()
+            try:
+                with metrics.timer("webhook.update.processing"):
+                    await self._dispatcher.feed_update(self._bot, update)
+            except Exception as e:
+                metrics.increment("webhook.updates.failed")
+                logger.error(f"Error while processing update {update.update_id}: {e}")
+            finally:
+                self._queue.task_done()
+                metrics.set_gauge("webhook.queue.depth", self._queue.qsize())
+
+
+def create_webhook_app(
+        bot: Bot,
+        dispatcher: Dispatcher,
+        update_queue: UpdateQueue,
+        path: str,
+        secret_token: Optional[str] = None,
+        enqueue_timeout: float = 1.0
+) -> FastAPI:
+    """
+        Создаёт FastAPI приложение, принимающее апдейты от Telegram.
+        Апдейт подтверждается сразу после постановки в очередь, а при переполнении
+        очереди возвращается 503, чтобы Telegram повторил доставку позже.
+    """
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        workflow_data: dict[str, Any] = {"dispatcher": dispatcher, "bots": [bot], **dispatcher.workflow_data}
+        await dispatcher.emit_startup(bot=bot, **workflow_data)
+        await update_queue.start()
+        try:
+            yield
+        finally:
+            await update_queue.stop()
+            await dispatcher.emit_shutdown(bot=bot, **workflow_data)
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.post(path)
+    async def handle_update(request: Request) -> Response:
+        if secret_token and request.headers.get(SECRET_TOKEN_HEADER) != secret_token:
+            return Response(status_code=status.HTTP_401_UNAUTHORIZED)
+        update = Update.model_validate(await request.json(), context={"bot": bot})
+        is_accepted = await update_queue.put(update, timeout=enqueue_timeout)
+        if not is_accepted:
+            return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response(status_code=status.HTTP_200_OK)
+
+    @app.get("/metrics")
+    async def get_metrics() -> dict[str, Any]:
+        return metrics.snapshot()
+
+    return app
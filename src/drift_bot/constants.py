@@ -26,6 +26,13 @@ STAGES_BUCKET = "stages"
 PILOTS_BUCKET = "pilots"
 JUDGES_BUCKET = "judges"
 
+# Максимальное количество одновременных операций с файловым хранилищем
+MAX_CONCURRENT_FILE_OPERATIONS = 5
+# Размер фрагмента при потоковом чтении файлов
+CHUNK_SIZE = 64 * 1024  # Байт
+# Размер части при multipart загрузке в S3 (не меньше 5 МБ по требованиям S3)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024  # Байт
+
 # Поддерживаемые форматы изображения
 PHOTO_FORMATS: set[str] = {"png", "jpg", "jpeg"}
 DOCUMENT_FORMATS: set[str] = {"doc", "docx", "pdf"}
@@ -40,9 +47,43 @@ DAYS_EXPIRE = 3
 
 ADMIN_USERNAMES: list[str] = []
 
+# Время жизни незаполненных FSM форм в Redis
+FSM_STATE_TTL = 60 * 60 * 24  # Секунд
+FSM_DATA_TTL = 60 * 60 * 24   # Секунд
+
+# Парные заезды
+BRACKET_SIZES: set[int] = {16, 32}  # Размер сетки (Top-16 / Top-32)
+JUDGES_COUNT = 3                    # Судей, голосующих в каждом заезде
+
+# Ограничения Telegram Bot API на отправку сообщений
+TELEGRAM_GLOBAL_RATE = 30  # Сообщений в секунду на бота
+TELEGRAM_CHAT_RATE = 1     # Сообщений в секунду в один чат
+
+# Рассылка обновлений таблицы квалификации
+FANOUT_COALESCE_DELAY = 1.0  # Секунд: обновления таблицы за это время объединяются в одно редактирование
+FANOUT_WORKERS = 4           # Одновременных запросов к Telegram
+LEADERBOARD_SIZE = 32        # Строк в сообщении с таблицей
+
+# Отложенные рассылки
+STAGE_REMINDER_HOURS = 24     # За сколько часов до этапа напомнить участникам
+SCHEDULER_POLL_INTERVAL = 5   # Секунд между проверками очереди задач
+SCHEDULER_BATCH_SIZE = 4      # Задач, забираемых за одну проверку и выполняемых одновременно
+SCHEDULER_LEASE = 5 * 60      # Секунд: задача, аренду которой воркер не продлил, возвращается в очередь
+SCHEDULER_RETRY_DELAY = 60    # Секунд до повтора упавшей задачи
+SCHEDULER_MAX_ATTEMPTS = 5    # Неудачных запусков, после которых задача удаляется
+BROADCAST_BATCH_SIZE = 30     # Получателей, которым сообщения отправляются одновременно (~1 секунда лимита)
+
+# Номера пилотов
+MIN_PILOT_NUMBER = 1
+MAX_PILOT_NUMBER = 999
+NUMBER_POOL_TTL = 60 * 60 * 24  # Секунд: пул пересобирается из БД, номера, потерянные при сбоях, возвращаются
+
+# Массовый импорт / экспорт
+BULK_CHUNK_SIZE = 500  # Строк в одной транзакции (и в одной пачке при потоковом экспорте)
+
 # Кеширование
-MAX_SIZE = 1000
-TTL = 1
+MAX_SIZE = 1000  # Максимальное количество записей в памяти
+TTL = 1          # Минут
 
 # Соревнования
 MIN_STAGES_COUNT = 1
@@ -1,12 +1,14 @@
-from typing import Generic, TypeVar, Optional, Any, Protocol
+from typing import Generic, TypeVar, Optional, Any, Protocol, Sequence
+from collections.abc import AsyncIterator, AsyncIterable, Awaitable, Callable, Iterable
 
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, date
 
 from pydantic import BaseModel
 
-from .domain import Stage, Championship
-from .dto import ActiveChampionship
+from .enums import EntityKind, Role
+from .domain import Stage, Championship, FileMetadata, Qualification, CriterionScore, ScoringJudge, Bracket, Job
+from .dto import ActiveChampionship, ChampionshipsPage, BroadcastReport, LeaderboardEntry
 
 
 T = TypeVar("T", bound=BaseModel)
@@ -31,19 +33,213 @@ class ParticipantRepository(CRUDRepository[T]):
 class ChampionshipRepository(CRUDRepository[Championship]):
     async def get_active(self) -> list[ActiveChampionship]: pass
 
-    async def paginate(self, page: int, limit: int, is_active: bool = True) -> list[Championship]: pass
+    async def paginate(
+            self,
+            limit: int,
+            cursor: Optional[int] = None,
+            forward: bool = True,
+            is_active: bool = True
+    ) -> ChampionshipsPage:
+        """
+            Keyset пагинация по ID.
+
+            :param cursor: ID крайнего чемпионата предыдущей страницы (None - первая страница)
+            :param forward: Направление: после cursor (True) или перед ним (False)
+        """
+        pass
 
-    async def count(self) -> int: pass
+    async def count(self, is_active: bool = True) -> int: pass
 
     async def get_stages(self, id: int) -> list[Stage]: pass
 
-    async def get_by_user(self, user_id: int) -> list[Championship]: pass
+    async def get_by_user_id(self, user_id: int) -> list[Championship]: pass
 
 
 class StageRepository(CRUDRepository[Stage]):
     async def get_nearest(self, championship_id: int, date: datetime) -> Optional[Stage]: pass
 
-    async def get_by_date(self, championship_id: int, date: datetime) -> Optional[Stage]: pass
+    async def get_by_date(self, championship_id: int, date: datetime) -> list[Stage]:
+        """Этапы чемпионата в календарный день date (время не учитывается)."""
+        pass
+
+    async def get_stage_days(self, championship_id: int, start: datetime, end: datetime) -> list[date]:
+        """Дни этапов чемпионата в диапазоне [start, end), без загрузки самих этапов."""
+        pass
+
+    async def get_pilot_numbers(self, id: int) -> list[int]: pass
+
+
+class FileMetadataRepository(CRUDRepository[FileMetadata]):
+    async def set_telegram_file_id(self, id: int, telegram_file_id: str) -> Optional[tuple[str, int]]:
+        """Сохраняет Telegram file_id, возвращает (parent_type, parent_id) файла (None - файла нет)."""
+        pass
+
+
+class QualificationRepository:
+    async def add_points(self, score: ScoringJudge) -> Optional[Qualification]:
+        """Записывает баллы судьи за критерий, возвращает попытку с пересчитанной суммой (None - нет пилота)."""
+        pass
+
+    async def get_by_stage(self, stage_id: int) -> list[CriterionScore]:
+        """Баллы этапа по критериям: каждая попытка пилота - строка на каждый критерий."""
+        pass
+
+
+class BracketRepository:
+    async def get(self, stage_id: int) -> Optional[Bracket]: pass
+
+    async def create(self, bracket: Bracket) -> None:
+        """Сохраняет новую сетку этапа; уже начатая сетка не перезаписывается (BracketError)."""
+        pass
+
+    async def modify(self, stage_id: int, change: Callable[[Bracket], Any]) -> Any:
+        """Атомарно применяет change к сетке (голоса с разных воркеров не теряются), возвращает его результат."""
+        pass
+
+
+class SubscriptionRepository:
+    async def subscribe(self, stage_id: int, chat_id: int, message_id: int) -> None:
+        """Подписывает чат на таблицу этапа, message_id - закреплённое сообщение, которое будет обновляться."""
+        pass
+
+    async def unsubscribe(self, stage_id: int, chat_id: int) -> None: pass
+
+    async def get_subscribers(self, stage_id: int) -> dict[int, int]:
+        """Возвращает словарь chat_id -> message_id."""
+        pass
+
+
+class LeaderboardRepository:
+    async def exists(self, stage_id: int) -> bool: pass
+
+    async def fill(self, stage_id: int, scores: Iterable[CriterionScore]) -> None:
+        """Собирает таблицу этапа из оценок БД, если её ещё нет (повторный вызов ничего не меняет)."""
+        pass
+
+    async def update(self, score: CriterionScore) -> int:
+        """Записывает баллы пилота за критерий попытки, возвращает его новое место."""
+        pass
+
+    async def top(self, stage_id: int, limit: Optional[int] = None) -> list[LeaderboardEntry]: pass
+
+    async def mark_changed(self, stage_id: int) -> None: pass
+
+    async def pop_changed(self) -> list[int]:
+        """Забирает этапы, изменившиеся с прошлого вызова; каждый этап получает только один воркер."""
+        pass
+
+
+class LeaderboardNotifier(ABC):
+    @abstractmethod
+    async def notify(self, stage_id: int) -> None:
+        """Сообщает, что таблица этапа изменилась (без ожидания рассылки, её сделает любой воркер бота)."""
+        pass
+
+
+class NumberPool:
+    async def exists(self, stage_id: int) -> bool: pass
+
+    async def fill(self, stage_id: int, numbers: Iterable[int]) -> None:
+        """Заполняет пул свободных номеров этапа, если его ещё нет (повторный вызов ничего не меняет)."""
+        pass
+
+    async def pop(self, stage_id: int) -> Optional[int]:
+        """Забирает случайный свободный номер; None - пул пуст или не создан."""
+        pass
+
+    async def push(self, stage_id: int, number: int) -> None:
+        """Возвращает номер в пул."""
+        pass
+
+    async def remove(self, stage_id: int, numbers: Iterable[int]) -> None:
+        """Убирает из пула номера, занятые в обход pop (если пула нет, ничего не делает)."""
+        pass
+
+    async def drop(self, stage_id: int) -> None:
+        """Удаляет пул этапа (следующая выдача соберёт его заново)."""
+        pass
+
+
+class JobRepository:
+    async def schedule(self, job: Job, run_at: datetime) -> None:
+        """Планирует задачу (уже запланированная с тем же ключом переносится на run_at)."""
+        pass
+
+    async def cancel(self, *jobs: Job) -> None: pass
+
+    async def claim_due(self, now: datetime, limit: int, lease_until: datetime) -> list[Job]:
+        """
+            Переводит наступившие задачи в обработку до lease_until; каждую задачу получает только один воркер.
+            Задача остаётся в обработке, пока её не завершат (complete) или не вернут в очередь (retry, requeue_expired).
+        """
+        pass
+
+    async def extend(self, job: Job, lease_until: datetime) -> None: pass
+
+    async def complete(self, job: Job) -> None: pass
+
+    async def fail(self, job: Job) -> int:
+        """Учитывает неудачный запуск задачи, возвращает их общее число."""
+        pass
+
+    async def retry(self, job: Job, run_at: datetime) -> None:
+        """Возвращает задачу из обработки в очередь на run_at."""
+        pass
+
+    async def requeue_expired(self, now: datetime) -> int:
+        """Возвращает в очередь задачи с истёкшей арендой (воркер упал или перезапустился)."""
+        pass
+
+    async def get_cursor(self, job: Job) -> Optional[int]:
+        """Последний user_id, до которого дошла рассылка задачи (None - с начала); сбрасывается в complete."""
+        pass
+
+    async def save_cursor(self, job: Job, user_id: int) -> None: pass
+
+
+class RecipientRepository:
+    def stream_stage_participants(
+            self,
+            stage_id: int,
+            chunk_size: int,
+            after_user_id: Optional[int] = None
+    ) -> AsyncIterator[list[int]]:
+        """Пачки user_id судей и пилотов этапа по возрастанию, начиная после after_user_id."""
+        pass
+
+    def stream_users(
+            self,
+            roles: Sequence[Role],
+            chunk_size: int,
+            after_user_id: Optional[int] = None
+    ) -> AsyncIterator[list[int]]:
+        """Пачки user_id пользователей с указанными ролями по возрастанию, начиная после after_user_id."""
+        pass
+
+
+class MessageSender(ABC):
+    @abstractmethod
+    async def broadcast(
+            self,
+            recipients: AsyncIterable[Sequence[int]],
+            text: str,
+            on_progress: Optional[Callable[[int], Awaitable[None]]] = None
+    ) -> BroadcastReport:
+        """
+            Рассылает text пачкам получателей (по возрастанию user_id) в пределах лимитов Telegram.
+            После каждой отправленной пачки вызывает on_progress с последним user_id пачки.
+        """
+        pass
+
+
+class BulkRepository:
+    async def insert_many(self, kind: EntityKind, models: Sequence[BaseModel]) -> list[int]:
+        """Записывает пачку моделей одной транзакцией, возвращает ID созданных записей в порядке моделей."""
+        pass
+
+    def stream_season(self, championship_id: int, chunk_size: int) -> AsyncIterator[dict[str, Any]]:
+        """Потоково отдаёт чемпионат, его этапы и пилотов в виде словарей с ключом kind."""
+        pass
 
 
 class FileStorage(ABC):
@@ -56,8 +252,35 @@ class FileStorage(ABC):
             metadata: Optional[dict[str, Any]] = None
     ) -> None: pass
 
+    @abstractmethod
+    async def upload_stream(self, chunks: AsyncIterator[bytes], key: str, bucket: str) -> int:
+        """Потоково загружает файл, возвращает количество загруженных байт."""
+        pass
+
     @abstractmethod
     async def download_file(self, key: str, bucket: str) -> Optional[bytes]: pass
 
+    @abstractmethod
+    def stream_file(self, key: str, bucket: str, chunk_size: int) -> AsyncIterator[bytes]: pass
+
     @abstractmethod
     async def remove_file(self, key: str, bucket: str) -> None: pass
+
+
+class Cache(ABC):
+    """Кеш для JSON-сериализуемых значений."""
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]: pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Сохраняет значение, ttl в секундах (по умолчанию - ttl кеша)."""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: pass
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> None:
+        """Удаляет все ключи, начинающиеся с prefix."""
+        pass
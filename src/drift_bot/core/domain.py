@@ -1,10 +1,11 @@
 from typing import Optional, Literal
+from collections.abc import AsyncIterator
 
 from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, model_validator, Field, field_validator
 
-from .enums import Role, Criterion, CarType, FileType, QualificationAttempt
+from .enums import Role, Criterion, CarType, FileType, QualificationAttempt, JobKind
 
 from ..constants import (
     BOT_URL,
@@ -23,17 +24,33 @@ class FileMetadata(BaseModel):
     format: str               # Формат файла / расширение
     type: FileType            # Тип файла
     uploaded_date: datetime   # Дата загрузки
+    telegram_file_id: Optional[str] = None  # ID файла в Telegram для повторной отправки без загрузки
 
     model_config = ConfigDict(from_attributes=True)
 
 
 class File(BaseModel):
-    data: bytes
+    data: Optional[bytes] = None      # Содержимое файла (если загружено в память)
     file_name: str
+    file_size: Optional[int] = None   # Размер в байтах, известный без чтения содержимого
+    chunks: Optional[AsyncIterator[bytes]] = Field(default=None, exclude=True, repr=False)  # Поток содержимого
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @model_validator(mode="after")
+    def check_content(self) -> "File":
+        if self.data is None and self.chunks is None:
+            raise ValueError("File data or chunks stream required")
+        return self
+
+    @property
+    def is_streamed(self) -> bool:
+        return self.chunks is not None
 
     @property
     def size(self) -> float:
-        return round(len(self.data) / (1024 * 1024), 2)
+        size = self.file_size if self.file_size is not None else len(self.data or b"")
+        return round(size / (1024 * 1024), 2)
 
     @property
     def format(self) -> str:
@@ -141,7 +158,8 @@ class Pilot(Participant):
     number: int                 # Номер пилота получаемый при регистрации
 
     @field_validator("cars")
-    def check_drift_car(self, cars: list[Car]) -> list[Car]:
+    @classmethod
+    def check_drift_car(cls, cars: list[Car]) -> list[Car]:
         drift_car = next((car for car in cars if car.type == CarType.DRIFT), None)
         if not drift_car:
             raise ValueError("Drift car fill required")
@@ -157,12 +175,16 @@ class Qualification(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class ScoringJudge(BaseModel):
-    stage_id: int         # Текущий этап
-    judge_id: int         # ID судьи
-    pilot_number: int     # Номер пилота
-    criterion: Criterion  # Критерий за который ставится оценка
-    points: float         # Баллы за критерий
+class CriterionScore(BaseModel):
+    stage_id: int                  # Текущий этап
+    pilot_number: int              # Номер пилота
+    attempt: QualificationAttempt  # Оцениваемая попытка
+    criterion: Criterion           # Критерий за который ставится оценка
+    points: float                  # Баллы за критерий
+
+
+class ScoringJudge(CriterionScore):
+    judge_id: int                  # ID судьи
 
 
 class Heat(BaseModel):
@@ -176,3 +198,35 @@ class VotingJudge(BaseModel):
     judge_id: int
     heat: Heat
     decision: int | Literal["OMT"]
+
+
+class Bracket(BaseModel):
+    """
+        Сетка парных заездов в компактном виде (дерево в массиве, как у двоичной кучи).
+        winners[1] - победитель финала, заезд k - winners[2k] против winners[2k + 1],
+        winners[size + i] - пилот на i-й позиции посева.
+    """
+    stage_id: int
+    size: int                                                    # Top-16 / Top-32
+    winners: list[int]                                           # 0 - не определён, -1 - пустое место (bye)
+    votes: dict[int, dict[int, int | Literal["OMT"]]] = Field(default_factory=dict)  # Заезд -> судья -> решение
+    reruns: dict[int, int] = Field(default_factory=dict)         # Заезд -> количество OMT
+
+    @property
+    def champion(self) -> Optional[int]:
+        return self.winners[1] if self.winners[1] > 0 else None
+
+
+class Job(BaseModel):
+    kind: JobKind  # Что отправить
+    stage_id: int  # Этап, к которому относится рассылка
+
+    @property
+    def key(self) -> str:
+        """Ключ задачи: повторное планирование того же события переносит задачу, а не дублирует её."""
+        return f"{self.kind}:{self.stage_id}"
+
+    @classmethod
+    def from_key(cls, key: str) -> "Job":
+        kind, stage_id = key.split(":")
+        return cls(kind=JobKind(kind), stage_id=int(stage_id))
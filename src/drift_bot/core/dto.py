@@ -1,4 +1,9 @@
-from pydantic import BaseModel, ConfigDict
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .enums import EntityKind
+from .domain import Heat
 
 
 class ActiveChampionship(BaseModel):
@@ -8,3 +13,51 @@ class ActiveChampionship(BaseModel):
     is_active: bool
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ChampionshipsPage(BaseModel):
+    """Страница чемпионатов вместе с общим количеством."""
+    championships: list[ActiveChampionship]
+    total: int  # Количество чемпионатов, подходящих под фильтр
+
+
+class RowError(BaseModel):
+    """Ошибка в строке импортируемого файла."""
+    line: int     # Номер строки (для CSV - без учёта заголовка)
+    message: str
+
+
+class BulkReport(BaseModel):
+    """Прогресс / итог массового импорта."""
+    kind: EntityKind
+    processed: int = 0  # Прочитано строк
+    created: int = 0    # Записано в БД
+    errors: list[RowError] = Field(default_factory=list)
+
+
+class LeaderboardEntry(BaseModel):
+    """Строка квалификационной таблицы."""
+    place: int
+    pilot_number: int
+    best_points: float    # Лучшая из двух попыток
+    second_points: float  # Вторая попытка (решает при равенстве лучших)
+
+
+class HeatResult(BaseModel):
+    """Состояние заезда после голоса судьи."""
+    heat: Heat
+    winner: Optional[int] = None  # Номер победителя, если заезд решён
+    omt: bool = False             # Судьи назначили перезаезд (one more time)
+    votes: int = 0                # Сколько судей уже проголосовало
+
+
+class BroadcastReport(BaseModel):
+    """Итог массовой рассылки."""
+    sent: int = 0         # Доставлено сообщений
+    failed: int = 0       # Не доставлено (бот заблокирован, чат удалён ...)
+    seconds: float = 0.0  # Длительность рассылки
+
+    @property
+    def rate(self) -> float:
+        """Сообщений в секунду."""
+        return self.sent / self.seconds if self.seconds else 0.0
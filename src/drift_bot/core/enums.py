@@ -32,3 +32,17 @@ class QualificationAttempt(IntEnum):
     """Квалификационная попытка"""
     first = auto()
     second = auto()
+
+
+class EntityKind(StrEnum):
+    """Тип сущности при массовом импорте / экспорте"""
+    CHAMPIONSHIP = "CHAMPIONSHIP"
+    STAGE = "STAGE"
+    PILOT = "PILOT"
+
+
+class JobKind(StrEnum):
+    """Тип отложенной рассылки"""
+    STAGE_REMINDER = "STAGE_REMINDER"            # Напоминание участникам о скором этапе
+    REGISTRATION_OPENED = "REGISTRATION_OPENED"  # Регистрация на этап открыта
+    REGISTRATION_CLOSED = "REGISTRATION_CLOSED"  # Регистрация на этап закрыта
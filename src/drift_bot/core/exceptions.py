@@ -45,6 +45,11 @@ class ServiceError(Exception):
     pass
 
 
+class BracketError(ServiceError):
+    """Голос не относится ни к одному из текущих заездов сетки"""
+    pass
+
+
 class CodeExpiredError(ServiceError):
     """Истёк реферальный код."""
     pass
@@ -1,16 +1,60 @@
-from typing import Sequence, Optional, Generic, TypeVar, Protocol
+from typing import Sequence, Optional, Generic, TypeVar, Protocol, Any
+from collections.abc import Awaitable, Callable, Iterable, AsyncIterable, AsyncIterator
 
-import random
+import logging
+import asyncio
 import secrets
 from datetime import datetime, timedelta
 
-from .enums import Role
-from .base import FileStorage, CRUDRepository
-from .domain import Referral, File, FileMetadata
-from .exceptions import RanOutNumbersError, CodeExpiredError
+from pydantic import BaseModel, ValidationError
 
-from ..constants import CODE_LENGTH, DAYS_EXPIRE
+from .enums import Role, FileType, EntityKind, JobKind
+from .base import (
+    FileStorage,
+    CRUDRepository,
+    FileMetadataRepository,
+    BulkRepository,
+    QualificationRepository,
+    BracketRepository,
+    LeaderboardRepository,
+    LeaderboardNotifier,
+    NumberPool,
+    StageRepository,
+    JobRepository,
+    RecipientRepository,
+    MessageSender
+)
+from .domain import (
+    Referral,
+    File,
+    FileMetadata,
+    Championship,
+    Stage,
+    Pilot,
+    Qualification,
+    ScoringJudge,
+    Bracket,
+    Heat,
+    VotingJudge,
+    Job
+)
+from .dto import BulkReport, RowError, LeaderboardEntry, HeatResult, BroadcastReport
+from .exceptions import RanOutNumbersError, CodeExpiredError, RepositoryError, FileStorageError, BracketError
+
+from ..constants import (
+    CODE_LENGTH,
+    DAYS_EXPIRE,
+    MAX_CONCURRENT_FILE_OPERATIONS,
+    CHUNK_SIZE,
+    BULK_CHUNK_SIZE,
+    BRACKET_SIZES,
+    JUDGES_COUNT,
+    STAGE_REMINDER_HOURS,
+    MIN_PILOT_NUMBER,
+    MAX_PILOT_NUMBER
+)
 from ..utils import generate_file_name
+from ..templates import STAGE_REMINDER_TEMPLATE, REGISTRATION_OPENED_TEMPLATE, REGISTRATION_CLOSED_TEMPLATE
 
 
 class ModelWithFiles(Protocol):
@@ -18,65 +62,204 @@ class ModelWithFiles(Protocol):
 
 
 T = TypeVar("T", bound=ModelWithFiles)
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
 
 
 class NumberGenerator:
-    def __init__(self, start: int, end: int) -> None:
+    """
+        Выдаёт уникальные номера пилотов этапа из пула свободных номеров.
+        Пул создаётся при первой выдаче из номеров, ещё не занятых в БД.
+    """
+    def __init__(self, number_pool: NumberPool, start: int = MIN_PILOT_NUMBER, end: int = MAX_PILOT_NUMBER) -> None:
+        self._number_pool = number_pool
         self._start = start
         self._end = end
 
-    async def generate(self, used_numbers: Sequence[int]) -> int:
+    async def generate(self, stage_id: int, get_used_numbers: Callable[[], Awaitable[Iterable[int]]]) -> int:
         """Генерирует уникальный и неповторяющийся номер"""
-        if len(used_numbers) >= (self._end - self._start + 1):
+        number = await self._number_pool.pop(stage_id)
+        if number is None and not await self._number_pool.exists(stage_id):
+            used_numbers = set(await get_used_numbers())
+            await self._number_pool.fill(
+                stage_id,
+                (number for number in range(self._start, self._end + 1) if number not in used_numbers)
+            )
+            number = await self._number_pool.pop(stage_id)
+        if number is None:
             raise RanOutNumbersError("Ran out of numbers")
-        while True:
-            number = random.randint(self._start, self._end)
-            if number not in used_numbers:
-                return number
+        return number
+
+    async def release(self, stage_id: int, number: int) -> None:
+        """Возвращает номер пилота, покинувшего этап, для повторной выдачи."""
+        if self._start <= number <= self._end:
+            await self._number_pool.push(stage_id, number)
+
+    async def reserve(self, stage_id: int, numbers: Iterable[int]) -> None:
+        """Убирает из пула номера, записанные в БД в обход generate (массовый импорт)."""
+        await self._number_pool.remove(stage_id, numbers)
+
+    async def drop(self, stage_id: int) -> None:
+        """Удаляет пул номеров удалённого этапа."""
+        await self._number_pool.drop(stage_id)
+
+
+class LazyFile:
+    """Дескриптор файла: метаданные доступны сразу, содержимое загружается только по требованию."""
+    def __init__(self, metadata: FileMetadata, file_storage: FileStorage) -> None:
+        self._metadata = metadata
+        self._file_storage = file_storage
+        self._file: Optional[File] = None
+
+    @property
+    def metadata(self) -> FileMetadata:
+        return self._metadata
+
+    @property
+    def type(self) -> FileType:
+        return self._metadata.type
+
+    async def read(self) -> File:
+        """Загружает содержимое файла целиком (результат кешируется)."""
+        if self._file is None:
+            data = await self._file_storage.download_file(key=self._metadata.key, bucket=self._metadata.bucket)
+            self._file = File(data=data, file_name=self._metadata.key)
+        return self._file
+
+    def stream(self, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Потоково читает содержимое файла, не держа его в памяти целиком."""
+        return self._file_storage.stream_file(
+            key=self._metadata.key,
+            bucket=self._metadata.bucket,
+            chunk_size=chunk_size
+        )
 
 
 class CRUDService(Generic[T]):
     def __init__(
             self,
             crud_repository: CRUDRepository[T],
-            file_storage: FileStorage
+            file_storage: FileStorage,
+            max_concurrency: int = MAX_CONCURRENT_FILE_OPERATIONS
     ) -> None:
         self._crud_repository = crud_repository
         self._file_storage = file_storage
+        self._max_concurrency = max_concurrency
+
+    async def _gather_limited(self, coroutines: Iterable[Awaitable[R]]) -> list[R | BaseException]:
+        """Выполняет операции с хранилищем конкурентно, но не более max_concurrency одновременно."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run(coroutine: Awaitable[R]) -> R:
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(
+            *(run(coroutine) for coroutine in coroutines),
+            return_exceptions=True
+        )
+
+    async def _upload_file(self, file: File, bucket: str) -> FileMetadata:
+        key = generate_file_name(file.format)
+        size = file.size
+        if file.is_streamed:
+            uploaded = await self._file_storage.upload_stream(chunks=file.chunks, key=key, bucket=bucket)
+            size = round(uploaded / (1024 * 1024), 2)
+        else:
+            await self._file_storage.upload_file(data=file.data, key=key, bucket=bucket)
+        return FileMetadata(
+            key=key,
+            bucket=bucket,
+            size=size,
+            format=file.format,
+            type=file.type,
+            uploaded_date=datetime.now()
+        )
+
+    async def _upload_files(self, files: list[File], bucket: str) -> list[FileMetadata]:
+        """Загружает файлы, при частичной ошибке удаляет уже загруженные."""
+        results = await self._gather_limited(self._upload_file(file, bucket) for file in files)
+        files_metadata = [result for result in results if isinstance(result, FileMetadata)]
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            try:
+                await self._remove_files(files_metadata)
+            except FileStorageError as e:
+                # Ошибка очистки не должна скрывать исходную ошибку загрузки
+                logger.error(f"Error while removing uploaded files after failed upload: {e}")
+            raise errors[0]
+        return files_metadata
+
+    async def _remove_files(self, files: list[FileMetadata]) -> None:
+        results = await self._gather_limited(
+            self._file_storage.remove_file(key=file.key, bucket=file.bucket)
+            for file in files
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
 
     async def create(
             self, model: T,
             files: Optional[list[File]] = None,
             bucket: Optional[str] = None
     ) -> T:
-        files_metadata: list[FileMetadata] = []
-        if files:
-            for file in files:
-                key = generate_file_name(file.format)
-                await self._file_storage.upload_file(data=file.data, key=key, bucket=bucket)
-                file_metadata = FileMetadata(
-                    key=key,
-                    bucket=bucket,
-                    size=file.size,
-                    format=file.format,
-                    type=file.type,
-                    uploaded_date=datetime.now()
-                )
-                files_metadata.append(file_metadata)
+        files_metadata = await self._upload_files(files, bucket) if files else []
         model.files = files_metadata
-        created_model = await self._crud_repository.create(model)
+        try:
+            created_model = await self._crud_repository.create(model)
+        except RepositoryError:
+            # Откатываем загруженные объекты, чтобы не оставлять "сирот" в хранилище
+            try:
+                await self._remove_files(files_metadata)
+            except FileStorageError as e:
+                logger.error(f"Error while rolling back uploaded files: {e}")
+            raise
         return created_model
 
-    async def read(self, id: int | str) -> tuple[T, Optional[list[File]]]:
+    async def read_lazy(
+            self,
+            id: int | str,
+            file_types: Optional[set[FileType]] = None
+    ) -> Optional[tuple[T, list[LazyFile]]]:
+        """
+            Читает модель без загрузки содержимого файлов.
+
+            :param id: ID модели
+            :param file_types: Типы файлов, которые нужно вернуть (None - все)
+        """
         model = await self._crud_repository.read(id)
         if not model:
             return None
-        if not model.files:
-            return model
+        files = [
+            LazyFile(file, self._file_storage)
+            for file in model.files
+            if file is not None and (file_types is None or file.type in file_types)
+        ]
+        return model, files
+
+    async def read(
+            self,
+            id: int | str,
+            file_types: Optional[set[FileType]] = None
+    ) -> Optional[tuple[T, list[File]]]:
+        """
+            Читает модель и загружает содержимое только выбранных файлов.
+
+            :param id: ID модели
+            :param file_types: Типы файлов, которые нужно загрузить (None - все)
+        """
+        result = await self.read_lazy(id, file_types)
+        if result is None:
+            return None
+        model, lazy_files = result
+        results = await self._gather_limited(lazy_file.read() for lazy_file in lazy_files)
         files: list[File] = []
-        for file in model.files:
-            data = await self._file_storage.download_file(key=file.key, bucket=file.bucket)
-            files.append(File(data=data, file_name=file.key))
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            files.append(result)
         return model, files
 
     async def delete(self, id: int | str) -> bool:
@@ -85,11 +268,395 @@ class CRUDService(Generic[T]):
             return False
         is_deleted = await self._crud_repository.delete(id)
         if model.files:
-            for file in model.files:
-                await self._file_storage.remove_file(key=file.key, bucket=file.bucket)
+            await self._remove_files(model.files)
         return is_deleted
 
 
+class FileService:
+    """Доступ к файлам с учётом кеша Telegram file_id."""
+    def __init__(
+            self,
+            file_storage: FileStorage,
+            file_metadata_repository: FileMetadataRepository,
+            max_concurrency: int = MAX_CONCURRENT_FILE_OPERATIONS
+    ) -> None:
+        self._file_storage = file_storage
+        self._file_metadata_repository = file_metadata_repository
+        self._max_concurrency = max_concurrency
+
+    async def download(self, file_metadata: FileMetadata) -> File:
+        return await LazyFile(file_metadata, self._file_storage).read()
+
+    async def prefetch(self, files: Iterable[Optional[FileMetadata]]) -> dict[str, File]:
+        """
+            Конкурентно (не более max_concurrency одновременно) скачивает файлы, которых ещё нет в Telegram.
+            Возвращает key -> файл, не скачанные файлы пропускаются.
+        """
+        to_download = {file.key: file for file in files if file and not file.telegram_file_id}
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def download(file_metadata: FileMetadata) -> File:
+            async with semaphore:
+                return await self.download(file_metadata)
+
+        results = await asyncio.gather(*map(download, to_download.values()), return_exceptions=True)
+        downloaded = {}
+        for key, result in zip(to_download, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error while prefetching file {key}: {result}")
+            else:
+                downloaded[key] = result
+        return downloaded
+
+    async def cache_telegram_file_id(self, file_metadata: FileMetadata, telegram_file_id: str) -> None:
+        """Запоминает file_id, полученный от Telegram после первой отправки файла."""
+        if file_metadata.id is None or file_metadata.telegram_file_id == telegram_file_id:
+            return
+        await self._file_metadata_repository.set_telegram_file_id(file_metadata.id, telegram_file_id)
+        file_metadata.telegram_file_id = telegram_file_id
+
+
+class BulkService:
+    """Массовый импорт строк CSV / JSONL и потоковый экспорт сезона."""
+    KIND2MODEL: dict[EntityKind, type[BaseModel]] = {
+        EntityKind.CHAMPIONSHIP: Championship,
+        EntityKind.STAGE: Stage,
+        EntityKind.PILOT: Pilot
+    }
+
+    def __init__(
+            self,
+            bulk_repository: BulkRepository,
+            notification_service: "NotificationService",
+            number_generator: NumberGenerator,
+            chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        self._bulk_repository = bulk_repository
+        self._notification_service = notification_service
+        self._number_generator = number_generator
+        self._chunk_size = chunk_size
+
+    @staticmethod
+    def _check(model: BaseModel) -> Optional[str]:
+        """Поля, которые домен допускает пустыми, а таблица - нет."""
+        if isinstance(model, Pilot):
+            for car in model.cars:
+                if car.hp is None:
+                    return f"Car {car.name!r}: hp is required"
+                if not car.name.strip():
+                    return "Car name is required"
+        return None
+
+    async def _after_insert(self, kind: EntityKind, ids: Sequence[int], models: Sequence[BaseModel]) -> None:
+        """То же, что делают обычные обработчики после создания: напоминания этапов и номера пилотов."""
+        if kind == EntityKind.STAGE:
+            for id, stage in zip(ids, models):
+                await self._notification_service.schedule_reminder(stage.model_copy(update={"id": id}))
+        elif kind == EntityKind.PILOT:
+            numbers: dict[int, list[int]] = {}
+            for pilot in models:
+                numbers.setdefault(pilot.stage_id, []).append(pilot.number)
+            for stage_id, stage_numbers in numbers.items():
+                await self._number_generator.reserve(stage_id, stage_numbers)
+
+    async def import_rows(
+            self,
+            kind: EntityKind,
+            rows: AsyncIterable[dict[str, Any]],
+            on_progress: Optional[Callable[[BulkReport], Awaitable[None]]] = None
+    ) -> BulkReport:
+        """
+            Валидирует строки доменной моделью и записывает их пачками по chunk_size.
+            Невалидные строки и пачки, которые не удалось записать, попадают в отчёт, импорт продолжается.
+        """
+        model_type = self.KIND2MODEL[kind]
+        report = BulkReport(kind=kind)
+        chunk: list[tuple[int, BaseModel]] = []
+
+        async def flush() -> None:
+            models = [model for _, model in chunk]
+            try:
+                ids = await self._bulk_repository.insert_many(kind, models)
+            except RepositoryError as e:
+                logger.error(f"Error while importing lines {chunk[0][0]}-{chunk[-1][0]}: {e}")
+                report.errors.extend(RowError(line=line, message=str(e)) for line, _ in chunk)
+            else:
+                report.created += len(ids)
+                await self._after_insert(kind, ids, models)
+            chunk.clear()
+            if on_progress:
+                await on_progress(report)
+
+        line = 0
+        async for row in rows:
+            line += 1
+            report.processed += 1
+            try:
+                model = model_type.model_validate(row)
+            except ValidationError as e:
+                report.errors.append(RowError(line=line, message=str(e)))
+                continue
+            error = self._check(model)
+            if error:
+                report.errors.append(RowError(line=line, message=error))
+                continue
+            chunk.append((line, model))
+            if len(chunk) >= self._chunk_size:
+                await flush()
+        if chunk:
+            await flush()
+        return report
+
+    def export_season(self, championship_id: int) -> AsyncIterator[dict[str, Any]]:
+        return self._bulk_repository.stream_season(championship_id, chunk_size=self._chunk_size)
+
+
+class QualificationService:
+    """Таблица этапа общая для всех воркеров и собирается из оценок в БД при первом обращении."""
+    def __init__(
+            self,
+            qualification_repository: QualificationRepository,
+            leaderboards: LeaderboardRepository,
+            notifier: Optional[LeaderboardNotifier] = None
+    ) -> None:
+        self._qualification_repository = qualification_repository
+        self._leaderboards = leaderboards
+        self._notifier = notifier
+
+    async def _ensure_leaderboard(self, stage_id: int) -> None:
+        if not await self._leaderboards.exists(stage_id):
+            scores = await self._qualification_repository.get_by_stage(stage_id)
+            await self._leaderboards.fill(stage_id, scores)
+
+    async def get_leaderboard(self, stage_id: int, limit: Optional[int] = None) -> list[LeaderboardEntry]:
+        await self._ensure_leaderboard(stage_id)
+        return await self._leaderboards.top(stage_id, limit)
+
+    async def submit(self, score: ScoringJudge) -> Optional[Qualification]:
+        """Сохраняет оценку судьи в БД и её же (баллы за критерий) в таблице этапа, сумму попытки Redis считает сам."""
+        qualification = await self._qualification_repository.add_points(score)
+        if not qualification:
+            logger.warning(f"Pilot {score.pilot_number} not found on stage {score.stage_id}")
+            return None
+        await self._ensure_leaderboard(score.stage_id)
+        await self._leaderboards.update(score)
+        if self._notifier:
+            await self._notifier.notify(score.stage_id)
+        return qualification
+
+
+UNDECIDED, BYE = 0, -1  # Значения winners в сетке без пилота
+
+
+def seed_order(size: int) -> list[int]:
+    """Порядок посева по сетке: 1-16, 8-9, 5-12, ... (сильнейшие встречаются как можно позже)."""
+    order = [1]
+    while len(order) < size:
+        order = [seed for position in order for seed in (position, 2 * len(order) + 1 - position)]
+    return order
+
+
+class BracketEngine:
+    """Чистые функции над сеткой: посев, пересчёт, список заездов и подсчёт голосов."""
+    @staticmethod
+    def seed(stage_id: int, pilot_numbers: Sequence[int], size: int) -> Bracket:
+        """Строит сетку по номерам пилотов в порядке мест квалификации; недостающие места - bye."""
+        if size not in BRACKET_SIZES:
+            raise ValueError(f"Unsupported bracket size: {size}")
+        winners = [UNDECIDED] * (2 * size)
+        for position, seed in enumerate(seed_order(size)):
+            winners[size + position] = pilot_numbers[seed - 1] if seed <= len(pilot_numbers) else BYE
+        bracket = Bracket(stage_id=stage_id, size=size, winners=winners)
+        BracketEngine.resolve(bracket)
+        return bracket
+
+    @staticmethod
+    def resolve(bracket: Bracket) -> None:
+        """Проводит пилотов без соперника (bye) дальше по сетке. O(size)."""
+        winners = bracket.winners
+        for node in range(bracket.size - 1, 0, -1):
+            if winners[node] != UNDECIDED:
+                continue
+            first, second = winners[2 * node], winners[2 * node + 1]
+            if first == BYE and second != UNDECIDED:
+                winners[node] = second
+            elif second == BYE and first != UNDECIDED:
+                winners[node] = first
+
+    @staticmethod
+    def heat(bracket: Bracket, node: int) -> Heat:
+        return Heat(
+            stage_id=bracket.stage_id,
+            first_pilot_number=bracket.winners[2 * node],
+            second_pilot_number=bracket.winners[2 * node + 1]
+        )
+
+    @staticmethod
+    def is_ready(bracket: Bracket, node: int) -> bool:
+        """Оба соперника известны, а заезд ещё не решён."""
+        winners = bracket.winners
+        return winners[node] == UNDECIDED and winners[2 * node] > 0 and winners[2 * node + 1] > 0
+
+    @staticmethod
+    def ready_nodes(bracket: Bracket) -> list[int]:
+        """Заезды, которые можно проводить, по раундам и сверху вниз по сетке."""
+        nodes: list[int] = []
+        level = bracket.size // 2
+        while level >= 1:
+            nodes.extend(node for node in range(level, 2 * level) if BracketEngine.is_ready(bracket, node))
+            level //= 2
+        return nodes
+
+    @staticmethod
+    def find_node(bracket: Bracket, heat: Heat) -> int:
+        pair = {heat.first_pilot_number, heat.second_pilot_number}
+        for node in BracketEngine.ready_nodes(bracket):
+            if {bracket.winners[2 * node], bracket.winners[2 * node + 1]} == pair:
+                return node
+        raise BracketError(f"Heat {heat.first_pilot_number} vs {heat.second_pilot_number} is not running")
+
+    @staticmethod
+    def vote(bracket: Bracket, vote: VotingJudge, judges_count: int = JUDGES_COUNT) -> HeatResult:
+        """
+            Учитывает голос судьи. Когда проголосовали все судьи: пилот с большинством голосов проходит дальше,
+            иначе (большинство за OMT или голоса разделились) назначается перезаезд и голосование начинается заново.
+        """
+        node = BracketEngine.find_node(bracket, vote.heat)
+        heat = BracketEngine.heat(bracket, node)
+        if vote.decision != "OMT" and vote.decision not in (heat.first_pilot_number, heat.second_pilot_number):
+            raise BracketError(f"Pilot {vote.decision} does not ride in this heat")
+        votes = bracket.votes.setdefault(node, {})
+        votes[vote.judge_id] = vote.decision
+        if len(votes) < judges_count:
+            return HeatResult(heat=heat, votes=len(votes))
+        decisions = list(votes.values())
+        winner = next(
+            (
+                pilot_number
+                for pilot_number in (heat.first_pilot_number, heat.second_pilot_number)
+                if decisions.count(pilot_number) * 2 > judges_count
+            ),
+            None
+        )
+        del bracket.votes[node]
+        if winner is None:
+            bracket.reruns[node] = bracket.reruns.get(node, 0) + 1
+            return HeatResult(heat=heat, omt=True, votes=len(decisions))
+        bracket.winners[node] = winner
+        BracketEngine.resolve(bracket)
+        return HeatResult(heat=heat, winner=winner, votes=len(decisions))
+
+
+class BracketService:
+    def __init__(
+            self,
+            bracket_repository: BracketRepository,
+            qualification_service: QualificationService,
+            judges_count: int = JUDGES_COUNT
+    ) -> None:
+        self._bracket_repository = bracket_repository
+        self._qualification_service = qualification_service
+        self._judges_count = judges_count
+
+    async def create(self, stage_id: int, size: int) -> Bracket:
+        """Посев по итогам квалификации этапа (только один раз, сетка уже есть - BracketError)."""
+        leaderboard = await self._qualification_service.get_leaderboard(stage_id, size)
+        pilot_numbers = [entry.pilot_number for entry in leaderboard]
+        bracket = BracketEngine.seed(stage_id, pilot_numbers, size)
+        await self._bracket_repository.create(bracket)
+        return bracket
+
+    async def get_heats(self, stage_id: int) -> list[Heat]:
+        """Заезды, ожидающие проведения."""
+        bracket = await self._bracket_repository.get(stage_id)
+        if not bracket:
+            return []
+        return [BracketEngine.heat(bracket, node) for node in BracketEngine.ready_nodes(bracket)]
+
+    async def vote(self, vote: VotingJudge) -> HeatResult:
+        return await self._bracket_repository.modify(
+            vote.stage_id,
+            lambda bracket: BracketEngine.vote(bracket, vote, self._judges_count)
+        )
+
+
+class NotificationService:
+    """
+        Рассылки по этапам: напоминание участникам за reminder_hours до начала
+        и объявления об открытии / закрытии регистрации.
+        Задачи лежат в JobRepository и выполняются фоновым воркером, а не в обработчике апдейта.
+    """
+    ANNOUNCEMENT_ROLES: tuple[Role, ...] = (Role.PILOT, Role.JUDGE)
+
+    def __init__(
+            self,
+            job_repository: JobRepository,
+            stage_repository: StageRepository,
+            recipient_repository: RecipientRepository,
+            sender: MessageSender,
+            reminder_hours: int = STAGE_REMINDER_HOURS
+    ) -> None:
+        self._job_repository = job_repository
+        self._stage_repository = stage_repository
+        self._recipient_repository = recipient_repository
+        self._sender = sender
+        self._reminder_hours = reminder_hours
+
+    async def schedule_reminder(self, stage: Stage) -> None:
+        job = Job(kind=JobKind.STAGE_REMINDER, stage_id=stage.id)
+        now = datetime.now()
+        if stage.date <= now:
+            await self._job_repository.cancel(job)
+            return
+        await self._job_repository.schedule(job, max(stage.date - timedelta(hours=self._reminder_hours), now))
+
+    async def announce_registration(self, stage: Stage) -> None:
+        opened = Job(kind=JobKind.REGISTRATION_OPENED, stage_id=stage.id)
+        closed = Job(kind=JobKind.REGISTRATION_CLOSED, stage_id=stage.id)
+        job, outdated = (opened, closed) if stage.is_active else (closed, opened)
+        # Если регистрацию переключили несколько раз подряд, уйдёт только последнее объявление
+        await self._job_repository.cancel(outdated)
+        await self._job_repository.schedule(job, datetime.now())
+
+    async def cancel(self, stage_id: int) -> None:
+        await self._job_repository.cancel(*(Job(kind=kind, stage_id=stage_id) for kind in JobKind))
+
+    async def run(self, job: Job) -> Optional[BroadcastReport]:
+        """Повторный запуск задачи (retry, истёкшая аренда) продолжает рассылку после последнего отправленного user_id."""
+        stage = await self._stage_repository.read(job.stage_id)
+        if not stage:
+            logger.info(f"Job {job.key} skipped: stage not found")
+            return None
+        cursor = await self._job_repository.get_cursor(job)
+        if job.kind == JobKind.STAGE_REMINDER:
+            if stage.date <= datetime.now():
+                return None
+            text = STAGE_REMINDER_TEMPLATE.format(
+                title=stage.title,
+                date=stage.date,
+                location=stage.location,
+                map_link=stage.map_link
+            )
+            recipients = self._recipient_repository.stream_stage_participants(stage.id, BULK_CHUNK_SIZE, cursor)
+        else:
+            # Состояние регистрации могло измениться после планирования задачи
+            if stage.is_active != (job.kind == JobKind.REGISTRATION_OPENED):
+                return None
+            template = REGISTRATION_OPENED_TEMPLATE if stage.is_active else REGISTRATION_CLOSED_TEMPLATE
+            text = template.format(title=stage.title, date=stage.date, location=stage.location)
+            recipients = self._recipient_repository.stream_users(self.ANNOUNCEMENT_ROLES, BULK_CHUNK_SIZE, cursor)
+
+        async def save_cursor(user_id: int) -> None:
+            await self._job_repository.save_cursor(job, user_id)
+
+        report = await self._sender.broadcast(recipients, text, save_cursor)
+        logger.info(
+            f"Job {job.key}: sent {report.sent}, failed {report.failed} "
+            f"in {report.seconds:.1f}s ({report.rate:.1f} msg/s)"
+        )
+        return report
+
+
 class ReferralService:
     def __init__(self, referral_repository: CRUDRepository[Referral]) -> None:
         self._referral_repository = referral_repository
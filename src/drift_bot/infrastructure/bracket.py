@@ -0,0 +1,47 @@
+from typing import Any, Optional
+from collections.abc import Callable
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from ..core.domain import Bracket
+from ..core.base import BracketRepository
+from ..core.exceptions import BracketError
+
+
+class RedisBracketRepository(BracketRepository):
+    """Сетки этапов в Redis: один JSON на этап, доступный всем воркерам бота."""
+    def __init__(self, redis: Redis, prefix: str = "bracket:") -> None:
+        self.redis = redis
+        self.prefix = prefix
+
+    def _key(self, stage_id: int) -> str:
+        return f"{self.prefix}{stage_id}"
+
+    async def get(self, stage_id: int) -> Optional[Bracket]:
+        value = await self.redis.get(self._key(stage_id))
+        return Bracket.model_validate_json(value) if value else None
+
+    async def create(self, bracket: Bracket) -> None:
+        # NX: повторный посев не затирает голоса и результаты уже идущей сетки
+        if not await self.redis.set(self._key(bracket.stage_id), bracket.model_dump_json(), nx=True):
+            raise BracketError(f"Bracket for stage {bracket.stage_id} already exists")
+
+    async def modify(self, stage_id: int, change: Callable[[Bracket], Any]) -> Any:
+        key = self._key(stage_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    # Оптимистичная блокировка: если сетку изменил другой воркер, читаем заново
+                    await pipe.watch(key)
+                    value = await pipe.get(key)
+                    if not value:
+                        raise BracketError(f"Bracket for stage {stage_id} not found")
+                    bracket = Bracket.model_validate_json(value)
+                    result = change(bracket)
+                    pipe.multi()
+                    pipe.set(key, bracket.model_dump_json())
+                    await pipe.execute()
+                    return result
+                except WatchError:
+                    continue
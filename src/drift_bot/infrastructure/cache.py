@@ -0,0 +1,122 @@
+from typing import Any, Optional
+
+import json
+import time
+import logging
+from collections import OrderedDict
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from ..metrics import metrics
+from ..core.base import Cache
+from ..constants import MAX_SIZE, TTL
+
+logger = logging.getLogger(__name__)
+
+
+def _namespace(key: str) -> str:
+    """Пространство имён ключа (часть до первого двоеточия) для метрик."""
+    return key.split(":", 1)[0]
+
+
+def _record_hit(key: str) -> None:
+    metrics.increment("cache.hits")
+    metrics.increment(f"cache.hits.{_namespace(key)}")
+
+
+def _record_miss(key: str) -> None:
+    metrics.increment("cache.misses")
+    metrics.increment(f"cache.misses.{_namespace(key)}")
+
+
+class MemoryCache(Cache):
+    """LRU кеш в памяти процесса с ограничением по времени жизни записей."""
+    def __init__(self, max_size: int = MAX_SIZE, ttl: int = TTL * 60) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            _record_miss(key)
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            metrics.increment("cache.expirations")
+            _record_miss(key)
+            return None
+        self._entries.move_to_end(key)
+        _record_hit(key)
+        # Храним JSON, чтобы вызывающий код не мог изменить закешированное значение
+        return json.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        self._entries[key] = (expires_at, json.dumps(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            metrics.increment("cache.evictions")
+        metrics.set_gauge("cache.size", len(self._entries))
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+        metrics.set_gauge("cache.size", len(self._entries))
+
+    async def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+        metrics.set_gauge("cache.size", len(self._entries))
+
+
+class RedisCache(Cache):
+    """
+        Кеш в Redis, общий для всех экземпляров бота.
+        Ошибки Redis не пробрасываются: при недоступности кеша данные читаются из БД.
+    """
+    def __init__(self, redis: Redis, ttl: int = TTL * 60, prefix: str = "cache:") -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            value = await self.redis.get(self.prefix + key)
+        except RedisError as e:
+            logger.error(f"Error while reading cache key {key}: {e}")
+            metrics.increment("cache.errors")
+            return None
+        if value is None:
+            _record_miss(key)
+            return None
+        _record_hit(key)
+        return json.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            await self.redis.set(self.prefix + key, json.dumps(value), ex=ttl if ttl is not None else self.ttl)
+        except RedisError as e:
+            logger.error(f"Error while writing cache key {key}: {e}")
+            metrics.increment("cache.errors")
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.redis.delete(*(self.prefix + key for key in keys))
+        except RedisError as e:
+            logger.error(f"Error while deleting cache keys {keys}: {e}")
+            metrics.increment("cache.errors")
+
+    async def delete_prefix(self, prefix: str) -> None:
+        try:
+            keys = [key async for key in self.redis.scan_iter(match=f"{self.prefix}{prefix}*")]
+            if keys:
+                await self.redis.delete(*keys)
+        except RedisError as e:
+            logger.error(f"Error while deleting cache prefix {prefix}: {e}")
+            metrics.increment("cache.errors")
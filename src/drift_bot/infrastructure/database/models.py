@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from sqlalchemy import Text, DateTime, BigInteger, CheckConstraint, ForeignKey, Index
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, declared_attr
 
 from .base import Base
 
@@ -49,10 +49,16 @@ class FileMetadataOrm(Base):
     format: Mapped[str]
     type: Mapped[str]
     uploaded_date: Mapped[datetime] = mapped_column(DateTime)
+    telegram_file_id: Mapped[str | None] = mapped_column(nullable=True)
 
     parent_type: Mapped[str]
     parent_id: Mapped[int]
 
+    __table_args__ = (
+        # Файлы родителя загружаются по parent_type = ... AND parent_id IN (...)
+        Index("file_metadata_parent_index", "parent_type", "parent_id"),
+    )
+
 
 class ChampionshipOrm(Base):
     __tablename__ = "championships"
@@ -75,6 +81,11 @@ class ChampionshipOrm(Base):
         cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        Index("championships_is_active_id_index", "is_active", "id"),
+        Index("championships_user_id_index", "user_id", "id"),
+    )
+
 
 class StageOrm(Base):
     __tablename__ = "stages"
@@ -99,48 +110,59 @@ class StageOrm(Base):
         lazy="select"
     )
 
-    participants: Mapped[list["ParticipantOrm"]] = relationship(
+    judges: Mapped[list["JudgeOrm"]] = relationship(
+        back_populates="stage",
+        cascade="all, delete-orphan"
+    )
+    pilots: Mapped[list["PilotOrm"]] = relationship(
         back_populates="stage",
         cascade="all, delete-orphan"
     )
     championship: Mapped["ChampionshipOrm"] = relationship(back_populates="stages")
 
+    __table_args__ = (
+        Index("stages_championship_date_index", "championship_id", "date"),
+    )
+
 
 class ParticipantOrm(Base):
-    __tablename__ = "participants"
+    """Общие поля участников, судьи и пилоты хранятся в отдельных таблицах."""
+    __abstract__ = True
+
+    PARENT_TYPE: str  # parent_type файлов участника в file_metadata
 
     user_id: Mapped[int] = mapped_column(BigInteger, unique=False, nullable=False)
-    stage_id: Mapped[int] = mapped_column(ForeignKey("stages.id"), unique=False)
     full_name: Mapped[str]
 
-    type: Mapped[str] = mapped_column(nullable=False)
+    @declared_attr
+    def stage_id(cls) -> Mapped[int]:
+        return mapped_column(ForeignKey("stages.id"), unique=False)
 
-    files: Mapped[list["FileMetadataOrm"]] = relationship(
-        primaryjoin="""and_(
-            ParticipantOrm.id == foreign(FileMetadataOrm.parent_id),
-            FileMetadataOrm.parent_type == 'participant'
-        )""",
-        cascade="all, delete-orphan"
-    )
-    stage: Mapped["StageOrm"] = relationship(back_populates="participants")
+    @declared_attr
+    def files(cls) -> Mapped[list["FileMetadataOrm"]]:
+        return relationship(
+            primaryjoin=f"""and_(
+                {cls.__name__}.id == foreign(FileMetadataOrm.parent_id),
+                FileMetadataOrm.parent_type == '{cls.PARENT_TYPE}'
+            )""",
+            cascade="all, delete-orphan"
+        )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "participant",
-        "polymorphic_on": type
-    }
-
-    __table_args__ = (
-        Index("user_stage_index", "user_id", "stage_id", unique=True),
-    )
+    @declared_attr
+    def stage(cls) -> Mapped["StageOrm"]:
+        return relationship(back_populates=cls.__tablename__)
 
 
 class JudgeOrm(ParticipantOrm):
     __tablename__ = "judges"
+    PARENT_TYPE = "judge"
 
     criterion: Mapped[str]
 
     __table_args__ = (
         CheckConstraint("criterion IN ('STYLE', 'ANGLE', 'LINE')", "check_criterion"),
+        Index("judges_user_stage_index", "user_id", "stage_id", unique=True),
+        Index("judges_stage_index", "stage_id"),
     )
 
 
@@ -149,6 +171,7 @@ class CarOrm(Base):
 
     pilot_id: Mapped[int] = mapped_column(ForeignKey("pilots.id"), unique=False)
     type: Mapped[str]
+    name: Mapped[str | None] = mapped_column(nullable=True)
     plate: Mapped[str | None] = mapped_column(nullable=True)
     hp: Mapped[int]
 
@@ -157,14 +180,21 @@ class CarOrm(Base):
 
 class PilotOrm(ParticipantOrm):
     __tablename__ = "pilots"
+    PARENT_TYPE = "pilot"
 
     age: Mapped[int]
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    team: Mapped[str | None] = mapped_column(nullable=True)
     cars: Mapped[list["CarOrm"]] = relationship(back_populates="pilot")
     number: Mapped[int]
 
     qualifications: Mapped[list["QualificationOrm"]] = relationship(back_populates="pilot")
 
+    __table_args__ = (
+        Index("pilots_user_stage_index", "user_id", "stage_id", unique=True),
+        Index("pilots_stage_number_index", "stage_id", "number", unique=True),
+    )
+
 
 class QualificationOrm(Base):
     __tablename__ = "qualifications"
@@ -180,4 +210,5 @@ class QualificationOrm(Base):
 
     __table_args__ = (
         CheckConstraint("attempt = 1 OR attempt = 2", "check_attempt_count"),
+        Index("qualifications_pilot_attempt_index", "pilot_id", "attempt", unique=True),
     )
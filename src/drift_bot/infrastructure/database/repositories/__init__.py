@@ -3,7 +3,16 @@ __all__ = (
     "SQLChampionshipRepository",
     "SQLReferralRepository",
     "SQLStageRepository",
-    "SQLParticipantRepository"
+    "SQLParticipantRepository",
+    "SQLFileMetadataRepository",
+    "SQLBulkRepository",
+    "SQLQualificationRepository",
+    "SQLRecipientRepository",
+    "CachedUserRepository",
+    "CachedChampionshipRepository",
+    "CachedStageRepository",
+    "CachedFileMetadataRepository",
+    "CachedBulkRepository"
 )
 
 from .user import SQLUserRepository
@@ -11,3 +20,14 @@ from .championship import SQLChampionshipRepository
 from .stage import SQLStageRepository
 from .referral import SQLReferralRepository
 from .participant import SQLParticipantRepository
+from .file_metadata import SQLFileMetadataRepository
+from .bulk import SQLBulkRepository
+from .qualification import SQLQualificationRepository
+from .recipient import SQLRecipientRepository
+from .cached import (
+    CachedUserRepository,
+    CachedChampionshipRepository,
+    CachedStageRepository,
+    CachedFileMetadataRepository,
+    CachedBulkRepository
+)
@@ -0,0 +1,127 @@
+from typing import Any, Sequence
+from collections.abc import AsyncIterator
+
+from sqlalchemy import select, insert
+from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pydantic import BaseModel
+
+from ..base import Base
+from ..utils import to_values
+from ..models import ChampionshipOrm, StageOrm, PilotOrm, CarOrm, FileMetadataOrm
+
+from src.drift_bot.core.enums import EntityKind
+from src.drift_bot.core.base import BulkRepository
+from src.drift_bot.core.exceptions import CreationError, ReadingError
+
+KIND2ORM: dict[EntityKind, type[Base]] = {
+    EntityKind.CHAMPIONSHIP: ChampionshipOrm,
+    EntityKind.STAGE: StageOrm,
+    EntityKind.PILOT: PilotOrm
+}
+
+KIND2PARENT_TYPE: dict[EntityKind, str] = {
+    EntityKind.CHAMPIONSHIP: "championship",
+    EntityKind.STAGE: "stage",
+    EntityKind.PILOT: PilotOrm.PARENT_TYPE
+}
+
+
+def to_row(orm: type[Base], model: BaseModel) -> dict[str, Any]:
+    """Значения колонок таблицы (relationship пишутся отдельно), поле без колонки - ошибка, как и в create."""
+    return to_values(orm, model.model_dump(exclude={"id", "files", "cars"}, exclude_none=True))
+
+
+def to_record(kind: EntityKind, orm: Base) -> dict[str, Any]:
+    """Запись для экспорта: колонки таблицы и прикреплённые файлы."""
+    record: dict[str, Any] = {"kind": kind}
+    record.update({column: getattr(orm, column) for column in orm.__table__.columns.keys()})
+    record["files"] = [
+        {column: getattr(file, column) for column in ("key", "bucket", "size", "format", "type", "uploaded_date")}
+        for file in orm.files
+    ]
+    if kind == EntityKind.PILOT:
+        record["cars"] = [
+            {column: getattr(car, column) for column in ("type", "name", "plate", "hp")}
+            for car in orm.cars
+        ]
+    return record
+
+
+class SQLBulkRepository(BulkRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def insert_many(self, kind: EntityKind, models: Sequence[BaseModel]) -> list[int]:
+        if not models:
+            return []
+        orm = KIND2ORM[kind]
+        try:
+            # Multi-row INSERT ... RETURNING, ID возвращаются в порядке переданных строк
+            result = await self.session.execute(
+                insert(orm).returning(orm.id, sort_by_parameter_order=True),
+                [to_row(orm, model) for model in models]
+            )
+            ids = list(result.scalars().all())
+            file_rows = [
+                {
+                    **file.model_dump(exclude={"id"}),
+                    "parent_id": id,
+                    "parent_type": KIND2PARENT_TYPE[kind]
+                }
+                for id, model in zip(ids, models)
+                for file in model.files
+                if file
+            ]
+            if file_rows:
+                await self.session.execute(insert(FileMetadataOrm), file_rows)
+            if kind == EntityKind.PILOT:
+                car_rows = [
+                    {**to_row(CarOrm, car), "pilot_id": id}
+                    for id, model in zip(ids, models)
+                    for car in model.cars
+                ]
+                if car_rows:
+                    await self.session.execute(insert(CarOrm), car_rows)
+            await self.session.commit()
+            return ids
+        except (SQLAlchemyError, ValueError) as e:
+            await self.session.rollback()
+            raise CreationError(f"Error while bulk creating {kind}: {e}") from e
+
+    async def _stream(self, kind: EntityKind, stmt, chunk_size: int) -> AsyncIterator[dict[str, Any]]:
+        result = await self.session.stream_scalars(stmt.execution_options(yield_per=chunk_size))
+        async for orm in result:
+            yield to_record(kind, orm)
+
+    async def stream_season(self, championship_id: int, chunk_size: int) -> AsyncIterator[dict[str, Any]]:
+        try:
+            championships = (
+                select(ChampionshipOrm)
+                .options(selectinload(ChampionshipOrm.files))
+                .where(ChampionshipOrm.id == championship_id)
+            )
+            async for record in self._stream(EntityKind.CHAMPIONSHIP, championships, chunk_size):
+                yield record
+            stages = (
+                select(StageOrm)
+                .options(selectinload(StageOrm.files))
+                .where(StageOrm.championship_id == championship_id)
+                .order_by(StageOrm.number)
+            )
+            async for record in self._stream(EntityKind.STAGE, stages, chunk_size):
+                yield record
+            pilots = (
+                select(PilotOrm)
+                .options(selectinload(PilotOrm.files), selectinload(PilotOrm.cars))
+                .join(StageOrm, StageOrm.id == PilotOrm.stage_id)
+                .where(StageOrm.championship_id == championship_id)
+                .order_by(PilotOrm.stage_id, PilotOrm.number)
+            )
+            async for record in self._stream(EntityKind.PILOT, pilots, chunk_size):
+                yield record
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ReadingError(f"Error while exporting season: {e}") from e
@@ -0,0 +1,254 @@
+from typing import Optional, Any, Sequence
+from collections.abc import AsyncIterator
+
+from datetime import datetime, date
+
+from pydantic import BaseModel
+
+from ..session import read_from_primary
+
+from src.drift_bot.core.enums import EntityKind
+from src.drift_bot.core.dto import ActiveChampionship, ChampionshipsPage
+from src.drift_bot.core.domain import User, Championship, Stage, FileMetadata
+from src.drift_bot.core.base import (
+    Cache,
+    CRUDRepository,
+    ChampionshipRepository,
+    StageRepository,
+    FileMetadataRepository,
+    BulkRepository
+)
+
+
+class CachedUserRepository(CRUDRepository[User]):
+    """Кеширует чтение пользователя (роль проверяется почти в каждом апдейте)."""
+    def __init__(self, repository: CRUDRepository[User], cache: Cache) -> None:
+        self.repository = repository
+        self.cache = cache
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"user:{user_id}"
+
+    async def create(self, user: User) -> User:
+        created_user = await self.repository.create(user)
+        await self.cache.delete(self._key(created_user.user_id))
+        return created_user
+
+    async def read(self, user_id: int) -> Optional[User]:
+        cached = await self.cache.get(self._key(user_id))
+        if cached is not None:
+            return User.model_validate(cached)
+        with read_from_primary():
+            user = await self.repository.read(user_id)
+        if user:
+            await self.cache.set(self._key(user_id), user.model_dump(mode="json"))
+        return user
+
+    async def read_all(self) -> list[User]:
+        return await self.repository.read_all()
+
+    async def update(self, user_id: int, **kwargs) -> Optional[User]:
+        user = await self.repository.update(user_id, **kwargs)
+        await self.cache.delete(self._key(user_id))
+        return user
+
+    async def delete(self, user_id: int) -> bool:
+        is_deleted = await self.repository.delete(user_id)
+        await self.cache.delete(self._key(user_id))
+        return is_deleted
+
+
+class CachedChampionshipRepository(ChampionshipRepository):
+    """Кеширует карточку чемпионата и страницы списка чемпионатов."""
+    LIST_PREFIX = "championships:"
+
+    def __init__(self, repository: ChampionshipRepository, cache: Cache) -> None:
+        self.repository = repository
+        self.cache = cache
+
+    @staticmethod
+    def _key(id: int) -> str:
+        return f"championship:{id}"
+
+    async def _invalidate(self, id: Optional[int] = None) -> None:
+        if id is not None:
+            await self.cache.delete(self._key(id))
+        await self.cache.delete_prefix(self.LIST_PREFIX)
+
+    async def create(self, championship: Championship) -> Championship:
+        created_championship = await self.repository.create(championship)
+        await self._invalidate()
+        return created_championship
+
+    async def read(self, id: int) -> Optional[Championship]:
+        cached = await self.cache.get(self._key(id))
+        if cached is not None:
+            return Championship.model_validate(cached)
+        with read_from_primary():
+            championship = await self.repository.read(id)
+        if championship:
+            await self.cache.set(self._key(id), championship.model_dump(mode="json"))
+        return championship
+
+    async def read_all(self) -> list[Championship]:
+        return await self.repository.read_all()
+
+    async def update(self, id: int, **kwargs) -> Optional[Championship]:
+        championship = await self.repository.update(id, **kwargs)
+        await self._invalidate(id)
+        return championship
+
+    async def delete(self, id: int) -> bool:
+        is_deleted = await self.repository.delete(id)
+        await self._invalidate(id)
+        return is_deleted
+
+    async def get_active(self) -> list[ActiveChampionship]:
+        return await self.repository.get_active()
+
+    async def paginate(
+            self,
+            limit: int,
+            cursor: Optional[int] = None,
+            forward: bool = True,
+            is_active: bool = True
+    ) -> ChampionshipsPage:
+        key = f"{self.LIST_PREFIX}page:{is_active}:{cursor}:{forward}:{limit}"
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return ChampionshipsPage.model_validate(cached)
+        with read_from_primary():
+            page = await self.repository.paginate(limit, cursor=cursor, forward=forward, is_active=is_active)
+        await self.cache.set(key, page.model_dump(mode="json"))
+        return page
+
+    async def count(self, is_active: bool = True) -> int:
+        key = f"{self.LIST_PREFIX}count:{is_active}"
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+        with read_from_primary():
+            count = await self.repository.count(is_active)
+        await self.cache.set(key, count)
+        return count
+
+    async def get_stages(self, id: int) -> list[Stage]:
+        return await self.repository.get_stages(id)
+
+    async def get_by_user_id(self, user_id: int) -> list[Championship]:
+        return await self.repository.get_by_user_id(user_id)
+
+
+class CachedStageRepository(StageRepository):
+    """Кеширует ближайший этап чемпионата."""
+    NEAREST_PREFIX = "stage:nearest:"
+
+    def __init__(self, repository: StageRepository, cache: Cache) -> None:
+        self.repository = repository
+        self.cache = cache
+
+    def _nearest_key(self, championship_id: int) -> str:
+        return f"{self.NEAREST_PREFIX}{championship_id}"
+
+    async def create(self, stage: Stage) -> Stage:
+        created_stage = await self.repository.create(stage)
+        await self.cache.delete(self._nearest_key(created_stage.championship_id))
+        return created_stage
+
+    async def read(self, id: int) -> Optional[Stage]:
+        return await self.repository.read(id)
+
+    async def read_all(self) -> list[Stage]:
+        return await self.repository.read_all()
+
+    async def update(self, id: int, **kwargs) -> Optional[Stage]:
+        stage = await self.repository.update(id, **kwargs)
+        if stage:
+            await self.cache.delete(self._nearest_key(stage.championship_id))
+        return stage
+
+    async def delete(self, id: int) -> bool:
+        is_deleted = await self.repository.delete(id)
+        # ID чемпионата удалённого этапа неизвестен
+        await self.cache.delete_prefix(self.NEAREST_PREFIX)
+        return is_deleted
+
+    async def get_nearest(self, championship_id: int, date: datetime) -> Optional[Stage]:
+        key = self._nearest_key(championship_id)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            stage = Stage.model_validate(cached)
+            # Закешированный этап остаётся ближайшим, пока он не прошёл
+            if stage.date >= date:
+                return stage
+        with read_from_primary():
+            stage = await self.repository.get_nearest(championship_id, date)
+        if stage:
+            await self.cache.set(key, stage.model_dump(mode="json"))
+        return stage
+
+    async def get_by_date(self, championship_id: int, date: datetime) -> list[Stage]:
+        return await self.repository.get_by_date(championship_id, date)
+
+    async def get_stage_days(self, championship_id: int, start: datetime, end: datetime) -> list[date]:
+        return await self.repository.get_stage_days(championship_id, start, end)
+
+    async def get_pilot_numbers(self, id: int) -> list[int]:
+        return await self.repository.get_pilot_numbers(id)
+
+
+class CachedFileMetadataRepository(FileMetadataRepository):
+    """
+        Сбрасывает закешированные карточки родителя, когда у файла появляется Telegram file_id,
+        иначе до истечения TTL карточки отдаются без file_id и фото снова скачивается из S3.
+    """
+    def __init__(self, repository: FileMetadataRepository, cache: Cache) -> None:
+        self.repository = repository
+        self.cache = cache
+
+    async def create(self, file_metadata: FileMetadata) -> FileMetadata:
+        return await self.repository.create(file_metadata)
+
+    async def read(self, id: int) -> Optional[FileMetadata]:
+        return await self.repository.read(id)
+
+    async def read_all(self) -> list[FileMetadata]:
+        return await self.repository.read_all()
+
+    async def update(self, id: int, **kwargs) -> Optional[FileMetadata]:
+        return await self.repository.update(id, **kwargs)
+
+    async def delete(self, id: int) -> bool:
+        return await self.repository.delete(id)
+
+    async def set_telegram_file_id(self, id: int, telegram_file_id: str) -> Optional[tuple[str, int]]:
+        parent = await self.repository.set_telegram_file_id(id, telegram_file_id)
+        if parent is None:
+            return None
+        parent_type, parent_id = parent
+        if parent_type == "championship":
+            await self.cache.delete(CachedChampionshipRepository._key(parent_id))
+        elif parent_type == "stage":
+            # ID чемпионата этапа неизвестен
+            await self.cache.delete_prefix(CachedStageRepository.NEAREST_PREFIX)
+        return parent
+
+
+class CachedBulkRepository(BulkRepository):
+    """Сбрасывает списки чемпионатов и ближайшие этапы после массового импорта."""
+    def __init__(self, repository: BulkRepository, cache: Cache) -> None:
+        self.repository = repository
+        self.cache = cache
+
+    async def insert_many(self, kind: EntityKind, models: Sequence[BaseModel]) -> list[int]:
+        ids = await self.repository.insert_many(kind, models)
+        if kind == EntityKind.CHAMPIONSHIP:
+            await self.cache.delete_prefix(CachedChampionshipRepository.LIST_PREFIX)
+        elif kind == EntityKind.STAGE:
+            for championship_id in {stage.championship_id for stage in models}:
+                await self.cache.delete(f"{CachedStageRepository.NEAREST_PREFIX}{championship_id}")
+        return ids
+
+    def stream_season(self, championship_id: int, chunk_size: int) -> AsyncIterator[dict[str, Any]]:
+        return self.repository.stream_season(championship_id, chunk_size)
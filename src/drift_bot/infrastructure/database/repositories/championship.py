@@ -1,14 +1,15 @@
 from typing import Optional
+from functools import cache
 
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import Select, select, update, delete, func, bindparam
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import ChampionshipOrm, StageOrm
-from ..utils import create_files
+from ..utils import create_with_files
 
-from src.drift_bot.core.dto import ActiveChampionship
+from src.drift_bot.core.dto import ActiveChampionship, ChampionshipsPage
 from src.drift_bot.core.domain import Championship, Stage
 from src.drift_bot.core.base import ChampionshipRepository
 from src.drift_bot.core.exceptions import (
@@ -18,6 +19,42 @@ from src.drift_bot.core.exceptions import (
     DeletionError
 )
 
+READ_CHAMPIONSHIP_STMT = (
+    select(ChampionshipOrm)
+    .options(selectinload(ChampionshipOrm.files))
+    .where(ChampionshipOrm.id == bindparam("id"))
+)
+
+
+@cache
+def build_paginate_stmt(is_active: bool, has_cursor: bool, forward: bool) -> Select:
+    """Запрос страницы для каждой комбинации флагов строится один раз, cursor и limit - параметры."""
+    conditions = [ChampionshipOrm.is_active == is_active] if is_active else []
+    # Общее количество возвращается тем же запросом, что и страница
+    total = (
+        select(func.count())
+        .select_from(ChampionshipOrm)
+        .where(*conditions)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(
+            ChampionshipOrm.id,
+            ChampionshipOrm.title,
+            ChampionshipOrm.is_active,
+            total.label("total")
+        )
+        .where(*conditions)
+    )
+    if has_cursor:
+        cursor = bindparam("cursor")
+        stmt = stmt.where(ChampionshipOrm.id > cursor if forward else ChampionshipOrm.id < cursor)
+    return (
+        stmt
+        .order_by(ChampionshipOrm.id.asc() if forward else ChampionshipOrm.id.desc())
+        .limit(bindparam("limit"))
+    )
+
 
 class SQLChampionshipRepository(ChampionshipRepository):
     def __init__(self, session: AsyncSession) -> None:
@@ -25,30 +62,14 @@ class SQLChampionshipRepository(ChampionshipRepository):
 
     async def create(self, championship: Championship) -> Championship:
         try:
-            championship_orm = ChampionshipOrm(
-                **championship.model_dump(
-                    exclude={"files"},
-                    exclude_none=True
-                )
+            championship_orm = await create_with_files(
+                self.session,
+                ChampionshipOrm,
+                values=championship.model_dump(exclude={"files"}, exclude_none=True),
+                files=championship.files,
+                parent_type="championship"
             )
-            self.session.add(championship_orm)
-            await self.session.flush()
-            if championship.files:
-                await create_files(
-                    self.session,
-                    championship.files,
-                    parent_id=championship_orm.id,
-                    parent_type="championship"
-                )
             await self.session.commit()
-            await self.session.refresh(championship_orm)
-            stmt = (
-                select(ChampionshipOrm)
-                .where(ChampionshipOrm.id == championship_orm.id)
-                .options(selectinload(ChampionshipOrm.files))
-            )
-            result = await self.session.execute(stmt)
-            championship_orm = result.scalar_one()
             return Championship.model_validate(championship_orm)
         except SQLAlchemyError as e:
             await self.session.rollback()
@@ -56,12 +77,7 @@ class SQLChampionshipRepository(ChampionshipRepository):
 
     async def read(self, id: int) -> Optional[Championship]:
         try:
-            stmt = (
-                select(ChampionshipOrm)
-                .options(selectinload(ChampionshipOrm.files))
-                .where(ChampionshipOrm.id == id)
-            )
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(READ_CHAMPIONSHIP_STMT, {"id": id})
             championship_orm = result.scalar_one_or_none()
             return Championship.model_validate(championship_orm) if championship_orm else None
         except SQLAlchemyError as e:
@@ -115,29 +131,36 @@ class SQLChampionshipRepository(ChampionshipRepository):
             await self.session.rollback()
             raise ReadingError(f"Error while reading active championships: {e}") from e
 
-    async def paginate(self, page: int, limit: int, is_active: bool = True) -> list[Championship]:
+    async def paginate(
+            self,
+            limit: int,
+            cursor: Optional[int] = None,
+            forward: bool = True,
+            is_active: bool = True
+    ) -> ChampionshipsPage:
         try:
-            offset = (page - 1) * limit
-            stmt = select(ChampionshipOrm).options(selectinload(ChampionshipOrm.files))
-            if is_active:
-                stmt = stmt.where(ChampionshipOrm.is_active == is_active)
-            stmt = stmt.offset(offset).limit(limit)
-            results = await self.session.execute(stmt)
-            championship_orms = results.scalars().all()
-            return [
-                Championship.model_validate(championship_orm)
-                for championship_orm in championship_orms
-            ]
+            stmt = build_paginate_stmt(is_active, cursor is not None, forward)
+            params = {"limit": limit} if cursor is None else {"limit": limit, "cursor": cursor}
+            results = await self.session.execute(stmt, params)
+            rows = results.all()
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise ReadingError(f"Error while paginating championships: {e}") from e
+        if not forward:
+            rows.reverse()
+        return ChampionshipsPage(
+            championships=[ActiveChampionship.model_validate(row) for row in rows],
+            total=rows[0].total if rows else await self.count(is_active)
+        )
 
-    async def count(self) -> int:
+    async def count(self, is_active: bool = True) -> int:
         try:
             stmt = (
                 select(func.count())
                 .select_from(ChampionshipOrm)
             )
+            if is_active:
+                stmt = stmt.where(ChampionshipOrm.is_active == is_active)
             result = await self.session.execute(stmt)
             return result.scalar()
         except SQLAlchemyError as e:
@@ -167,6 +190,7 @@ class SQLChampionshipRepository(ChampionshipRepository):
                 select(ChampionshipOrm)
                 .where(ChampionshipOrm.user_id == user_id)
                 .options(selectinload(ChampionshipOrm.files))
+                .order_by(ChampionshipOrm.id)
             )
             results = await self.session.execute(stmt)
             championship_orms = results.scalars().all()
@@ -0,0 +1,80 @@
+from typing import Optional
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import FileMetadataOrm
+
+from src.drift_bot.core.domain import FileMetadata
+from src.drift_bot.core.base import FileMetadataRepository
+from src.drift_bot.core.exceptions import ReadingError, UpdateError, DeletionError
+
+# Поля, при изменении которых кешированный Telegram file_id становится недействительным
+FILE_CONTENT_FIELDS = {"key", "bucket"}
+
+
+class SQLFileMetadataRepository(FileMetadataRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def read(self, id: int) -> Optional[FileMetadata]:
+        try:
+            stmt = (
+                select(FileMetadataOrm)
+                .where(FileMetadataOrm.id == id)
+            )
+            result = await self.session.execute(stmt)
+            file_metadata_orm = result.scalar_one_or_none()
+            return FileMetadata.model_validate(file_metadata_orm) if file_metadata_orm else None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ReadingError(f"Error while reading file metadata: {e}") from e
+
+    async def update(self, id: int, **kwargs) -> Optional[FileMetadata]:
+        if FILE_CONTENT_FIELDS & kwargs.keys():
+            # Файл заменён, старый file_id указывает на прежнее содержимое
+            kwargs.setdefault("telegram_file_id", None)
+        try:
+            stmt = (
+                update(FileMetadataOrm)
+                .values(**kwargs)
+                .where(FileMetadataOrm.id == id)
+                .returning(FileMetadataOrm)
+            )
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+            file_metadata_orm = result.scalar_one_or_none()
+            return FileMetadata.model_validate(file_metadata_orm) if file_metadata_orm else None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise UpdateError(f"Error while updating file metadata: {e}") from e
+
+    async def delete(self, id: int) -> bool:
+        try:
+            stmt = (
+                delete(FileMetadataOrm)
+                .where(FileMetadataOrm.id == id)
+            )
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+            return result.rowcount > 0
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DeletionError(f"Error while deleting file metadata: {e}") from e
+
+    async def set_telegram_file_id(self, id: int, telegram_file_id: str) -> Optional[tuple[str, int]]:
+        try:
+            stmt = (
+                update(FileMetadataOrm)
+                .values(telegram_file_id=telegram_file_id)
+                .where(FileMetadataOrm.id == id)
+                .returning(FileMetadataOrm.parent_type, FileMetadataOrm.parent_id)
+            )
+            result = await self.session.execute(stmt)
+            parent = result.one_or_none()
+            await self.session.commit()
+            return tuple(parent) if parent else None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise UpdateError(f"Error while saving telegram file id: {e}") from e
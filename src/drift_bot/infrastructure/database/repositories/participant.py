@@ -1,12 +1,14 @@
 from typing import TypeVar, Generic, Optional
+from functools import cache
 
-from sqlalchemy import select, delete
+from sqlalchemy import Select, select, delete, bindparam
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import ParticipantOrm
-from ..utils import create_files
+from ..utils import create_with_files, create_cars
 
 from src.drift_bot.core.base import ParticipantRepository, T
 from src.drift_bot.core.exceptions import (
@@ -19,6 +21,19 @@ from src.drift_bot.core.exceptions import (
 P = TypeVar("P", bound=ParticipantOrm)
 
 
+@cache
+def build_by_user_and_stage_stmt(orm: type[ParticipantOrm]) -> Select:
+    """Запрос участника по пользователю и этапу, один на таблицу участников."""
+    return (
+        select(orm)
+        .options(selectinload(orm.files))
+        .where(
+            (orm.user_id == bindparam("user_id")) &
+            (orm.stage_id == bindparam("stage_id"))
+        )
+    )
+
+
 class SQLParticipantRepository(ParticipantRepository[T], Generic[T, P]):
     def __init__(self, session: AsyncSession, orm: type[P], model: type[T]) -> None:
         self.session = session
@@ -27,24 +42,19 @@ class SQLParticipantRepository(ParticipantRepository[T], Generic[T, P]):
 
     async def create(self, model: T) -> T:
         try:
-            orm = self.Orm(**model.model_dump(exclude={"files"}, exclude_none=True))
-            self.session.add(orm)
-            await self.session.flush()
-            if model.files:
-                await create_files(
-                    self.session, model.files, parent_id=orm.id, parent_type="participant"
-                )
-            await self.session.commit()
-            await self.session.refresh(orm)
-            stmt = (
-                select(self.Orm)
-                .where(self.Orm.id == orm.id)
-                .options(selectinload(self.Orm.files))
+            orm = await create_with_files(
+                self.session,
+                self.Orm,
+                values=model.model_dump(exclude={"files", "cars"}, exclude_none=True),
+                files=[file for file in model.files if file],
+                parent_type=self.Orm.PARENT_TYPE
             )
-            result = await self.session.execute(stmt)
-            orm = result.scalar_one()
+            # Автомобили пилота - отдельная таблица
+            if hasattr(model, "cars"):
+                set_committed_value(orm, "cars", await create_cars(self.session, model.cars, pilot_id=orm.id))
+            await self.session.commit()
             return self.Model.model_validate(orm)
-        except SQLAlchemyError as e:
+        except (SQLAlchemyError, ValueError) as e:
             await self.session.rollback()
             raise CreationError(f"Error while creation participant: {e}") from e
 
@@ -85,15 +95,10 @@ class SQLParticipantRepository(ParticipantRepository[T], Generic[T, P]):
 
     async def get_by_user_and_stage(self, user_id: int, stage_id: int) -> Optional[T]:
         try:
-            stmt = (
-                select(self.Orm)
-                .options(selectinload(self.Orm.files))
-                .where(
-                    (self.Orm.user_id == user_id) &
-                    (self.Orm.stage_id == stage_id)
-                )
+            result = await self.session.execute(
+                build_by_user_and_stage_stmt(self.Orm),
+                {"user_id": user_id, "stage_id": stage_id}
             )
-            result = await self.session.execute(stmt)
             orm = result.scalar_one_or_none()
             return self.Model.model_validate(orm) if orm else None
         except SQLAlchemyError as e:
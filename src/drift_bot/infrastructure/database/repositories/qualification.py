@@ -0,0 +1,100 @@
+from typing import Optional
+
+from sqlalchemy import select, literal
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
+
+from ..models import QualificationOrm, PilotOrm
+
+from src.drift_bot.core.enums import Criterion
+from src.drift_bot.core.domain import Qualification, CriterionScore, ScoringJudge
+from src.drift_bot.core.base import QualificationRepository
+from src.drift_bot.core.exceptions import CreationError, ReadingError
+
+CRITERION2COLUMN: dict[Criterion, str] = {
+    Criterion.ANGLE: "angle_points",
+    Criterion.STYLE: "style_points",
+    Criterion.LINE: "line_points"
+}
+
+
+class SQLQualificationRepository(QualificationRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add_points(self, score: ScoringJudge) -> Optional[Qualification]:
+        column = CRITERION2COLUMN[score.criterion]
+        points = {criterion_column: 0.0 for criterion_column in CRITERION2COLUMN.values()}
+        points[column] = score.points
+        # ID пилота берётся по номеру внутри того же запроса; нет пилота - нет вставленной строки
+        pilot = (
+            select(
+                PilotOrm.id,
+                literal(int(score.attempt)),
+                *(literal(value) for value in points.values()),
+                literal(score.points)
+            )
+            .where(
+                (PilotOrm.stage_id == score.stage_id) &
+                (PilotOrm.number == score.pilot_number)
+            )
+        )
+        stmt = insert(QualificationOrm).from_select(
+            ["pilot_id", "attempt", *points.keys(), "total_points"],
+            pilot
+        )
+        # Одна попытка - одна строка, судьи дописывают в неё свои критерии
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[QualificationOrm.pilot_id, QualificationOrm.attempt],
+            set_={
+                column: stmt.excluded[column],
+                "total_points": (
+                    QualificationOrm.total_points
+                    - getattr(QualificationOrm, column)
+                    + stmt.excluded[column]
+                )
+            }
+        ).returning(QualificationOrm.attempt, QualificationOrm.total_points)
+        try:
+            result = await self.session.execute(stmt)
+            row = result.one_or_none()
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise CreationError(f"Error while adding qualification points: {e}") from e
+        if not row:
+            return None
+        return Qualification(
+            stage_id=score.stage_id,
+            pilot_number=score.pilot_number,
+            attempt=row.attempt,
+            points=row.total_points
+        )
+
+    async def get_by_stage(self, stage_id: int) -> list[CriterionScore]:
+        try:
+            stmt = (
+                select(
+                    PilotOrm.number,
+                    QualificationOrm.attempt,
+                    *(getattr(QualificationOrm, column) for column in CRITERION2COLUMN.values())
+                )
+                .join(PilotOrm, PilotOrm.id == QualificationOrm.pilot_id)
+                .where(PilotOrm.stage_id == stage_id)
+            )
+            results = await self.session.execute(stmt)
+            return [
+                CriterionScore(
+                    stage_id=stage_id,
+                    pilot_number=row.number,
+                    attempt=row.attempt,
+                    criterion=criterion,
+                    points=getattr(row, column)
+                )
+                for row in results.all()
+                for criterion, column in CRITERION2COLUMN.items()
+            ]
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ReadingError(f"Error while reading qualifications: {e}") from e
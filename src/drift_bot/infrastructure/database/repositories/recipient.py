@@ -0,0 +1,56 @@
+from typing import Optional, Sequence
+from collections.abc import AsyncIterator
+
+from sqlalchemy import select, union
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import UserOrm, JudgeOrm, PilotOrm
+
+from src.drift_bot.core.enums import Role
+from src.drift_bot.core.base import RecipientRepository
+from src.drift_bot.core.exceptions import ReadingError
+
+
+class SQLRecipientRepository(RecipientRepository):
+    """Получатели рассылок: только user_id, без загрузки моделей целиком."""
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def _stream(self, stmt, chunk_size: int) -> AsyncIterator[list[int]]:
+        try:
+            result = await self.session.stream_scalars(stmt.execution_options(yield_per=chunk_size))
+            async for partition in result.partitions(chunk_size):
+                yield list(partition)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ReadingError(f"Error while reading recipients: {e}") from e
+
+    async def stream_stage_participants(
+            self,
+            stage_id: int,
+            chunk_size: int,
+            after_user_id: Optional[int] = None
+    ) -> AsyncIterator[list[int]]:
+        participants = union(
+            select(JudgeOrm.user_id).where(JudgeOrm.stage_id == stage_id),
+            select(PilotOrm.user_id).where(PilotOrm.stage_id == stage_id)
+        ).subquery()
+        # Порядок по user_id нужен, чтобы прерванная рассылка продолжилась с места остановки
+        stmt = select(participants.c.user_id).order_by(participants.c.user_id)
+        if after_user_id is not None:
+            stmt = stmt.where(participants.c.user_id > after_user_id)
+        async for user_ids in self._stream(stmt, chunk_size):
+            yield user_ids
+
+    async def stream_users(
+            self,
+            roles: Sequence[Role],
+            chunk_size: int,
+            after_user_id: Optional[int] = None
+    ) -> AsyncIterator[list[int]]:
+        stmt = select(UserOrm.user_id).where(UserOrm.role.in_(roles)).order_by(UserOrm.user_id)
+        if after_user_id is not None:
+            stmt = stmt.where(UserOrm.user_id > after_user_id)
+        async for user_ids in self._stream(stmt, chunk_size):
+            yield user_ids
@@ -1,13 +1,13 @@
-from datetime import datetime
+from datetime import datetime, date, timedelta
 from typing import Optional
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, func, Date, bindparam
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import StageOrm
-from ..utils import create_files
+from ..models import StageOrm, PilotOrm
+from ..utils import create_with_files
 
 from src.drift_bot.core.domain import Stage
 from src.drift_bot.core.base import StageRepository
@@ -18,6 +18,17 @@ from src.drift_bot.core.exceptions import (
     DeletionError
 )
 
+NEAREST_STAGE_STMT = (
+    select(StageOrm)
+    .options(selectinload(StageOrm.files))
+    .where(
+        (StageOrm.date >= bindparam("date")) &
+        (StageOrm.championship_id == bindparam("championship_id"))
+    )
+    .order_by(StageOrm.date.asc())
+    .limit(1)
+)
+
 
 class SQLStageRepository(StageRepository):
     def __init__(self, session: AsyncSession) -> None:
@@ -25,23 +36,14 @@ class SQLStageRepository(StageRepository):
 
     async def create(self, stage: Stage) -> Stage:
         try:
-            stage_orm = StageOrm(
-                **stage.model_dump(
-                    exclude={"files"},
-                    exclude_none=True,
-                )
+            stage_orm = await create_with_files(
+                self.session,
+                StageOrm,
+                values=stage.model_dump(exclude={"files"}, exclude_none=True),
+                files=[file for file in stage.files if file],
+                parent_type="stage"
             )
-            self.session.add(stage_orm)
-            await self.session.flush()
-            if stage.files:
-                await create_files(
-                    self.session,
-                    stage.files,
-                    parent_id=stage_orm.id,
-                    parent_type="stage"
-                )
             await self.session.commit()
-            await self.session.refresh(stage_orm)
             return Stage.model_validate(stage_orm)
         except SQLAlchemyError as e:
             await self.session.rollback()
@@ -93,18 +95,60 @@ class SQLStageRepository(StageRepository):
 
     async def get_nearest(self, championship_id: int, date: datetime) -> Optional[Stage]:
         try:
+            result = await self.session.execute(
+                NEAREST_STAGE_STMT,
+                {"date": date, "championship_id": championship_id}
+            )
+            stage_orm = result.scalar_one_or_none()
+            return Stage.model_validate(stage_orm) if stage_orm else None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ReadingError(f"Error while reading nearest stage: {e}") from e
+
+    async def get_by_date(self, championship_id: int, date: datetime) -> list[Stage]:
+        try:
+            # Полуоткрытый диапазон [начало дня, начало следующего) вместо date(stages.date) = ... - работает по индексу
+            day_start = datetime(year=date.year, month=date.month, day=date.day)
             stmt = (
                 select(StageOrm)
+                .options(selectinload(StageOrm.files))
                 .where(
-                    (StageOrm.date >= date) &
-                    (StageOrm.championship_id == championship_id)
+                    (StageOrm.championship_id == championship_id) &
+                    (StageOrm.date >= day_start) &
+                    (StageOrm.date < day_start + timedelta(days=1))
                 )
                 .order_by(StageOrm.date.asc())
-                .limit(1)
             )
-            result = await self.session.execute(stmt)
-            stage_orm = result.scalar_one_or_none()
-            return Stage.model_validate(stage_orm) if stage_orm else None
+            result = await self.session.scalars(stmt)
+            return [Stage.model_validate(stage_orm) for stage_orm in result.all()]
         except SQLAlchemyError as e:
             await self.session.rollback()
-            raise ReadingError(f"Error while reading nearest stage: {e}") from e
+            raise ReadingError(f"Error while reading stages by date: {e}") from e
+
+    async def get_stage_days(self, championship_id: int, start: datetime, end: datetime) -> list[date]:
+        try:
+            # Условия только на (championship_id, date) - запрос целиком обслуживается индексом
+            day = func.date(StageOrm.date, type_=Date)
+            stmt = (
+                select(day)
+                .distinct()
+                .where(
+                    (StageOrm.championship_id == championship_id) &
+                    (StageOrm.date >= start) &
+                    (StageOrm.date < end)
+                )
+            )
+            result = await self.session.scalars(stmt)
+            return list(result.all())
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ReadingError(f"Error while reading stage days: {e}") from e
+
+    async def get_pilot_numbers(self, id: int) -> list[int]:
+        try:
+            stmt = select(PilotOrm.number).where(PilotOrm.stage_id == id)
+            result = await self.session.scalars(stmt)
+            return list(result.all())
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ReadingError(f"Error while reading pilot numbers: {e}") from e
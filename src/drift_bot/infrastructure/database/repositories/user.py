@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import insert, select, update, delete
+from sqlalchemy import insert, select, update, delete, bindparam
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,9 @@ from src.drift_bot.core.exceptions import (
     DeletionError
 )
 
+# Горячие запросы собираются один раз: без построения конструкции и ключа кеша компиляции на каждый вызов
+READ_USER_STMT = select(UserOrm).where(UserOrm.user_id == bindparam("user_id"))
+
 
 class SQLUserRepository(CRUDRepository[User]):
     def __init__(self, session: AsyncSession) -> None:
@@ -37,11 +40,7 @@ class SQLUserRepository(CRUDRepository[User]):
 
     async def read(self, user_id: int) -> Optional[User]:
         try:
-            stmt = (
-                select(UserOrm)
-                .where(UserOrm.user_id == user_id)
-            )
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(READ_USER_STMT, {"user_id": user_id})
             user = result.scalar_one_or_none()
             return User.model_validate(user) if user else None
         except SQLAlchemyError as e:
@@ -1,13 +1,214 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from typing import Optional
+from collections.abc import Iterator
+from contextvars import ContextVar
+from contextlib import contextmanager
 
+import random
+import logging
+from itertools import cycle
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+
+from ...metrics import metrics
 from ...settings import PostgresSettings
 
 
-def create_session_factory(pg_settings: PostgresSettings) -> async_sessionmaker[AsyncSession]:
-    engine = create_async_engine(url=pg_settings.sqlalchemy_url, echo=True)
+@dataclass
+class DbActor:
+    """Пользователь текущего апдейта с точки зрения маршрутизации запросов."""
+    user_id: int
+    sticky: bool = False  # Недавно писал: читает из основной БД
+    wrote: bool = False   # Писал при обработке текущего апдейта
+
+
+# Счётчик запросов текущего апдейта (устанавливается middleware бота)
+query_counter: ContextVar[Optional[list[int]]] = ContextVar("query_counter", default=None)
+# Пользователь текущего апдейта: после его записи чтения идут в основную БД (устанавливается middleware бота)
+db_actor: ContextVar[Optional[DbActor]] = ContextVar("db_actor", default=None)
+# Результат чтения попадёт в общий кеш (устанавливается кеширующими репозиториями)
+primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+ROUTER_KEY = "router"   # Ключ ReplicaRouter в Session.info
+WROTE_KEY = "wrote"     # Сессия уже писала в основную БД
+
+logger = logging.getLogger(__name__)
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, который пишет в метрики ожидание соединения и загрузку пула."""
+    def _report_usage(self) -> None:
+        checked_out = self.checkedout()
+        metrics.set_gauge("db.pool.checked_out", checked_out)
+        metrics.set_gauge("db.pool.saturation", checked_out / (self.size() + max(self._max_overflow, 0)))
+
+    def _do_get(self):
+        with metrics.timer("db.pool.wait"):
+            connection = super()._do_get()
+        metrics.increment("db.pool.checkouts")
+        self._report_usage()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._report_usage()
+
+
+def count_query(*_) -> None:
+    metrics.increment("db.queries")
+    counter = query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def sample_query(sample_rate: float):
+    """Логирует долю sample_rate запросов вместо всех (echo=True форматирует каждый запрос в event loop)."""
+    def log_query(conn, cursor, statement: str, parameters, context, executemany: bool) -> None:
+        if random.random() < sample_rate:
+            logger.info(f"SQL: {statement} | {parameters}")
+    return log_query
+
+
+class ReplicaRouter:
+    """
+        Выбор БД для запроса: основная для записи, реплики по кругу для чтения.
+        Пользователь, который только что писал, sticky_seconds читает из основной БД,
+        чтобы отставание реплик не скрывало от него его же изменения.
+        Отметки о записи - ключи Redis с TTL sticky_seconds, общие для всех экземпляров бота.
+    """
+    def __init__(
+            self,
+            primary: AsyncEngine,
+            replicas: list[AsyncEngine],
+            redis: Redis,
+            sticky_seconds: float,
+            prefix: str = "db:sticky:"
+    ) -> None:
+        self.primary = primary
+        self.replicas = replicas
+        self._replicas = cycle(replicas)
+        self._redis = redis
+        self._sticky_seconds = sticky_seconds
+        self._prefix = prefix
+
+    def _key(self, user_id: int) -> str:
+        return f"{self._prefix}{user_id}"
+
+    async def load_actor(self, user_id: int) -> DbActor:
+        """Отметка о недавней записи пользователя (без реплик не нужна и не читается)."""
+        if not self.replicas:
+            return DbActor(user_id=user_id)
+        try:
+            return DbActor(user_id=user_id, sticky=bool(await self._redis.exists(self._key(user_id))))
+        except RedisError as e:
+            # Без отметки безопаснее читать из основной БД
+            logger.error(f"Error while reading sticky mark of user {user_id}: {e}")
+            return DbActor(user_id=user_id, sticky=True)
+
+    async def save_actor(self, actor: DbActor) -> None:
+        if not self.replicas or not actor.wrote:
+            return
+        try:
+            await self._redis.set(self._key(actor.user_id), 1, px=int(self._sticky_seconds * 1000))
+        except RedisError as e:
+            logger.error(f"Error while saving sticky mark of user {actor.user_id}: {e}")
+
+    def replica(self) -> AsyncEngine:
+        return next(self._replicas)
+
+    async def dispose(self) -> None:
+        for engine in (self.primary, *self.replicas):
+            await engine.dispose()
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """
+        Чтения внутри блока идут в основную БД. Ими заполняется кеш после сброса:
+        отстающая реплика вернула бы старые данные, и кеш отдавал бы их всем до истечения TTL.
+    """
+    token = primary_reads.set(True)
+    try:
+        yield
+    finally:
+        primary_reads.reset(token)
+
+
+def is_read(clause) -> bool:
+    """SELECT без FOR UPDATE (блокировки строк возможны только в основной БД)."""
+    return (
+        clause is not None
+        and getattr(clause, "is_select", False)
+        and getattr(clause, "_for_update_arg", None) is None
+    )
+
+
+class RoutingSession(Session):
+    """
+        Сессия, которая отправляет чтения в реплики, а остальные запросы - в основную БД.
+        После первой записи все запросы сессии идут в основную БД.
+    """
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        router: Optional[ReplicaRouter] = self.info.get(ROUTER_KEY)
+        if router is None or not router.replicas:
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        actor = db_actor.get()
+        if self._flushing or not is_read(clause):
+            self.info[WROTE_KEY] = True
+            if actor is not None:
+                # Следующие сессии этого апдейта тоже читают из основной БД
+                actor.wrote = actor.sticky = True
+            return router.primary.sync_engine
+        if self.info.get(WROTE_KEY) or primary_reads.get() or (actor is not None and actor.sticky):
+            metrics.increment("db.reads.primary")
+            return router.primary.sync_engine
+        metrics.increment("db.reads.replica")
+        return router.replica().sync_engine
+
+
+def create_engine(url: str, pg_settings: PostgresSettings) -> AsyncEngine:
+    connect_args = {}
+    if pg_settings.PG_DRIVER == "asyncpg":
+        # Повторные запросы с тем же SQL выполняются без повторного PREPARE на сервере
+        connect_args["prepared_statement_cache_size"] = pg_settings.PG_PREPARED_STATEMENT_CACHE_SIZE
+    engine = create_async_engine(
+        url=url,
+        echo=pg_settings.PG_ECHO,
+        poolclass=MeasuredQueuePool,
+        pool_size=pg_settings.PG_POOL_SIZE,
+        max_overflow=pg_settings.PG_MAX_OVERFLOW,
+        pool_timeout=pg_settings.PG_POOL_TIMEOUT,
+        pool_recycle=pg_settings.PG_POOL_RECYCLE,
+        pool_pre_ping=pg_settings.PG_POOL_PRE_PING,
+        connect_args=connect_args
+    )
+    event.listen(engine.sync_engine, "before_cursor_execute", count_query)
+    if not pg_settings.PG_ECHO and pg_settings.PG_ECHO_SAMPLE_RATE > 0:
+        event.listen(engine.sync_engine, "before_cursor_execute", sample_query(pg_settings.PG_ECHO_SAMPLE_RATE))
+    return engine
+
+
+def create_replica_router(pg_settings: PostgresSettings, redis: Redis) -> ReplicaRouter:
+    return ReplicaRouter(
+        primary=create_engine(pg_settings.sqlalchemy_url, pg_settings),
+        replicas=[create_engine(url, pg_settings) for url in pg_settings.replica_urls],
+        redis=redis,
+        sticky_seconds=pg_settings.PG_REPLICA_STICKY_SECONDS
+    )
+
+
+def create_session_factory(router: ReplicaRouter) -> async_sessionmaker[AsyncSession]:
     return async_sessionmaker(
-        engine,
+        router.primary,
         class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        info={ROUTER_KEY: router},
         autoflush=False,
         expire_on_commit=False
     )
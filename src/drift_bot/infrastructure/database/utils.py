@@ -1,8 +1,23 @@
+from typing import Any, TypeVar
+
+from sqlalchemy import insert
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .models import FileMetadataOrm
+from .base import Base
+from .models import FileMetadataOrm, CarOrm
+
+from ...core.domain import FileMetadata, Car
+
+O = TypeVar("O", bound=Base)
 
-from ...core.domain import FileMetadata
+
+def to_values(orm: type[Base], values: dict[str, Any]) -> dict[str, Any]:
+    """Проверяет, что для всех значений есть колонки таблицы (поля без колонки не отбрасываются молча)."""
+    unknown = values.keys() - orm.__table__.columns.keys()
+    if unknown:
+        raise ValueError(f"Table {orm.__tablename__} has no columns for fields: {', '.join(sorted(unknown))}")
+    return values
 
 
 async def create_files(
@@ -10,13 +25,55 @@ async def create_files(
         files: list[FileMetadata],
         parent_id: int,
         parent_type: str
-) -> None:
-    file_orms = [
-        FileMetadataOrm(
-            **file.model_dump(exclude={"id"}),
-            parent_id=parent_id,
-            parent_type=parent_type
-        )
-        for file in files
-    ]
-    session.add_all(file_orms)
+) -> list[FileMetadataOrm]:
+    """Добавляет метаданные файлов одним multi-row INSERT ... RETURNING."""
+    if not files:
+        return []
+    result = await session.scalars(
+        insert(FileMetadataOrm).returning(FileMetadataOrm),
+        [
+            {
+                **file.model_dump(exclude={"id"}),
+                "parent_id": parent_id,
+                "parent_type": parent_type
+            }
+            for file in files
+        ]
+    )
+    return list(result.all())
+
+
+async def create_with_files(
+        session: AsyncSession,
+        orm: type[O],
+        values: dict[str, Any],
+        files: list[FileMetadata],
+        parent_type: str
+) -> O:
+    """
+        Создаёт запись и её файлы через INSERT ... RETURNING.
+        Файлы проставляются в relationship напрямую, поэтому модель собирается без повторного SELECT.
+    """
+    result = await session.execute(
+        insert(orm)
+        .values(**to_values(orm, values))
+        .returning(orm)
+    )
+    created = result.scalar_one()
+    file_orms = await create_files(session, files, parent_id=created.id, parent_type=parent_type)
+    set_committed_value(created, "files", file_orms)
+    return created
+
+
+async def create_cars(session: AsyncSession, cars: list[Car], pilot_id: int) -> list[CarOrm]:
+    """Добавляет автомобили пилота одним multi-row INSERT ... RETURNING."""
+    if not cars:
+        return []
+    result = await session.scalars(
+        insert(CarOrm).returning(CarOrm),
+        [
+            {**to_values(CarOrm, car.model_dump(exclude={"pilot_id"}, exclude_none=True)), "pilot_id": pilot_id}
+            for car in cars
+        ]
+    )
+    return list(result.all())
@@ -0,0 +1,140 @@
+from typing import Optional
+from collections.abc import Iterable
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from ..core.enums import QualificationAttempt, Criterion
+from ..core.domain import CriterionScore
+from ..core.dto import LeaderboardEntry
+from ..core.base import LeaderboardRepository
+
+POINTS_SCALE = 100        # Баллы хранятся с точностью до сотых
+SECOND_SCALE = 10 ** 7    # Вторая попытка - младшие разряды score (баллы попытки меньше 100 000)
+NUMBER_WIDTH = 6          # Номер пилота в member дополняется нулями: при равных баллах выше меньший номер
+
+
+class RedisLeaderboardRepository(LeaderboardRepository):
+    """
+        Квалификационные таблицы этапов в Redis, общие для всех воркеров бота.
+        Место - sorted set, score которого кодирует пару (лучшая, вторая попытка): обновление и место за O(log n).
+        Баллы лежат в hash "номер:попытка:критерий": сумму попытки Redis пересчитывает сам под WATCH,
+        поэтому оценки судей, записанные в любом порядке, не затирают друг друга.
+    """
+    def __init__(self, redis: Redis, prefix: str = "leaderboard:") -> None:
+        self.redis = redis
+        self.prefix = prefix
+
+    def _key(self, stage_id: int) -> str:
+        return f"{self.prefix}{stage_id}"
+
+    def _points_key(self, stage_id: int) -> str:
+        return f"{self.prefix}{stage_id}:criteria"
+
+    @property
+    def _changed_key(self) -> str:
+        return f"{self.prefix}changed"
+
+    def _ready_key(self, stage_id: int) -> str:
+        # Таблица без оценок в Redis не хранится, а "оценок нет" и "таблица не собрана" - разные состояния
+        return f"{self.prefix}{stage_id}:filled"
+
+    @staticmethod
+    def _member(pilot_number: int) -> str:
+        return f"{pilot_number:0{NUMBER_WIDTH}d}"
+
+    @staticmethod
+    def _field(pilot_number: int, attempt: int, criterion: str) -> str:
+        return f"{pilot_number}:{int(attempt)}:{criterion}"
+
+    @staticmethod
+    def _score(points: Iterable[float]) -> float:
+        points = sorted(points, reverse=True)
+        best, second = (points + [0.0, 0.0])[:2]
+        # Сортировка по возрастанию: отрицательный score ставит большие баллы выше
+        return -float(round(best * POINTS_SCALE) * SECOND_SCALE + round(second * POINTS_SCALE))
+
+    @staticmethod
+    def _entry(place: int, member: bytes | str, score: float) -> LeaderboardEntry:
+        value = round(-score)
+        return LeaderboardEntry(
+            place=place,
+            pilot_number=int(member),
+            best_points=value // SECOND_SCALE / POINTS_SCALE,
+            second_points=value % SECOND_SCALE / POINTS_SCALE
+        )
+
+    async def exists(self, stage_id: int) -> bool:
+        return bool(await self.redis.exists(self._ready_key(stage_id)))
+
+    async def fill(self, stage_id: int, scores: Iterable[CriterionScore]) -> None:
+        points: dict[str, float] = {}
+        totals: dict[int, dict[int, float]] = {}
+        for score in scores:
+            points[self._field(score.pilot_number, score.attempt, score.criterion)] = score.points
+            attempts = totals.setdefault(score.pilot_number, {})
+            attempts[int(score.attempt)] = attempts.get(int(score.attempt), 0.0) + score.points
+        ready_key = self._ready_key(stage_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(ready_key)
+                if await pipe.exists(ready_key):
+                    return
+                pipe.multi()
+                pipe.delete(self._key(stage_id), self._points_key(stage_id))
+                if points:
+                    pipe.hset(self._points_key(stage_id), mapping=points)
+                    pipe.zadd(self._key(stage_id), {
+                        self._member(pilot_number): self._score(attempts.values())
+                        for pilot_number, attempts in totals.items()
+                    })
+                pipe.set(ready_key, 1)
+                await pipe.execute()
+            except WatchError:
+                # Таблицу параллельно собрал другой воркер
+                pass
+
+    async def update(self, score: CriterionScore) -> int:
+        key = self._key(score.stage_id)
+        points_key = self._points_key(score.stage_id)
+        member = self._member(score.pilot_number)
+        fields = {
+            self._field(score.pilot_number, attempt, criterion): attempt
+            for attempt in QualificationAttempt
+            for criterion in Criterion
+        }
+        field = self._field(score.pilot_number, score.attempt, score.criterion)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    # Оптимистичная блокировка: другой критерий или попытку пилота мог оценить другой воркер
+                    await pipe.watch(points_key)
+                    values = dict(zip(fields, await pipe.hmget(points_key, list(fields))))
+                    values[field] = score.points
+                    totals: dict[int, float] = {}
+                    for name, value in values.items():
+                        if value is not None:
+                            totals[fields[name]] = totals.get(fields[name], 0.0) + float(value)
+                    pipe.multi()
+                    pipe.hset(points_key, field, score.points)
+                    pipe.zadd(key, {member: self._score(totals.values())})
+                    await pipe.execute()
+                    break
+                except WatchError:
+                    continue
+        return await self.redis.zrank(key, member) + 1
+
+    async def top(self, stage_id: int, limit: Optional[int] = None) -> list[LeaderboardEntry]:
+        end = limit - 1 if limit is not None else -1
+        ranking = await self.redis.zrange(self._key(stage_id), 0, end, withscores=True)
+        return [self._entry(place, member, score) for place, (member, score) in enumerate(ranking, start=1)]
+
+    async def mark_changed(self, stage_id: int) -> None:
+        await self.redis.sadd(self._changed_key, stage_id)
+
+    async def pop_changed(self) -> list[int]:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.smembers(self._changed_key)
+            pipe.delete(self._changed_key)
+            stages, _ = await pipe.execute()
+        return [int(stage_id) for stage_id in stages]
@@ -0,0 +1,68 @@
+from typing import Optional
+from collections.abc import Iterable
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from ..core.base import NumberPool
+from ..constants import NUMBER_POOL_TTL
+
+
+class RedisNumberPool(NumberPool):
+    """
+        Свободные номера этапа в Redis set: SPOP выдаёт случайный номер за O(1) и атомарно для всех воркеров.
+        Пул живёт ttl секунд с заполнения, после чего собирается заново из номеров, свободных в БД.
+    """
+    def __init__(self, redis: Redis, prefix: str = "numbers:", ttl: int = NUMBER_POOL_TTL) -> None:
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, stage_id: int) -> str:
+        return f"{self.prefix}{stage_id}"
+
+    def _ready_key(self, stage_id: int) -> str:
+        # Отдельный флаг: пустой set в Redis не хранится, а "номера кончились" и "пул не создан" - разные состояния
+        return f"{self.prefix}{stage_id}:ready"
+
+    async def exists(self, stage_id: int) -> bool:
+        return bool(await self.redis.exists(self._ready_key(stage_id)))
+
+    async def fill(self, stage_id: int, numbers: Iterable[int]) -> None:
+        ready_key = self._ready_key(stage_id)
+        numbers = list(numbers)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(ready_key)
+                if await pipe.exists(ready_key):
+                    return
+                pipe.multi()
+                # Номера, возвращённые в истёкший пул, уже учтены в БД
+                pipe.delete(self._key(stage_id))
+                if numbers:
+                    pipe.sadd(self._key(stage_id), *numbers)
+                    pipe.expire(self._key(stage_id), self.ttl)
+                pipe.set(ready_key, 1, ex=self.ttl)
+                await pipe.execute()
+            except WatchError:
+                # Пул параллельно заполнил другой воркер
+                pass
+
+    async def pop(self, stage_id: int) -> Optional[int]:
+        number = await self.redis.spop(self._key(stage_id))
+        return int(number) if number is not None else None
+
+    async def push(self, stage_id: int, number: int) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(self._key(stage_id), number)
+            # Номер могли вернуть в уже истёкший пул: такой set тоже не должен жить вечно
+            pipe.expire(self._key(stage_id), self.ttl)
+            await pipe.execute()
+
+    async def remove(self, stage_id: int, numbers: Iterable[int]) -> None:
+        numbers = list(numbers)
+        if numbers:
+            await self.redis.srem(self._key(stage_id), *numbers)
+
+    async def drop(self, stage_id: int) -> None:
+        await self.redis.delete(self._key(stage_id), self._ready_key(stage_id))
@@ -1,12 +1,15 @@
 from typing import Any, Optional
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager, AsyncExitStack
 
 import logging
 
+from aiobotocore.config import AioConfig
 from aiobotocore.session import get_session
 from aiobotocore.client import AioBaseClient
 
+from src.drift_bot.metrics import metrics
+from src.drift_bot.constants import CHUNK_SIZE, MULTIPART_PART_SIZE
 from src.drift_bot.core.base import FileStorage
 from src.drift_bot.core.exceptions import (
     UploadingFileError,
@@ -16,6 +19,7 @@ from src.drift_bot.core.exceptions import (
 
 
 SERVICE_NAME = "s3"
+MAX_POOL_CONNECTIONS = 20  # Максимальное количество HTTP соединений в пуле
 
 
 class S3Client(FileStorage):
@@ -24,7 +28,8 @@ class S3Client(FileStorage):
             endpoint_url: str,
             access_key: str,
             secret_key: str,
-            secure: bool = False
+            secure: bool = False,
+            max_pool_connections: int = MAX_POOL_CONNECTIONS
     ) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.config = {
@@ -33,12 +38,37 @@ class S3Client(FileStorage):
             "aws_secret_access_key": secret_key,
             "use_ssl": secure,
             "region_name": "us-east-1",
-            "service_name": "s3"
+            "service_name": SERVICE_NAME,
+            "config": AioConfig(max_pool_connections=max_pool_connections)
         }
         self.session = get_session()
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._client: Optional[AioBaseClient] = None
+
+    async def start(self) -> None:
+        """Открывает долгоживущий клиент с пулом соединений."""
+        if self._client is not None:
+            return
+        self._exit_stack = AsyncExitStack()
+        self._client = await self._exit_stack.enter_async_context(
+            self.session.create_client(**self.config)
+        )
+        self.logger.info("S3 client started")
+
+    async def close(self) -> None:
+        """Закрывает клиент и освобождает соединения пула."""
+        if self._exit_stack is None:
+            return
+        await self._exit_stack.aclose()
+        self._exit_stack, self._client = None, None
+        self.logger.info("S3 client closed")
 
     @asynccontextmanager
     async def _get_client(self) -> AsyncGenerator[AioBaseClient, Any]:
+        if self._client is not None:
+            yield self._client
+            return
+        # Запасной вариант для использования без start() (скрипты, миграции)
         async with self.session.create_client(**self.config) as client:
             yield client
 
@@ -62,26 +92,115 @@ class S3Client(FileStorage):
         if metadata is not None:
             kwargs["ExtraArgs"] = metadata
         try:
-            async with self._get_client() as client:
-                await client.put_object(**kwargs)
+            with metrics.timer("s3.upload_file"):
+                async with self._get_client() as client:
+                    await client.put_object(**kwargs)
         except Exception as e:
+            metrics.increment("s3.upload_file.errors")
             raise UploadingFileError(f"Error while uploading file: {e}") from e
 
-    async def download_file(self, key: str, bucket: str) -> bytes:
+    async def upload_stream(
+            self,
+            chunks: AsyncIterator[bytes],
+            key: str,
+            bucket: str,
+            part_size: int = MULTIPART_PART_SIZE
+    ) -> int:
+        """
+            Загружает поток в S3 через multipart upload.
+            В памяти одновременно держится не больше одной части (part_size + размер фрагмента).
+            Если весь поток уместился в одну часть - используется обычный put_object.
+        """
+        buffer = bytearray()
+        parts: list[dict[str, Any]] = []
+        upload_id: Optional[str] = None
+        uploaded = 0
+        try:
+            with metrics.timer("s3.upload_stream"):
+                async with self._get_client() as client:
+                    async for chunk in chunks:
+                        buffer.extend(chunk)
+                        if len(buffer) < part_size:
+                            continue
+                        if upload_id is None:
+                            response = await client.create_multipart_upload(Bucket=bucket, Key=key)
+                            upload_id = response["UploadId"]
+                        part_number = len(parts) + 1
+                        response = await client.upload_part(
+                            Bucket=bucket,
+                            Key=key,
+                            UploadId=upload_id,
+                            PartNumber=part_number,
+                            Body=bytes(buffer)
+                        )
+                        parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                        uploaded += len(buffer)
+                        buffer.clear()
+                    if upload_id is None:
+                        await client.put_object(Bucket=bucket, Key=key, Body=bytes(buffer))
+                        return len(buffer)
+                    if buffer:
+                        part_number = len(parts) + 1
+                        response = await client.upload_part(
+                            Bucket=bucket,
+                            Key=key,
+                            UploadId=upload_id,
+                            PartNumber=part_number,
+                            Body=bytes(buffer)
+                        )
+                        parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                        uploaded += len(buffer)
+                    await client.complete_multipart_upload(
+                        Bucket=bucket,
+                        Key=key,
+                        UploadId=upload_id,
+                        MultipartUpload={"Parts": parts}
+                    )
+                    return uploaded
+        except Exception as e:
+            metrics.increment("s3.upload_stream.errors")
+            if upload_id is not None:
+                await self._abort_multipart_upload(key, bucket, upload_id)
+            raise UploadingFileError(f"Error while uploading file stream: {e}") from e
+
+    async def _abort_multipart_upload(self, key: str, bucket: str, upload_id: str) -> None:
         try:
             async with self._get_client() as client:
-                response = await client.get_object(Bucket=bucket, Key=key)
-                body = response["Body"]
-                return await body.read()
+                await client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
         except Exception as e:
+            self.logger.error(f"Error while aborting multipart upload: {e}")
+
+    async def download_file(self, key: str, bucket: str) -> bytes:
+        try:
+            with metrics.timer("s3.download_file"):
+                async with self._get_client() as client:
+                    response = await client.get_object(Bucket=bucket, Key=key)
+                    body = response["Body"]
+                    return await body.read()
+        except Exception as e:
+            metrics.increment("s3.download_file.errors")
             self.logger.error(f"Error while receiving file: {e}")
             raise DownloadingFileError(f"Error while receiving file: {e}") from e
 
-    async def remove_file(self, key: str, bucket: str) -> str:
+    async def stream_file(self, key: str, bucket: str, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
         try:
             async with self._get_client() as client:
-                await client.delete_object(Bucket=bucket, Key=key)
+                response = await client.get_object(Bucket=bucket, Key=key)
+                async with response["Body"] as body:
+                    async for chunk in body.iter_chunks(chunk_size):
+                        yield chunk
+        except Exception as e:
+            metrics.increment("s3.stream_file.errors")
+            self.logger.error(f"Error while streaming file: {e}")
+            raise DownloadingFileError(f"Error while streaming file: {e}") from e
+
+    async def remove_file(self, key: str, bucket: str) -> str:
+        try:
+            with metrics.timer("s3.remove_file"):
+                async with self._get_client() as client:
+                    await client.delete_object(Bucket=bucket, Key=key)
             return key
         except Exception as e:
+            metrics.increment("s3.remove_file.errors")
             self.logger.error(f"Error while deleting file: {e}")
             raise RemovingFileError(f"Error while deleting file: {e}") from e
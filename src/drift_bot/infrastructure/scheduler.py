@@ -0,0 +1,192 @@
+from typing import Optional
+from collections.abc import Awaitable, Callable
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from redis.asyncio import Redis
+
+from ..metrics import metrics
+from ..core.domain import Job
+from ..core.base import JobRepository
+from ..constants import (
+    SCHEDULER_POLL_INTERVAL,
+    SCHEDULER_BATCH_SIZE,
+    SCHEDULER_LEASE,
+    SCHEDULER_RETRY_DELAY,
+    SCHEDULER_MAX_ATTEMPTS
+)
+
+logger = logging.getLogger(__name__)
+
+# Наступившие задачи переводятся из очереди в обработку одним скриптом: между ZREM и ZADD
+# не вклинится ни другой воркер, ни complete. Задача, которая ещё выполняется (её перепланировали
+# во время запуска), остаётся в очереди до завершения текущего запуска
+CLAIM_SCRIPT = """
+local keys = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+local claimed = {}
+for _, key in ipairs(keys) do
+    if not redis.call('ZSCORE', KEYS[2], key) and redis.call('ZREM', KEYS[1], key) == 1 then
+        redis.call('ZADD', KEYS[2], ARGV[3], key)
+        claimed[#claimed + 1] = key
+    end
+end
+return claimed
+"""
+
+
+class RedisJobRepository(JobRepository):
+    """
+        Очередь отложенных задач: sorted set, где score - время запуска.
+        Забранные задачи лежат во втором sorted set со сроком аренды и удаляются только после выполнения.
+        Докуда дошла рассылка задачи, хранится в hash курсоров до complete: повторный запуск её продолжает.
+    """
+    def __init__(self, redis: Redis, key: str = "jobs") -> None:
+        self.redis = redis
+        self.key = key
+        self.processing_key = f"{key}:processing"
+        self.attempts_key = f"{key}:attempts"
+        self.cursors_key = f"{key}:cursors"
+        self._claim = redis.register_script(CLAIM_SCRIPT)
+
+    @staticmethod
+    def _to_job(key: bytes | str) -> Job:
+        return Job.from_key(key.decode() if isinstance(key, bytes) else key)
+
+    async def schedule(self, job: Job, run_at: datetime) -> None:
+        await self.redis.zadd(self.key, {job.key: run_at.timestamp()})
+
+    async def cancel(self, *jobs: Job) -> None:
+        if jobs:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.zrem(self.key, *(job.key for job in jobs))
+                pipe.hdel(self.cursors_key, *(job.key for job in jobs))
+                await pipe.execute()
+
+    async def claim_due(self, now: datetime, limit: int, lease_until: datetime) -> list[Job]:
+        claimed = await self._claim(
+            keys=[self.key, self.processing_key],
+            args=[now.timestamp(), limit, lease_until.timestamp()]
+        )
+        return [self._to_job(key) for key in claimed]
+
+    async def extend(self, job: Job, lease_until: datetime) -> None:
+        await self.redis.zadd(self.processing_key, {job.key: lease_until.timestamp()}, xx=True)
+
+    async def complete(self, job: Job) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(self.processing_key, job.key)
+            pipe.hdel(self.attempts_key, job.key)
+            pipe.hdel(self.cursors_key, job.key)
+            await pipe.execute()
+
+    async def fail(self, job: Job) -> int:
+        return await self.redis.hincrby(self.attempts_key, job.key, 1)
+
+    async def retry(self, job: Job, run_at: datetime) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            # NX: задачу могли перепланировать, пока она выполнялась
+            pipe.zadd(self.key, {job.key: run_at.timestamp()}, nx=True)
+            pipe.zrem(self.processing_key, job.key)
+            await pipe.execute()
+
+    async def requeue_expired(self, now: datetime) -> int:
+        keys = await self.redis.zrangebyscore(self.processing_key, "-inf", now.timestamp())
+        if not keys:
+            return 0
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.key, {key: now.timestamp() for key in keys}, nx=True)
+            pipe.zrem(self.processing_key, *keys)
+            await pipe.execute()
+        return len(keys)
+
+    async def get_cursor(self, job: Job) -> Optional[int]:
+        cursor = await self.redis.hget(self.cursors_key, job.key)
+        return int(cursor) if cursor is not None else None
+
+    async def save_cursor(self, job: Job, user_id: int) -> None:
+        await self.redis.hset(self.cursors_key, job.key, user_id)
+
+
+class JobWorker:
+    """
+        Периодически забирает наступившие задачи и выполняет их одновременно.
+        Пока задача выполняется, воркер продлевает её аренду; упавшая задача повторяется через retry_delay.
+    """
+    def __init__(
+            self,
+            job_repository: JobRepository,
+            handler: Callable[[Job], Awaitable[None]],
+            poll_interval: float = SCHEDULER_POLL_INTERVAL,
+            batch_size: int = SCHEDULER_BATCH_SIZE,
+            lease: float = SCHEDULER_LEASE,
+            retry_delay: float = SCHEDULER_RETRY_DELAY,
+            max_attempts: int = SCHEDULER_MAX_ATTEMPTS
+    ) -> None:
+        self._job_repository = job_repository
+        self._handler = handler
+        self._poll_interval = poll_interval
+        self._batch_size = batch_size
+        self._lease = timedelta(seconds=lease)
+        self._retry_delay = timedelta(seconds=retry_delay)
+        self._max_attempts = max_attempts
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _keep_lease(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(self._lease.total_seconds() / 3)
+            try:
+                await self._job_repository.extend(job, datetime.now() + self._lease)
+            except Exception as e:
+                logger.error(f"Error while extending lease of job {job.key}: {e}")
+
+    async def _run_job(self, job: Job) -> None:
+        heartbeat = asyncio.create_task(self._keep_lease(job))
+        try:
+            with metrics.timer("scheduler.job"):
+                await self._handler(job)
+        except Exception as e:
+            metrics.increment("scheduler.jobs.failed")
+            logger.error(f"Error while running job {job.key}: {e}")
+            attempts = await self._job_repository.fail(job)
+            if attempts >= self._max_attempts:
+                logger.error(f"Job {job.key} dropped after {attempts} failed attempts")
+                await self._job_repository.complete(job)
+            else:
+                await self._job_repository.retry(job, datetime.now() + self._retry_delay)
+        else:
+            metrics.increment("scheduler.jobs.done")
+            await self._job_repository.complete(job)
+        finally:
+            heartbeat.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            jobs = []
+            try:
+                now = datetime.now()
+                requeued = await self._job_repository.requeue_expired(now)
+                if requeued:
+                    metrics.increment("scheduler.jobs.requeued", requeued)
+                    logger.warning(f"{requeued} jobs with expired lease returned to the queue")
+                jobs = await self._job_repository.claim_due(now, self._batch_size, now + self._lease)
+            except Exception as e:
+                logger.error(f"Error while claiming jobs: {e}")
+            results = await asyncio.gather(*map(self._run_job, jobs), return_exceptions=True)
+            for job, result in zip(jobs, results):
+                # Задача без подтверждения вернётся в очередь по истечении аренды
+                if isinstance(result, Exception):
+                    logger.error(f"Error while acknowledging job {job.key}: {result}")
+            # Полная пачка - в очереди могут быть ещё наступившие задачи
+            if len(jobs) < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
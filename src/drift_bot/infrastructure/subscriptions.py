@@ -0,0 +1,23 @@
+from redis.asyncio import Redis
+
+from ..core.base import SubscriptionRepository
+
+
+class RedisSubscriptionRepository(SubscriptionRepository):
+    """Подписчики таблицы этапа: hash chat_id -> message_id закреплённого сообщения."""
+    def __init__(self, redis: Redis, prefix: str = "subscribers:") -> None:
+        self.redis = redis
+        self.prefix = prefix
+
+    def _key(self, stage_id: int) -> str:
+        return f"{self.prefix}{stage_id}"
+
+    async def subscribe(self, stage_id: int, chat_id: int, message_id: int) -> None:
+        await self.redis.hset(self._key(stage_id), str(chat_id), str(message_id))
+
+    async def unsubscribe(self, stage_id: int, chat_id: int) -> None:
+        await self.redis.hdel(self._key(stage_id), str(chat_id))
+
+    async def get_subscribers(self, stage_id: int) -> dict[int, int]:
+        subscribers = await self.redis.hgetall(self._key(stage_id))
+        return {int(chat_id): int(message_id) for chat_id, message_id in subscribers.items()}
@@ -0,0 +1,318 @@
+from typing import Optional, Sequence
+from collections import OrderedDict
+from collections.abc import AsyncIterable, Awaitable, Callable
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from aiogram import Bot
+from aiogram.types import InlineKeyboardMarkup
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramRetryAfter,
+    TelegramBadRequest,
+    TelegramForbiddenError
+)
+
+from ..metrics import metrics
+from ..utils import render_leaderboard
+from ..core.dto import BroadcastReport
+from ..core.base import SubscriptionRepository, LeaderboardRepository, LeaderboardNotifier, MessageSender
+from ..constants import (
+    TELEGRAM_GLOBAL_RATE,
+    TELEGRAM_CHAT_RATE,
+    FANOUT_WORKERS,
+    FANOUT_COALESCE_DELAY,
+    LEADERBOARD_SIZE,
+    BROADCAST_BATCH_SIZE
+)
+
+MAX_CHAT_BUCKETS = 10_000  # После этого простаивающие лимиты чатов удаляются
+MAX_SEND_ATTEMPTS = 3      # Попыток отправить сообщение при ответе 429
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket: rate токенов в секунду, не больше capacity подряд."""
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def is_full(self) -> bool:
+        self._refill()
+        return self._tokens >= self.capacity
+
+    def delay(self) -> float:
+        """Сколько секунд ждать следующего токена."""
+        self._refill()
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def consume(self) -> bool:
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    async def acquire(self) -> None:
+        while not self.consume():
+            await asyncio.sleep(self.delay())
+
+
+class RedisRateWindow:
+    """
+        Лимит в Redis, общий для всех воркеров бота: счётчик отправок за текущую секунду.
+        Лимит Telegram считается на бота, а не на процесс, поэтому локальный TokenBucket умножал бы его на число воркеров.
+    """
+    def __init__(self, redis: Redis, rate: float, prefix: str = "telegram:rate:") -> None:
+        self.redis = redis
+        self.rate = rate
+        self.prefix = prefix
+        self._fallback = TokenBucket(rate)  # Пока Redis недоступен, лимит считается в процессе
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.time()
+            window = int(now)
+            try:
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    pipe.incr(f"{self.prefix}{window}")
+                    pipe.expire(f"{self.prefix}{window}", 2)
+                    count, _ = await pipe.execute()
+            except RedisError as e:
+                logger.warning(f"Shared rate limit is unavailable, using local one: {e}")
+                await self._fallback.acquire()
+                return
+            if count <= self.rate:
+                return
+            await asyncio.sleep(window + 1 - now)
+
+
+class RateLimiter:
+    """
+        Общий лимит бота и лимиты отдельных чатов Telegram.
+        С redis общий лимит делят все воркеры бота, без него он действует на процесс.
+    """
+    def __init__(
+            self,
+            global_rate: float = TELEGRAM_GLOBAL_RATE,
+            chat_rate: float = TELEGRAM_CHAT_RATE,
+            redis: Optional[Redis] = None
+    ) -> None:
+        self._global = RedisRateWindow(redis, global_rate) if redis is not None else TokenBucket(global_rate)
+        self._chat_rate = chat_rate
+        self._chats: dict[int, TokenBucket] = {}
+        self._paused_until = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Останавливает все отправки (Telegram ответил 429 с retry_after)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= MAX_CHAT_BUCKETS:
+                self._chats = {id: chat_bucket for id, chat_bucket in self._chats.items() if not chat_bucket.is_full}
+            bucket = self._chats[chat_id] = TokenBucket(self._chat_rate, capacity=1)
+        return bucket
+
+    async def acquire(self, chat_id: Optional[int] = None) -> None:
+        """Без chat_id - только общий лимит (ответ из нескольких сообщений на запрос пользователя)."""
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        if chat_id is not None:
+            await self._chat_bucket(chat_id).acquire()
+        await self._global.acquire()
+
+
+class TelegramSender(MessageSender):
+    """Массовые рассылки: пачки получателей отправляются параллельно, темп задаёт общий RateLimiter."""
+    def __init__(self, bot: Bot, rate_limiter: RateLimiter, batch_size: int = BROADCAST_BATCH_SIZE) -> None:
+        self._bot = bot
+        self._rate_limiter = rate_limiter
+        self._batch_size = batch_size
+
+    async def _send(self, chat_id: int, text: str) -> bool:
+        for _ in range(MAX_SEND_ATTEMPTS):
+            await self._rate_limiter.acquire(chat_id)
+            try:
+                await self._bot.send_message(chat_id=chat_id, text=text)
+                return True
+            except TelegramRetryAfter as e:
+                metrics.increment("broadcast.retry_after")
+                self._rate_limiter.pause(e.retry_after)
+            except (TelegramForbiddenError, TelegramBadRequest):
+                return False
+            except TelegramAPIError as e:
+                logger.error(f"Error while sending message to chat {chat_id}: {e}")
+                return False
+        return False
+
+    async def broadcast(
+            self,
+            recipients: AsyncIterable[Sequence[int]],
+            text: str,
+            on_progress: Optional[Callable[[int], Awaitable[None]]] = None
+    ) -> BroadcastReport:
+        report = BroadcastReport()
+        started = time.monotonic()
+        async for chat_ids in recipients:
+            for start in range(0, len(chat_ids), self._batch_size):
+                batch = chat_ids[start:start + self._batch_size]
+                with metrics.timer("broadcast.batch"):
+                    results = await asyncio.gather(*(self._send(chat_id, text) for chat_id in batch))
+                sent = sum(results)
+                report.sent += sent
+                report.failed += len(batch) - sent
+                if on_progress:
+                    await on_progress(batch[-1])
+        report.seconds = time.monotonic() - started
+        metrics.increment("broadcast.sent", report.sent)
+        metrics.increment("broadcast.failed", report.failed)
+        metrics.set_gauge("broadcast.rate", report.rate)
+        return report
+
+
+@dataclass
+class EditJob:
+    stage_id: int
+    chat_id: int
+    message_id: int
+
+
+class LeaderboardBroadcaster(LeaderboardNotifier):
+    """
+        Обновляет закреплённые сообщения с таблицей у подписчиков этапа.
+        Изменённые этапы отмечаются в Redis, и раз в coalesce_delay их забирает один из воркеров бота:
+        оценки за это время дают одно редактирование на подписчика. Текст берётся из общей таблицы
+        в момент отправки, поэтому задание, ждавшее лимита, не откатит сообщение к старым баллам.
+    """
+    def __init__(
+            self,
+            bot: Bot,
+            subscriptions: SubscriptionRepository,
+            leaderboards: LeaderboardRepository,
+            rate_limiter: RateLimiter,
+            markup_factory: Optional[Callable[[int], InlineKeyboardMarkup]] = None,
+            workers: int = FANOUT_WORKERS,
+            coalesce_delay: float = FANOUT_COALESCE_DELAY
+    ) -> None:
+        self._bot = bot
+        self._subscriptions = subscriptions
+        self._leaderboards = leaderboards
+        self._rate_limiter = rate_limiter
+        self._markup_factory = markup_factory  # Клавиатура под таблицей по ID этапа, без неё edit её удаляет
+        self._workers = workers
+        self._coalesce_delay = coalesce_delay
+        self._jobs: OrderedDict[tuple[int, int], EditJob] = OrderedDict()  # (chat_id, message_id) -> задание
+        self._jobs_event = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def size(self) -> int:
+        return len(self._jobs)
+
+    async def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._collect())]
+        self._tasks.extend(asyncio.create_task(self._work()) for _ in range(self._workers))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def notify(self, stage_id: int) -> None:
+        metrics.increment("fanout.notifications")
+        await self._leaderboards.mark_changed(stage_id)
+
+    def _set_depth(self) -> None:
+        metrics.set_gauge("fanout.queue.depth", len(self._jobs))
+
+    async def _collect(self) -> None:
+        while True:
+            await asyncio.sleep(self._coalesce_delay)
+            try:
+                stages = await self._leaderboards.pop_changed()
+            except Exception as e:
+                logger.error(f"Error while reading changed leaderboards: {e}")
+                continue
+            for stage_id in stages:
+                try:
+                    await self._enqueue(stage_id)
+                except Exception as e:
+                    logger.error(f"Error while preparing leaderboard of stage {stage_id}: {e}")
+
+    async def _enqueue(self, stage_id: int) -> None:
+        subscribers = await self._subscriptions.get_subscribers(stage_id)
+        for chat_id, message_id in subscribers.items():
+            key = (chat_id, message_id)
+            if key in self._jobs:
+                metrics.increment("fanout.edits.coalesced")
+            self._jobs[key] = EditJob(stage_id=stage_id, chat_id=chat_id, message_id=message_id)
+        self._set_depth()
+        if self._jobs:
+            self._jobs_event.set()
+
+    async def _work(self) -> None:
+        while True:
+            await self._jobs_event.wait()
+            if not self._jobs:
+                self._jobs_event.clear()
+                continue
+            key, job = self._jobs.popitem(last=False)
+            self._set_depth()
+            await self._rate_limiter.acquire(job.chat_id)
+            if key in self._jobs:
+                # Пока ждали лимита, таблица снова изменилась
+                metrics.increment("fanout.edits.coalesced")
+                continue
+            await self._send(key, job)
+
+    async def _send(self, key: tuple[int, int], job: EditJob) -> None:
+        try:
+            # Таблицу собирает QualificationService до уведомления
+            text = render_leaderboard(await self._leaderboards.top(job.stage_id, LEADERBOARD_SIZE))
+            markup = self._markup_factory(job.stage_id) if self._markup_factory else None
+            with metrics.timer("fanout.edit"):
+                await self._bot.edit_message_text(
+                    text=text,
+                    chat_id=job.chat_id,
+                    message_id=job.message_id,
+                    reply_markup=markup
+                )
+            metrics.increment("fanout.edits.sent")
+        except TelegramRetryAfter as e:
+            metrics.increment("fanout.retry_after")
+            self._rate_limiter.pause(e.retry_after)
+            self._jobs.setdefault(key, job)
+            self._set_depth()
+            self._jobs_event.set()
+        except TelegramBadRequest as e:
+            if "message is not modified" in e.message:
+                return
+            logger.warning(f"Leaderboard message of chat {job.chat_id} is unavailable: {e}")
+            await self._subscriptions.unsubscribe(job.stage_id, job.chat_id)
+        except TelegramForbiddenError:
+            await self._subscriptions.unsubscribe(job.stage_id, job.chat_id)
+        except TelegramAPIError as e:
+            metrics.increment("fanout.edits.failed")
+            logger.error(f"Error while editing leaderboard in chat {job.chat_id}: {e}")
+        except RedisError as e:
+            metrics.increment("fanout.edits.failed")
+            logger.error(f"Error while reading leaderboard of stage {job.stage_id}: {e}")
@@ -1,33 +1,75 @@
 from collections.abc import AsyncIterable
 
-from dishka import Provider, provide, Scope, from_context, make_async_container
+from dishka import AsyncContainer, Provider, provide, Scope, from_context, make_async_container
 
 from aiogram import Bot
 from aiogram.enums.parse_mode import ParseMode
 from aiogram.client.default import DefaultBotProperties
+from aiogram.fsm.storage.base import BaseStorage, BaseEventIsolation
+from aiogram.fsm.storage.redis import RedisStorage, RedisEventIsolation, DefaultKeyBuilder
+
+from redis.asyncio import Redis
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from .core.domain import User, Referral, Championship, Stage
-from .core.services import CRUDService, ReferralService
+from .core.domain import User, Referral, Championship, Stage, Job
+from .core.services import (
+    CRUDService,
+    ReferralService,
+    FileService,
+    BulkService,
+    QualificationService,
+    BracketService,
+    NotificationService,
+    NumberGenerator
+)
 from .core.base import (
+    Cache,
     FileStorage,
     CRUDRepository,
     ChampionshipRepository,
     StageRepository,
+    FileMetadataRepository,
+    BulkRepository,
+    QualificationRepository,
+    BracketRepository,
+    SubscriptionRepository,
+    LeaderboardRepository,
+    LeaderboardNotifier,
+    JobRepository,
+    NumberPool,
+    RecipientRepository,
+    MessageSender
 )
 
-from .infrastructure.database.session import create_session_factory
+from .infrastructure.database.session import ReplicaRouter, create_replica_router, create_session_factory
 from .infrastructure.database.repositories import (
     SQLUserRepository,
     SQLStageRepository,
     SQLReferralRepository,
-    SQLChampionshipRepository
+    SQLChampionshipRepository,
+    SQLFileMetadataRepository,
+    SQLBulkRepository,
+    SQLQualificationRepository,
+    SQLRecipientRepository,
+    CachedUserRepository,
+    CachedStageRepository,
+    CachedChampionshipRepository,
+    CachedFileMetadataRepository,
+    CachedBulkRepository
 )
 
 from .infrastructure.s3 import S3Client
+from .infrastructure.cache import MemoryCache, RedisCache
+from .infrastructure.bracket import RedisBracketRepository
+from .infrastructure.numbers import RedisNumberPool
+from .infrastructure.leaderboard import RedisLeaderboardRepository
+from .infrastructure.subscriptions import RedisSubscriptionRepository
+from .infrastructure.telegram import RateLimiter, LeaderboardBroadcaster, TelegramSender
+from .infrastructure.scheduler import RedisJobRepository, JobWorker
 
 from .settings import Settings
+from .constants import FSM_STATE_TTL, FSM_DATA_TTL
 
 
 class AppProvider(Provider):
@@ -41,8 +83,39 @@ class AppProvider(Provider):
         )
 
     @provide(scope=Scope.APP)
-    def get_session_factory(self, config: Settings) -> async_sessionmaker[AsyncSession]:
-        return create_session_factory(config.postgres)
+    async def get_redis(self, config: Settings) -> AsyncIterable[Redis]:
+        redis = Redis.from_url(config.redis.redis_url)
+        yield redis
+        await redis.aclose()
+
+    @provide(scope=Scope.APP)
+    def get_fsm_storage(self, redis: Redis) -> BaseStorage:
+        return RedisStorage(
+            redis=redis,
+            key_builder=DefaultKeyBuilder(with_bot_id=True),
+            state_ttl=FSM_STATE_TTL,
+            data_ttl=FSM_DATA_TTL
+        )
+
+    @provide(scope=Scope.APP)
+    def get_events_isolation(self, redis: Redis) -> BaseEventIsolation:
+        return RedisEventIsolation(redis=redis, key_builder=DefaultKeyBuilder(with_bot_id=True))
+
+    @provide(scope=Scope.APP)
+    def get_cache(self, config: Settings, redis: Redis) -> Cache:
+        if config.cache.CACHE_BACKEND == "redis":
+            return RedisCache(redis, ttl=config.cache.CACHE_TTL)
+        return MemoryCache(max_size=config.cache.CACHE_MAX_SIZE, ttl=config.cache.CACHE_TTL)
+
+    @provide(scope=Scope.APP)
+    async def get_replica_router(self, config: Settings, redis: Redis) -> AsyncIterable[ReplicaRouter]:
+        router = create_replica_router(config.postgres, redis)
+        yield router
+        await router.dispose()
+
+    @provide(scope=Scope.APP)
+    def get_session_factory(self, router: ReplicaRouter) -> async_sessionmaker[AsyncSession]:
+        return create_session_factory(router)
 
     @provide(scope=Scope.REQUEST)
     async def get_session(
@@ -53,28 +126,156 @@ class AppProvider(Provider):
             yield session
 
     @provide(scope=Scope.REQUEST)
-    def get_championship_repository(self, session: AsyncSession) -> ChampionshipRepository:
-        return SQLChampionshipRepository(session)
+    def get_championship_repository(self, session: AsyncSession, cache: Cache) -> ChampionshipRepository:
+        return CachedChampionshipRepository(SQLChampionshipRepository(session), cache)
 
     @provide(scope=Scope.REQUEST)
-    def get_stage_repository(self, session: AsyncSession) -> StageRepository:
-        return SQLStageRepository(session)
+    def get_stage_repository(self, session: AsyncSession, cache: Cache) -> StageRepository:
+        return CachedStageRepository(SQLStageRepository(session), cache)
 
     @provide(scope=Scope.REQUEST)
-    def get_user_repository(self, session: AsyncSession) -> CRUDRepository[User]:
-        return SQLUserRepository(session)
+    def get_user_repository(self, session: AsyncSession, cache: Cache) -> CRUDRepository[User]:
+        return CachedUserRepository(SQLUserRepository(session), cache)
 
     @provide(scope=Scope.REQUEST)
     def get_referral_repository(self, session: AsyncSession) -> CRUDRepository[Referral]:
         return SQLReferralRepository(session)
 
+    @provide(scope=Scope.REQUEST)
+    def get_file_metadata_repository(self, session: AsyncSession, cache: Cache) -> FileMetadataRepository:
+        return CachedFileMetadataRepository(SQLFileMetadataRepository(session), cache)
+
+    @provide(scope=Scope.REQUEST)
+    def get_bulk_repository(self, session: AsyncSession, cache: Cache) -> BulkRepository:
+        return CachedBulkRepository(SQLBulkRepository(session), cache)
+
+    @provide(scope=Scope.REQUEST)
+    def get_qualification_repository(self, session: AsyncSession) -> QualificationRepository:
+        return SQLQualificationRepository(session)
+
+    @provide(scope=Scope.APP)
+    def get_bracket_repository(self, redis: Redis) -> BracketRepository:
+        return RedisBracketRepository(redis)
+
+    @provide(scope=Scope.APP)
+    def get_number_pool(self, redis: Redis) -> NumberPool:
+        return RedisNumberPool(redis)
+
+    @provide(scope=Scope.APP)
+    def get_number_generator(self, number_pool: NumberPool) -> NumberGenerator:
+        return NumberGenerator(number_pool)
+
+    @provide(scope=Scope.APP)
+    def get_subscription_repository(self, redis: Redis) -> SubscriptionRepository:
+        return RedisSubscriptionRepository(redis)
+
+    @provide(scope=Scope.APP)
+    def get_rate_limiter(self, redis: Redis) -> RateLimiter:
+        return RateLimiter(redis=redis)
+
+    @provide(scope=Scope.APP)
+    def get_message_sender(self, bot: Bot, rate_limiter: RateLimiter) -> MessageSender:
+        return TelegramSender(bot, rate_limiter)
+
     @provide(scope=Scope.APP)
-    def get_file_storage(self, config: Settings) -> FileStorage:
-        return S3Client(
+    def get_job_repository(self, redis: Redis) -> JobRepository:
+        return RedisJobRepository(redis)
+
+    @provide(scope=Scope.REQUEST)
+    def get_recipient_repository(self, session: AsyncSession) -> RecipientRepository:
+        return SQLRecipientRepository(session)
+
+    @provide(scope=Scope.REQUEST)
+    def get_notification_service(
+            self,
+            job_repository: JobRepository,
+            stage_repository: StageRepository,
+            recipient_repository: RecipientRepository,
+            sender: MessageSender
+    ) -> NotificationService:
+        return NotificationService(job_repository, stage_repository, recipient_repository, sender)
+
+    @provide(scope=Scope.APP)
+    async def get_job_worker(
+            self,
+            job_repository: JobRepository,
+            app_container: AsyncContainer
+    ) -> AsyncIterable[JobWorker]:
+        async def run_job(job: Job) -> None:
+            # Каждая задача - отдельный REQUEST scope со своей сессией БД
+            async with app_container(scope=Scope.REQUEST) as request_container:
+                notification_service = await request_container.get(NotificationService)
+                await notification_service.run(job)
+
+        worker = JobWorker(job_repository, run_job)
+        await worker.start()
+        yield worker
+        await worker.stop()
+
+    @provide(scope=Scope.APP)
+    async def get_file_storage(self, config: Settings) -> AsyncIterable[FileStorage]:
+        s3_client = S3Client(
             endpoint_url=config.s3.S3_URL,
             access_key=config.s3.S3_USER,
-            secret_key=config.s3.S3_PASSWORD
+            secret_key=config.s3.S3_PASSWORD,
+            max_pool_connections=config.s3.S3_MAX_POOL_CONNECTIONS
         )
+        await s3_client.start()
+        yield s3_client
+        await s3_client.close()
+
+    @provide(scope=Scope.REQUEST)
+    def get_file_service(
+            self,
+            file_storage: FileStorage,
+            file_metadata_repository: FileMetadataRepository
+    ) -> FileService:
+        return FileService(file_storage, file_metadata_repository)
+
+    @provide(scope=Scope.REQUEST)
+    def get_bulk_service(
+            self,
+            bulk_repository: BulkRepository,
+            notification_service: NotificationService,
+            number_generator: NumberGenerator
+    ) -> BulkService:
+        return BulkService(bulk_repository, notification_service, number_generator)
+
+    @provide(scope=Scope.APP)
+    def get_leaderboard_repository(self, redis: Redis) -> LeaderboardRepository:
+        return RedisLeaderboardRepository(redis)
+
+    @provide(scope=Scope.APP)
+    async def get_leaderboard_notifier(
+            self,
+            bot: Bot,
+            subscriptions: SubscriptionRepository,
+            leaderboards: LeaderboardRepository,
+            rate_limiter: RateLimiter
+    ) -> AsyncIterable[LeaderboardNotifier]:
+        # Импорт здесь: пакет bot сам импортирует ioc
+        from .bot.keyboards import leaderboard_kb
+        broadcaster = LeaderboardBroadcaster(bot, subscriptions, leaderboards, rate_limiter, leaderboard_kb)
+        await broadcaster.start()
+        yield broadcaster
+        await broadcaster.stop()
+
+    @provide(scope=Scope.REQUEST)
+    def get_qualification_service(
+            self,
+            qualification_repository: QualificationRepository,
+            leaderboards: LeaderboardRepository,
+            notifier: LeaderboardNotifier
+    ) -> QualificationService:
+        return QualificationService(qualification_repository, leaderboards, notifier)
+
+    @provide(scope=Scope.REQUEST)
+    def get_bracket_service(
+            self,
+            bracket_repository: BracketRepository,
+            qualification_service: QualificationService
+    ) -> BracketService:
+        return BracketService(bracket_repository, qualification_service)
 
     @provide(scope=Scope.REQUEST)
     def get_referral_service(self, referral_repository: CRUDRepository[Referral]) -> ReferralService:
@@ -0,0 +1,77 @@
+from typing import Any
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class LatencyStats:
+    """Агрегированная статистика задержек одной операции."""
+    count: int = 0
+    total: float = 0.0  # Суммарное время в секундах
+    max: float = 0.0    # Максимальное время в секундах
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def avg(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Metrics:
+    """Простой in-process реестр метрик: счётчики, gauge-значения и задержки."""
+    def __init__(self) -> None:
+        self._counters: dict[str, int] = {}
+        self._gauges: dict[str, float] = {}
+        self._latencies: dict[str, LatencyStats] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        self._latencies.setdefault(name, LatencyStats()).observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Замеряет время выполнения блока кода."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def counter(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def gauge(self, name: str) -> float:
+        return self._gauges.get(name, 0.0)
+
+    def latency(self, name: str) -> LatencyStats:
+        return self._latencies.get(name, LatencyStats())
+
+    def snapshot(self) -> dict[str, Any]:
+        """Возвращает текущее состояние всех метрик."""
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            "latencies": {
+                name: {"count": stats.count, "avg": stats.avg, "max": stats.max}
+                for name, stats in self._latencies.items()
+            }
+        }
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._gauges.clear()
+        self._latencies.clear()
+
+
+metrics = Metrics()
@@ -1,9 +1,12 @@
+from typing import Literal, Optional
+
 import os
 from dotenv import load_dotenv
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
-from .constants import ENV_PATH
+from .constants import ENV_PATH, MAX_SIZE, TTL
 
 
 load_dotenv(ENV_PATH)
@@ -11,12 +14,29 @@ load_dotenv(ENV_PATH)
 
 class BotSettings(BaseSettings):
     BOT_TOKEN: str = os.getenv("BOT_TOKEN")
+    BOT_MODE: Literal["polling", "webhook"] = "polling"
+
+
+class WebhookSettings(BaseSettings):
+    WEBHOOK_URL: Optional[str] = os.getenv("WEBHOOK_URL")          # Публичный адрес, например https://bot.example.com
+    WEBHOOK_PATH: str = "/webhook"
+    WEBHOOK_SECRET: Optional[str] = os.getenv("WEBHOOK_SECRET")    # Проверяется в X-Telegram-Bot-Api-Secret-Token
+    WEBHOOK_HOST: str = "0.0.0.0"
+    WEBHOOK_PORT: int = 8080
+    WEBHOOK_WORKERS: int = 16         # Количество одновременно обрабатываемых апдейтов
+    WEBHOOK_QUEUE_SIZE: int = 1000    # Размер очереди апдейтов
+    WEBHOOK_ENQUEUE_TIMEOUT: float = 1.0  # Сколько секунд ждать места в очереди до ответа 503
+
+    @property
+    def webhook_url(self) -> str:
+        return f"{self.WEBHOOK_URL}{self.WEBHOOK_PATH}"
 
 
 class S3Settings(BaseSettings):
     S3_URL: str = os.getenv("S3_URL")
     S3_USER: str = os.getenv("S3_USER")
     S3_PASSWORD: str = os.getenv("S3_PASSWORD")
+    S3_MAX_POOL_CONNECTIONS: int = 20
 
 
 class PostgresSettings(BaseSettings):
@@ -26,10 +46,31 @@ class PostgresSettings(BaseSettings):
     PG_PASSWORD: str = os.getenv("POSTGRES_PASSWORD")
     PG_DB: str = os.getenv("POSTGRES_DB")
     PG_DRIVER: str = "asyncpg"
+    PG_POOL_SIZE: int = 10             # Постоянных соединений на экземпляр бота
+    PG_MAX_OVERFLOW: int = 5           # Временных соединений сверх PG_POOL_SIZE под пиковую нагрузку
+    PG_POOL_TIMEOUT: float = 10.0      # Секунд ожидания свободного соединения
+    PG_POOL_RECYCLE: int = 1800        # Секунд жизни соединения до переподключения
+    PG_POOL_PRE_PING: bool = True      # Проверять соединение перед выдачей из пула
+    PG_ECHO: bool = False              # Логировать все запросы (только для отладки)
+    PG_ECHO_SAMPLE_RATE: float = 0.0   # Доля запросов, которые логируются при выключенном PG_ECHO
+    PG_PREPARED_STATEMENT_CACHE_SIZE: int = 256  # Подготовленных запросов asyncpg на соединение
+    PG_REPLICAS: str = os.getenv("POSTGRES_REPLICAS", "")  # Реплики для чтения: host[:port] через запятую
+    PG_REPLICA_STICKY_SECONDS: float = 5.0  # Секунд чтения из основной БД после записи пользователя
+
+    def _url(self, host: str, port: int) -> str:
+        return f"postgresql+{self.PG_DRIVER}://{self.PG_USER}:{self.PG_PASSWORD}@{host}:{port}/{self.PG_DB}"
 
     @property
     def sqlalchemy_url(self) -> str:
-        return f"postgresql+{self.PG_DRIVER}://{self.PG_USER}:{self.PG_PASSWORD}@{self.PG_HOST}:{self.PG_PORT}/{self.PG_DB}"
+        return self._url(self.PG_HOST, self.PG_PORT)
+
+    @property
+    def replica_urls(self) -> list[str]:
+        urls = []
+        for replica in filter(None, map(str.strip, self.PG_REPLICAS.split(","))):
+            host, _, port = replica.partition(":")
+            urls.append(self._url(host, int(port) if port else self.PG_PORT))
+        return urls
 
 
 class RedisSettings(BaseSettings):
@@ -41,8 +82,24 @@ class RedisSettings(BaseSettings):
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/0"
 
 
+class CacheSettings(BaseSettings):
+    CACHE_BACKEND: Literal["memory", "redis"] = "redis"  # memory - только для одного экземпляра бота (разработка)
+    CACHE_MAX_SIZE: int = MAX_SIZE
+    CACHE_TTL: int = TTL * 60  # Секунд
+
+
 class Settings(BaseSettings):
     bot: BotSettings = BotSettings()
+    webhook: WebhookSettings = WebhookSettings()
     postgres: PostgresSettings = PostgresSettings()
     s3: S3Settings = S3Settings()
     redis: RedisSettings = RedisSettings()
+    cache: CacheSettings = CacheSettings()
+
+    @model_validator(mode="after")
+    def check_cache_is_shared(self) -> "Settings":
+        # Сброс кеша в памяти доходит только до процесса, который писал: остальные экземпляры
+        # до истечения CACHE_TTL отдают старые роли и карточки
+        if self.cache.CACHE_BACKEND == "memory" and (self.bot.BOT_MODE == "webhook" or self.postgres.replica_urls):
+            raise ValueError("Memory cache backend can't be used with several bot instances (webhook mode or replicas)")
+        return self
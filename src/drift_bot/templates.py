@@ -39,3 +39,36 @@ PILOT_TEMPLATE = """🏁 <b><u>Информация о пилоте</u></b> 🏁
 
 #pilot #drift
 """
+
+LEADERBOARD_TEMPLATE = """<b><u>Квалификация 🏁</u></b>
+
+{rows}
+
+🕒 <b>Обновлено:</b> {updated_at}
+
+#qualification #drift
+"""
+
+LEADERBOARD_ROW_TEMPLATE = "{place}. №{pilot_number} - <b>{best_points:g}</b> ({second_points:g})"
+
+STAGE_REMINDER_TEMPLATE = """⏰ <b>Напоминание!</b>
+
+Этап <b>{title}</b> начнётся {date}
+📍 <b>Место:</b> {location}
+🗺️ <b>Как добраться:</b> {map_link}
+
+#stage #drift
+"""
+
+REGISTRATION_OPENED_TEMPLATE = """🔓 <b>Открыта регистрация на этап {title}</b>
+
+🗓 <b>Дата проведения:</b> {date}
+📍 <b>Место:</b> {location}
+
+#stage #drift
+"""
+
+REGISTRATION_CLOSED_TEMPLATE = """🔐 <b>Регистрация на этап {title} закрыта</b>
+
+#stage #drift
+"""
@@ -1,9 +1,14 @@
-from typing import Optional
+from typing import Optional, Sequence, TypeVar
 
 from uuid import uuid4
+from datetime import datetime
 
 from .core.enums import Role, FileType
-from .core.domain import File
+from .core.dto import LeaderboardEntry
+from .core.domain import File, FileMetadata
+from .templates import LEADERBOARD_TEMPLATE, LEADERBOARD_ROW_TEMPLATE
+
+F = TypeVar("F", File, FileMetadata)
 
 
 def parse_referral_code(url: str) -> str:
@@ -22,6 +27,22 @@ def generate_file_name(format: str) -> str:
     return f"{uuid4()}.{format}"
 
 
-def find_target_file(files: list[File], target_type: FileType) -> Optional[File]:
+def find_target_file(files: Sequence[F], target_type: FileType) -> Optional[F]:
     """Ищет заданный файл в коллекции файлов."""
     return next((file for file in files if file.type == target_type), None)
+
+
+def get_month_range(year: int, month: int) -> tuple[datetime, datetime]:
+    """Начало месяца и начало следующего: диапазон [start, end)."""
+    start = datetime(year=year, month=month, day=1)
+    end = datetime(year=year + 1, month=1, day=1) if month == 12 else datetime(year=year, month=month + 1, day=1)
+    return start, end
+
+
+def render_leaderboard(entries: Sequence[LeaderboardEntry]) -> str:
+    """Текст сообщения с таблицей квалификации."""
+    rows = "\n".join(LEADERBOARD_ROW_TEMPLATE.format(**entry.model_dump()) for entry in entries)
+    return LEADERBOARD_TEMPLATE.format(
+        rows=rows or "Пока нет ни одной оценки...",
+        updated_at=datetime.now().strftime("%H:%M:%S")
+    )
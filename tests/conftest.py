@@ -0,0 +1,20 @@
+import os
+
+# Settings читаются при импорте src.drift_bot.ioc, а .env в репозитории нет:
+# тестам нужны только значения, проходящие валидацию (соединения подменяются в самих тестах)
+TEST_ENV = {
+    "BOT_TOKEN": "123456:test",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_DB": "drift_bot",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "S3_URL": "http://localhost:9000",
+    "S3_USER": "minio",
+    "S3_PASSWORD": "minio"
+}
+
+for name, value in TEST_ENV.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from src.drift_bot.core.domain import Bracket, Heat, VotingJudge
+from src.drift_bot.core.dto import LeaderboardEntry
+from src.drift_bot.core.exceptions import BracketError
+from src.drift_bot.core.services import BracketEngine, BracketService, seed_order, UNDECIDED, BYE
+from src.drift_bot.infrastructure.bracket import RedisBracketRepository
+
+STAGE_ID = 1
+JUDGES = 3
+
+
+def numbers(count: int) -> list[int]:
+    """Номера пилотов в порядке мест квалификации: у пилота с местом n номер 100 + n."""
+    return [100 + place for place in range(1, count + 1)]
+
+
+def vote(bracket: Bracket, node: int, *decisions: int | str):
+    heat = BracketEngine.heat(bracket, node)
+    result = None
+    for judge_id, decision in enumerate(decisions, start=1):
+        result = BracketEngine.vote(
+            bracket,
+            VotingJudge(stage_id=STAGE_ID, judge_id=judge_id, heat=heat, decision=decision),
+            JUDGES
+        )
+    return result
+
+
+def test_seed_order_meets_strongest_pilots_last() -> None:
+    assert seed_order(16) == [1, 16, 8, 9, 4, 13, 5, 12, 2, 15, 7, 10, 3, 14, 6, 11]
+    for size in (16, 32):
+        order = seed_order(size)
+        assert sorted(order) == list(range(1, size + 1))
+        # В каждом заезде первого раунда сумма мест одинакова: первый против последнего и т.д.
+        assert {order[i] + order[i + 1] for i in range(0, size, 2)} == {size + 1}
+
+
+def test_seed_places_pilots_by_qualification() -> None:
+    bracket = BracketEngine.seed(STAGE_ID, numbers(16), 16)
+    assert bracket.winners[16:] == [100 + seed for seed in seed_order(16)]
+    assert bracket.winners[1:16] == [UNDECIDED] * 15
+    assert BracketEngine.heat(bracket, 8) == Heat(stage_id=STAGE_ID, first_pilot_number=101, second_pilot_number=116)
+    assert BracketEngine.ready_nodes(bracket) == list(range(8, 16))
+
+
+def test_seed_rejects_unsupported_size() -> None:
+    with pytest.raises(ValueError):
+        BracketEngine.seed(STAGE_ID, numbers(8), 8)
+
+
+def test_byes_advance_top_pilots() -> None:
+    bracket = BracketEngine.seed(STAGE_ID, numbers(12), 16)
+    assert bracket.winners[16:].count(BYE) == 4
+    # Места 1-4 без соперника сразу проходят во второй раунд
+    advanced = {node: bracket.winners[node] for node in range(8, 16) if bracket.winners[node] != UNDECIDED}
+    assert sorted(advanced.values()) == [101, 102, 103, 104]
+    ready = BracketEngine.ready_nodes(bracket)
+    assert len(ready) == 4
+    assert all(bracket.winners[2 * node] > 0 and bracket.winners[2 * node + 1] > 0 for node in ready)
+
+
+def test_majority_decides_heat() -> None:
+    bracket = BracketEngine.seed(STAGE_ID, numbers(16), 16)
+    assert vote(bracket, 8, 101).votes == 1
+    result = vote(bracket, 8, 101, 116, 101)
+    assert result.winner == 101
+    assert not result.omt
+    assert bracket.winners[8] == 101
+    assert 8 not in bracket.votes
+
+
+def test_omt_majority_starts_rerun() -> None:
+    bracket = BracketEngine.seed(STAGE_ID, numbers(16), 16)
+    result = vote(bracket, 8, "OMT", 101, "OMT")
+    assert result.omt
+    assert result.winner is None
+    assert bracket.winners[8] == UNDECIDED
+    assert bracket.reruns == {8: 1}
+    # Голосование начинается заново
+    assert 8 not in bracket.votes
+    assert 8 in BracketEngine.ready_nodes(bracket)
+
+
+def test_split_vote_starts_rerun() -> None:
+    bracket = BracketEngine.seed(STAGE_ID, numbers(16), 16)
+    result = vote(bracket, 8, 101, 116, "OMT")
+    assert result.omt
+    assert bracket.winners[8] == UNDECIDED
+    assert bracket.reruns == {8: 1}
+
+
+def test_vote_for_pilot_outside_heat_is_rejected() -> None:
+    bracket = BracketEngine.seed(STAGE_ID, numbers(16), 16)
+    with pytest.raises(BracketError):
+        vote(bracket, 8, 102)
+
+
+def test_winners_advance_to_final() -> None:
+    bracket = BracketEngine.seed(STAGE_ID, numbers(16), 16)
+    vote(bracket, 8, 101, 101, 101)
+    assert 4 not in BracketEngine.ready_nodes(bracket)
+    vote(bracket, 9, 109, 109, 108)
+    assert BracketEngine.heat(bracket, 4) == Heat(stage_id=STAGE_ID, first_pilot_number=101, second_pilot_number=109)
+    # Сильнейший по квалификации проходит каждый заезд
+    while bracket.champion is None:
+        node = BracketEngine.ready_nodes(bracket)[0]
+        heat = BracketEngine.heat(bracket, node)
+        favourite = min(heat.first_pilot_number, heat.second_pilot_number)
+        vote(bracket, node, favourite, favourite, favourite)
+    assert bracket.champion == 101
+    assert BracketEngine.ready_nodes(bracket) == []
+
+
+class FakeQualificationService:
+    async def get_leaderboard(self, stage_id: int, limit: int) -> list[LeaderboardEntry]:
+        return [
+            LeaderboardEntry(place=place, pilot_number=number, best_points=100 - place, second_points=0)
+            for place, number in enumerate(numbers(limit), start=1)
+        ]
+
+
+async def seed_twice() -> Bracket:
+    repository = RedisBracketRepository(FakeRedis())
+    service = BracketService(repository, FakeQualificationService(), JUDGES)
+    await service.create(STAGE_ID, 16)
+    heat = (await service.get_heats(STAGE_ID))[0]
+    await service.vote(VotingJudge(stage_id=STAGE_ID, judge_id=1, heat=heat, decision=heat.first_pilot_number))
+    with pytest.raises(BracketError):
+        await service.create(STAGE_ID, 16)
+    return await repository.get(STAGE_ID)
+
+
+def test_reseeding_keeps_bracket_in_progress() -> None:
+    bracket = asyncio.run(seed_twice())
+    assert bracket.votes == {8: {1: 101}}
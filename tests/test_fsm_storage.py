@@ -0,0 +1,73 @@
+import asyncio
+import inspect
+from datetime import datetime
+
+from fakeredis.aioredis import FakeRedis
+from redis.asyncio import Redis
+from dishka import Provider, Scope, provide, make_async_container
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import BaseStorage, StorageKey
+
+from src.drift_bot.ioc import AppProvider
+from src.drift_bot.settings import Settings
+from src.drift_bot.core.domain import Stage
+from src.drift_bot.bot.states import StageForm
+from src.drift_bot.bot.routers.admin.stage_form import enter_stage_date
+
+KEY = StorageKey(bot_id=1, chat_id=2, user_id=3)
+
+
+class FakeRedisProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_redis(self) -> Redis:
+        return FakeRedis()
+
+
+class FakeMessage:
+    def __init__(self) -> None:
+        self.answers: list[str] = []
+
+    async def answer(self, text: str, **kwargs) -> None:
+        self.answers.append(text)
+
+    async def answer_photo(self, photo: str, caption: str, **kwargs) -> None:
+        self.answers.append(caption)
+
+
+async def stage_form_round_trip() -> Stage:
+    container = make_async_container(AppProvider(), FakeRedisProvider(), context={Settings: Settings()})
+    try:
+        storage = await container.get(BaseStorage)
+        state = FSMContext(storage=storage, key=KEY)
+        await state.set_state(StageForm.date)
+        await state.update_data(
+            championship_id=1,
+            number=1,
+            title="Stage",
+            description="Description",
+            location="Location",
+            map_link="https://maps.example.com"
+        )
+        # Хендлер без декораторов проверки роли и прогресса формы
+        await inspect.unwrap(enter_stage_date)(FakeMessage(), state)
+
+        # Данные читаются заново из хранилища, как в следующем апдейте
+        data = await FSMContext(storage=storage, key=KEY).get_data()
+        return Stage(
+            championship_id=data["championship_id"],
+            number=data["number"],
+            title=data["title"],
+            description=data["description"],
+            location=data["location"],
+            map_link=data["map_link"],
+            date=data["date"]
+        )
+    finally:
+        await container.close()
+
+
+def test_stage_form_round_trip_through_redis_storage() -> None:
+    stage = asyncio.run(stage_form_round_trip())
+    assert isinstance(stage.date, datetime)
+    assert stage.title == "Stage"